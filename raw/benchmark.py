@@ -0,0 +1,501 @@
+import sys
+from argparse import ArgumentParser as argparse_ArgumentParser
+from datetime import datetime as datetime_datetime
+from datetime import timezone as datetime_timezone
+from json import dump as json_dump
+from json import load as json_load
+from pathlib import Path as pathlib_path
+from platform import platform as platform_platform
+from platform import python_version as platform_python_version
+from subprocess import run as subprocess_run
+from tempfile import TemporaryDirectory as tempfile_TemporaryDirectory
+from time import perf_counter as time_perf_counter
+import tracemalloc
+
+from resizer import BmpImage
+from resizer import ImageResizer
+from resizer import NumpyBackend
+
+try:
+    from resource import getrusage as resource_getrusage
+    from resource import RUSAGE_SELF as resource_RUSAGE_SELF
+except ImportError:  # Windows
+    resource_getrusage = None
+
+
+class SyntheticBmp:
+    """
+    Ölçüm (benchmark) için farklı boyut, bit derinliği ve satır yönünde
+    yapay BMP dosyaları üretir.
+
+    Methods:
+        build (bytearray): İstenilen özelliklerde bir BMP dosyasının
+        içeriğini oluşturur.
+    """
+    @staticmethod
+    def build(
+        width: int,
+        height: int,
+        *,
+        bit_depth: int,
+        top_down: bool = False
+    ) -> bytearray:
+        """
+        İstenilen özelliklerde bir BMP dosyasının içeriğini oluşturur.
+
+        Pikseller, sıkıştırılamayan ve satırdan satıra kayan bir desenle
+        doldurulur. 8 bit resimlere gri tonlamalı bir palet eklenir, 16 bit
+        resimler X1R5G5B5 (BI_RGB) biçimindedir.
+
+        Args:
+            width (int): Genişlik (piksel cinsinden).
+            height (int): Yükseklik (piksel cinsinden).
+            bit_depth (int): Bit derinliği (8, 16, 24, 32).
+            top_down (bool): Satırlar yukarıdan aşağıya sıralı olsun mu?
+
+        Returns:
+            bytearray: BMP dosyasının içeriği.
+        """
+        row_len = (width * bit_depth + 7) // 8
+        stride = ImageResizer._row_stride(width, bit_depth)
+        palette = b""
+        if bit_depth <= 8:
+            palette = b"".join(
+                bytes((i, i, i, 0)) for i in range(1 << bit_depth)
+            )
+
+        pattern = bytes(range(251)) * (row_len // 251 + 2)
+        padding = bytes(stride - row_len)
+        pixels = b"".join(
+            pattern[y % 251:y % 251 + row_len] + padding
+            for y in range(height)
+        )
+
+        pixel_offset = 14 + 40 + len(palette)
+        data = bytearray(b"BM")
+        data += (pixel_offset + len(pixels)).to_bytes(4, byteorder="little")
+        data += bytes(4)
+        data += pixel_offset.to_bytes(4, byteorder="little")
+        data += (40).to_bytes(4, byteorder="little")
+        data += width.to_bytes(4, byteorder="little")
+        data += (-height if top_down else height).to_bytes(
+            4, byteorder="little", signed=True
+        )
+        data += (1).to_bytes(2, byteorder="little")
+        data += bit_depth.to_bytes(2, byteorder="little")
+        data += bytes(4)  # BI_RGB
+        data += len(pixels).to_bytes(4, byteorder="little")
+        data += (2835).to_bytes(4, byteorder="little") * 2
+        data += bytes(8)
+        data += palette
+        data += pixels
+
+        return data
+
+
+class Benchmark:
+    """
+    'read_image', 'add_grid', 'resize_image', 'scale_image' ve 'save_image'
+    işlemlerini ayrı ayrı ölçer; sonuçları commit'ler arasında
+    karşılaştırılabilir bir JSON dosyasına yazar.
+
+    Methods:
+        _measure (tuple): Bir işlemi tekrarlayarak en iyi süreyi ve en
+        yüksek bellek kullanımını ölçen, özel metot.
+        run_case (list): Tek bir yapay resim için tüm aşamaları ölçer.
+        run (dict): Tüm boyut, bit derinliği ve yön kombinasyonlarını
+        ölçer.
+        compare (int): İki sonuç dosyasını karşılaştırıp gerilemeleri
+        (regression) yazdırır.
+        check_backends (int): Tüm işlemleri iki arka uçta çalıştırıp
+        çıktıların bayt bayt aynı olduğunu doğrular.
+        main (int): Komut satırı argümanlarını ayrıştırıp ölçümü başlatır.
+    """
+    @staticmethod
+    def _measure(function, *, repeat: int) -> tuple[float, int]:
+        """
+        Bir işlemi tekrarlayarak en iyi süreyi ve en yüksek bellek
+        kullanımını ölçen, özel metot.
+
+        Süre ölçümü 'tracemalloc' kapalıyken yapılır; bellek ölçümü için
+        işlem bir kez daha 'tracemalloc' açıkken çalıştırılır.
+
+        Returns:
+            tuple[float, int]: (en iyi süre (sn), en yüksek ek bellek
+            (bayt))
+        """
+        best = float("inf")
+        for _ in range(repeat):
+            start = time_perf_counter()
+            function()
+            best = min(best, time_perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return best, peak
+
+
+    @staticmethod
+    def run_case(
+        width: int,
+        height: int,
+        *,
+        bit_depth: int,
+        top_down: bool,
+        repeat: int,
+        work_dir: pathlib_path
+    ) -> list[dict]:
+        """
+        Tek bir yapay resim için tüm aşamaları ölçer. Resmin bit
+        derinliğinde desteklenmeyen aşamalar hata mesajıyla kaydedilir.
+
+        Returns:
+            list[dict]: Aşama başına ölçüm sonuçları.
+        """
+        case = (
+            f"{width}x{height}-{bit_depth}bit-"
+            f"{'topdown' if top_down else 'bottomup'}"
+        )
+        source = work_dir / f"{case}.bmp"
+        target = work_dir / f"{case}-out.bmp"
+        source.write_bytes(
+            SyntheticBmp.build(
+                width, height, bit_depth=bit_depth, top_down=top_down
+            )
+        )
+        data = ImageResizer.read_image(source)
+
+        stages = {
+            "read_image": lambda: ImageResizer.read_image(source),
+            "add_grid": lambda: ImageResizer.add_grid(
+                bytearray(data), grid_size="16", grid_color="red"
+            ),
+            "resize_image": lambda: ImageResizer.resize_image(
+                data,
+                new_width=str(width // 2),
+                new_height=str(height // 2),
+                startx=str(width // 4),
+                starty=str(height // 4)
+            ),
+            "scale_image": lambda: ImageResizer.scale_image(
+                data,
+                new_width=str(width // 2),
+                new_height=str(height // 2),
+                method="nearest" if bit_depth < 24 else "bilinear"
+            ),
+            "save_image": lambda: ImageResizer.save_image(target, data=data),
+        }
+
+        results = []
+        for stage, function in stages.items():
+            result = {
+                "case": case,
+                "stage": stage,
+                "width": width,
+                "height": height,
+                "bit_depth": bit_depth,
+                "top_down": top_down,
+            }
+            try:
+                seconds, peak = Benchmark._measure(function, repeat=repeat)
+            except (ValueError, TypeError, RuntimeError) as e:
+                result["error"] = str(e)
+            else:
+                result["seconds"] = seconds
+                result["mp_per_s"] = width * height / seconds / 1e6
+                result["peak_bytes"] = peak
+            results.append(result)
+
+        source.unlink()
+        target.unlink(missing_ok=True)
+
+        return results
+
+
+    @staticmethod
+    def run(
+        sizes: list[tuple[int, int]],
+        bit_depths: list[int],
+        *,
+        repeat: int
+    ) -> dict:
+        """
+        Tüm boyut, bit derinliği ve yön kombinasyonlarını ölçer.
+
+        Returns:
+            dict: Ortam bilgisi ('meta') ve ölçüm sonuçları ('results').
+        """
+        commit = subprocess_run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=pathlib_path(__file__).parent
+        ).stdout.strip()
+
+        results = []
+        with tempfile_TemporaryDirectory() as work_dir:
+            for width, height in sizes:
+                for bit_depth in bit_depths:
+                    for top_down in (False, True):
+                        results += Benchmark.run_case(
+                            width,
+                            height,
+                            bit_depth=bit_depth,
+                            top_down=top_down,
+                            repeat=repeat,
+                            work_dir=pathlib_path(work_dir)
+                        )
+
+        peak_rss = None
+        if resource_getrusage is not None:
+            peak_rss = resource_getrusage(resource_RUSAGE_SELF).ru_maxrss
+
+        return {
+            "meta": {
+                "commit": commit or None,
+                "timestamp": datetime_datetime.now(
+                    datetime_timezone.utc
+                ).isoformat(timespec="seconds"),
+                "python": platform_python_version(),
+                "backend": ImageResizer.backend.name,
+                "platform": platform_platform(),
+                "repeat": repeat,
+                "peak_rss_kb": peak_rss,
+            },
+            "results": results,
+        }
+
+
+    @staticmethod
+    def compare(
+        baseline: dict,
+        current: dict,
+        *,
+        tolerance: float
+    ) -> int:
+        """
+        İki sonuç dosyasını karşılaştırıp, süresi 'tolerance' oranından
+        fazla artan aşamaları gerileme (regression) olarak yazdırır.
+        Rapor 'stdout'a yazılabildiğinden, JSON çıktısını bozmamak için
+        karşılaştırma satırları 'stderr'e yazılır.
+
+        Returns:
+            int: Gerileme sayısı.
+        """
+        previous = {
+            (result["case"], result["stage"]): result
+            for result in baseline["results"]
+            if "seconds" in result
+        }
+
+        regressions = 0
+        for result in current["results"]:
+            old = previous.get((result["case"], result["stage"]))
+            if old is None or "seconds" not in result:
+                continue
+            ratio = result["seconds"] / old["seconds"]
+            if ratio > 1 + tolerance:
+                regressions += 1
+                print(
+                    f"(!) {result['case']} {result['stage']}: "
+                    f"{old['seconds'] * 1e3:.2f} ms -> "
+                    f"{result['seconds'] * 1e3:.2f} ms (x{ratio:.2f})",
+                    file=sys.stderr
+                )
+
+        print(f"{regressions} gerileme bulundu.", file=sys.stderr)
+
+        return regressions
+
+
+    @staticmethod
+    def check_backends(
+        sizes: list[tuple[int, int]],
+        bit_depths: list[int]
+    ) -> int:
+        """
+        Her boyut, bit derinliği ve yön için ızgara, kırpma, tüm ölçekleme
+        filtrelerini ve 90/270 derece döndürmeyi standart kütüphane ve NumPy
+        arka uçlarında çalıştırıp çıktıların bayt bayt aynı olduğunu
+        doğrular. Bir işlem iki arka uçta da hata veriyorsa hata mesajları
+        karşılaştırılır.
+        Farklılıklar 'stderr'e yazdırılır.
+
+        Returns:
+            int: Farklı çıktı veren işlem sayısı.
+        """
+        operations = []
+        for grid_size, grid_color in (("1", "red"), ("7", "white")):
+            operations.append((
+                f"add_grid:{grid_size},{grid_color}",
+                lambda data, grid_size=grid_size, grid_color=grid_color: (
+                    ImageResizer.add_grid(
+                        data,
+                        grid_size=grid_size,
+                        grid_color=grid_color
+                    )
+                )
+            ))
+        operations.append((
+            "resize_image",
+            lambda data: ImageResizer.resize_image(
+                data,
+                new_width=str(max(1, data.header.width // 2 + 1)),
+                new_height=str(max(1, data.header.height // 3)),
+                startx=str(data.header.width // 5),
+                starty=str(data.header.height // 7)
+            )
+        ))
+        for method in ("nearest", "bilinear", "box"):
+            for factor in (3, 0.5):
+                operations.append((
+                    f"scale_image:{method},x{factor}",
+                    lambda data, method=method, factor=factor: (
+                        ImageResizer.scale_image(
+                            data,
+                            new_width=str(
+                                max(1, int(data.header.width * factor))
+                            ),
+                            new_height=str(
+                                max(1, int(data.header.height * factor))
+                            ),
+                            method=method
+                        )
+                    )
+                ))
+        for angle in ("90", "270"):
+            operations.append((
+                f"rotate_image:{angle}",
+                lambda data, angle=angle: ImageResizer.rotate_image(
+                    data, angle=angle
+                )
+            ))
+
+        previous = ImageResizer.backend.name
+        mismatches = 0
+        try:
+            for width, height in sizes:
+                for bit_depth in bit_depths:
+                    for top_down in (False, True):
+                        case = (
+                            f"{width}x{height}-{bit_depth}bit-"
+                            f"{'topdown' if top_down else 'bottomup'}"
+                        )
+                        source = SyntheticBmp.build(
+                            width,
+                            height,
+                            bit_depth=bit_depth,
+                            top_down=top_down
+                        )
+                        for name, operation in operations:
+                            outputs = []
+                            for backend in ("python", "numpy"):
+                                ImageResizer.set_backend(backend)
+                                image = BmpImage.from_bytes(
+                                    bytearray(source)
+                                )
+                                try:
+                                    outputs.append(
+                                        bytes(operation(image).data)
+                                    )
+                                except (ValueError, TypeError) as e:
+                                    outputs.append(repr(e))
+                            if outputs[0] != outputs[1]:
+                                mismatches += 1
+                                print(
+                                    f"(!) {case} {name}: arka uçların "
+                                    "çıktıları farklı.",
+                                    file=sys.stderr
+                                )
+        finally:
+            ImageResizer.set_backend(previous)
+
+        print(f"{mismatches} farklılık bulundu.", file=sys.stderr)
+
+        return mismatches
+
+
+    @staticmethod
+    def main(argv: list[str]) -> int:
+        """
+        Komut satırı argümanlarını ayrıştırıp ölçümü başlatır.
+
+        Returns:
+            int: Çıkış kodu (karşılaştırmada gerileme varsa 1).
+        """
+        parser = argparse_ArgumentParser(
+            description="ImageResizer işlemlerinin hızını ve bellek "
+            "kullanımını ölçer."
+        )
+        parser.add_argument(
+            "--sizes",
+            default="320x240,1281x721",
+            help="Virgülle ayrılmış boyutlar (örnek: 320x240,1281x721)."
+        )
+        parser.add_argument(
+            "--depths",
+            default="8,16,24,32",
+            help="Virgülle ayrılmış bit derinlikleri."
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Tekrar sayısı."
+        )
+        parser.add_argument(
+            "-o", "--output", default=None, help="Sonuç JSON dosyası."
+        )
+        parser.add_argument(
+            "--compare",
+            default=None,
+            help="Karşılaştırılacak önceki sonuç JSON dosyası."
+        )
+        parser.add_argument(
+            "--check-backends",
+            action="store_true",
+            help="Ölçüm yerine tüm işlemlerin standart kütüphane ve NumPy "
+            "arka uçlarında aynı çıktıyı verdiğini doğrular."
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="Gerileme sayılacak süre artışı oranı (varsayılan=0.2)."
+        )
+        args = parser.parse_args(argv)
+
+        sizes = [
+            tuple(int(value) for value in size.lower().split("x"))
+            for size in args.sizes.split(",")
+        ]
+        bit_depths = [int(depth) for depth in args.depths.split(",")]
+
+        if args.check_backends:
+            if not NumpyBackend.available():
+                print("(!) Karşılaştırma için NumPy yüklü olmalıdır.")
+                return 2
+            return 1 if Benchmark.check_backends(sizes, bit_depths) else 0
+
+        report = Benchmark.run(sizes, bit_depths, repeat=args.repeat)
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json_dump(report, file, indent=2)
+        else:
+            json_dump(report, sys.stdout, indent=2)
+            print()
+
+        if args.compare:
+            with open(args.compare, "r", encoding="utf-8") as file:
+                baseline = json_load(file)
+            if Benchmark.compare(baseline, report, tolerance=args.tolerance):
+                return 1
+
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Benchmark.main(sys.argv[1:]))
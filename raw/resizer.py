@@ -1,10 +1,375 @@
 import sys
+from argparse import ArgumentParser as argparse_ArgumentParser
+from argparse import Namespace as argparse_Namespace
+from array import array as array_array
+from asyncio import create_task as asyncio_create_task
+from asyncio import Event as asyncio_Event
+from asyncio import gather as asyncio_gather
+from asyncio import get_running_loop as asyncio_get_running_loop
+from asyncio import IncompleteReadError as asyncio_IncompleteReadError
+from asyncio import run as asyncio_run
+from asyncio import start_server as asyncio_start_server
+from collections import Counter as collections_Counter
+from collections import deque as collections_deque
+from concurrent.futures import ProcessPoolExecutor as futures_ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor as futures_ThreadPoolExecutor
+from contextlib import nullcontext as contextlib_nullcontext
+from functools import wraps as functools_wraps
+from glob import glob as glob_glob
+from hashlib import sha256 as hashlib_sha256
+from json import dumps as json_dumps
+from json import loads as json_loads
+from math import gcd as math_gcd
+from mmap import mmap as mmap_mmap
+from mmap import ACCESS_COPY as mmap_ACCESS_COPY
+from multiprocessing import freeze_support as multiprocessing_freeze_support
+from multiprocessing.shared_memory import (
+    SharedMemory as shared_memory_SharedMemory
+)
+from operator import itemgetter as operator_itemgetter
+from operator import mul as operator_mul
 from os import path as os_path
 from os import access as os_access
+from os import close as os_close
+from os import cpu_count as os_cpu_count
+from os import environ as os_environ
+from os import fstat as os_fstat
+from os import fsync as os_fsync
+from os import getpid as os_getpid
+from os import open as os_open
+from os import O_RDONLY as os_O_RDONLY
 from os import R_OK as os_R_OK
+from os import replace as os_replace
+from os import scandir as os_scandir
+from os import stat as os_stat
+from os import utime as os_utime
 from pathlib import Path as pathlib_path
+from queue import Empty as queue_Empty
+from queue import Full as queue_Full
+from queue import Queue as queue_Queue
+from re import compile as re_compile
+from re import DOTALL as re_DOTALL
+from shutil import rmtree as shutil_rmtree
+from socket import create_connection as socket_create_connection
+from socket import socket as socket_socket
+from socket import SOCK_STREAM as socket_SOCK_STREAM
+from sqlite3 import connect as sqlite3_connect
+from sqlite3 import Connection as sqlite3_Connection
+from sqlite3 import Error as sqlite3_Error
+from threading import Event as threading_Event
+from time import perf_counter as time_perf_counter
 from time import sleep as time_sleep
+from time import time as time_time
 from typing import Literal
+from zlib import adler32 as zlib_adler32
+from zlib import compressobj as zlib_compressobj
+from zlib import crc32 as zlib_crc32
+from zlib import DEFLATED as zlib_DEFLATED
+from zlib import Z_SYNC_FLUSH as zlib_Z_SYNC_FLUSH
+import tracemalloc
+
+try:
+    from asyncio import start_unix_server as asyncio_start_unix_server
+    from socket import AF_UNIX as socket_AF_UNIX
+except ImportError:  # Windows; yalnızca TCP portu kullanılabilir.
+    asyncio_start_unix_server = None
+    socket_AF_UNIX = None
+
+try:
+    from os import writev as os_writev
+except ImportError:  # Windows; parçalar sırayla yazılır.
+    os_writev = None
+
+try:
+    from os import sync as os_sync
+except ImportError:  # Windows; dosyalar tek tek diske işlenir.
+    os_sync = None
+
+try:
+    import numpy
+except ImportError:  # İsteğe bağlı; standart kütüphane arka ucu kullanılır.
+    numpy = None
+
+
+class MetricsStage:
+    """
+    Ölçülen tek bir aşamanın (stage) süresini, sayaçlarını ve bellek
+    kullanımını tutar. 'Metrics.stage' tarafından oluşturulur ve bir
+    bağlam yöneticisi (context manager) olarak kullanılır.
+
+    Methods:
+        add (None): Aşamaya sayaç veya bilgi alanları ekler. Sayısal
+        alanlar birikerek toplanır.
+    """
+    __slots__ = ("name", "fields", "start", "memory_start", "memory_peak")
+
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.fields = {}
+        self.start = 0.0
+        self.memory_start = 0
+        self.memory_peak = 0
+
+
+    def add(self, **fields) -> None:
+        """
+        Aşamaya sayaç (bytes_read, bytes_written, pixels, ...) veya bilgi
+        alanları ekler. Sayısal alanlar birikerek toplanır.
+        """
+        for key, value in fields.items():
+            if isinstance(value, int) and key in self.fields:
+                self.fields[key] += value
+            else:
+                self.fields[key] = value
+
+
+    def __enter__(self) -> "MetricsStage":
+        if Metrics._track_memory:
+            self.memory_start = tracemalloc.get_traced_memory()[0]
+            # İç içe aşamalarda dış aşamanın tepe değeri kaybolmasın diye
+            # sıfırlamadan önceki tepe değer dış aşamaya aktarılır.
+            if Metrics._stack:
+                parent = Metrics._stack[-1]
+                parent.memory_peak = max(
+                    parent.memory_peak, tracemalloc.get_traced_memory()[1]
+                )
+            tracemalloc.reset_peak()
+        Metrics._stack.append(self)
+        self.start = time_perf_counter()
+
+        return self
+
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        seconds = time_perf_counter() - self.start
+        # Aşamalar farklı iş parçacıklarında iç içe geçebildiğinden
+        # (örneğin 'ImageResizer.save_pyramid') son eleman değil, aşamanın
+        # kendisi çıkarılır.
+        Metrics._stack.remove(self)
+
+        record = {
+            "ts": round(time_time(), 6),
+            "pid": os_getpid(),
+            "stage": self.name,
+            "seconds": round(seconds, 9),
+            "ok": exc_type is None,
+        }
+        record.update(self.fields)
+        if Metrics._track_memory:
+            peak = max(self.memory_peak, tracemalloc.get_traced_memory()[1])
+            record["peak_alloc"] = peak - self.memory_start
+            if Metrics._stack:
+                parent = Metrics._stack[-1]
+                parent.memory_peak = max(parent.memory_peak, peak)
+
+        Metrics._emit(record)
+
+
+class _NullStage:
+    """
+    Ölçüm kapalıyken kullanılan ve hiçbir şey yapmayan aşama nesnesi.
+    Tek bir örneği paylaşılır; böylece kapalı ölçümün maliyeti bir
+    öznitelik okuması kadardır.
+    """
+    __slots__ = ()
+
+
+    def add(self, **fields) -> None:
+        pass
+
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        pass
+
+
+class Metrics:
+    """
+    İşlemlerin aşama aşama (dosya yolu okuma, görüntü okuma, dönüşüm,
+    kaydetme) ölçülmesi için isteğe bağlı (opt-in) bir ölçüm katmanı
+    sağlar. Her aşama için süre, okunan/yazılan bayt, işlenen piksel ve
+    (istenirse) en yüksek bellek ayırma miktarı kaydedilir ve her kayıt
+    bir JSON satırı olarak 'stderr'e veya bir JSONL dosyasına yazılır.
+
+    Ölçüm, 'RESIZER_METRICS' ortam değişkeni ('stderr' veya bir dosya
+    yolu) veya toplu işlem modundaki '--metrics' argümanı ile açılır.
+    Bellek ölçümü 'tracemalloc' gerektirdiğinden ve süreleri
+    etkileyebildiğinden ayrıca 'RESIZER_METRICS_MEMORY=1' veya
+    '--metrics-memory' ile açılır. Ölçüm kapalıyken maliyet, bir bayrak
+    kontrolünden ibarettir.
+
+    Methods:
+        configure (None): Ölçümü açar veya kapatır.
+        stage (MetricsStage | _NullStage): Bir aşamayı ölçen bağlam
+        yöneticisini döndürür.
+        measure (Callable): Bir fonksiyonu aşama olarak ölçen dekoratörü
+        döndürür.
+        _emit (None): Bir ölçüm kaydını hedefe yazan, özel metot.
+        summarize (dict): Bir JSONL dosyasındaki kayıtları aşama bazında
+        toplar.
+    """
+    _enabled = False
+    _target = None
+    _file = None
+    _track_memory = False
+    _stack = []
+    _NULL_STAGE = _NullStage()
+
+
+    @staticmethod
+    def configure(target: str | None, *, track_memory: bool = False) -> None:
+        """
+        Ölçümü açar veya kapatır.
+
+        Args:
+            target (str | None): 'stderr', bir JSONL dosya yolu veya ölçümü
+            kapatmak için None / boş metin.
+            track_memory (bool): Aşama başına en yüksek bellek ayırma
+            miktarı ölçülsün mü?
+        """
+        if Metrics._file is not None:
+            Metrics._file.close()
+            Metrics._file = None
+
+        Metrics._target = target or None
+        Metrics._enabled = Metrics._target is not None
+        Metrics._track_memory = Metrics._enabled and track_memory
+        if Metrics._track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+    @staticmethod
+    def stage(name: str) -> MetricsStage | _NullStage:
+        """
+        Bir aşamayı ölçen bağlam yöneticisini döndürür.
+
+        Örnek:
+            with Metrics.stage("read_image") as stage:
+                data = ...
+                stage.add(bytes_read=len(data))
+
+        Returns:
+            MetricsStage | _NullStage: Ölçüm kapalıysa hiçbir şey yapmayan
+            paylaşılan nesne.
+        """
+        if not Metrics._enabled:
+            return Metrics._NULL_STAGE
+        return MetricsStage(name)
+
+
+    @staticmethod
+    def measure(name: str, counters=None):
+        """
+        Bir fonksiyonu aşama olarak ölçen dekoratörü döndürür.
+
+        Args:
+            name (str): Aşamanın adı.
+            counters (Callable | None): Fonksiyonun sonucundan sayaçları
+            ('dict') üreten fonksiyon. Yalnızca ölçüm açıkken çağrılır.
+
+        Returns:
+            Callable: Dekoratör.
+        """
+        def decorator(function):
+            @functools_wraps(function)
+            def wrapper(*args, **kwargs):
+                if not Metrics._enabled:
+                    return function(*args, **kwargs)
+
+                with MetricsStage(name) as stage:
+                    result = function(*args, **kwargs)
+                    if counters is not None:
+                        stage.add(**counters(result))
+
+                return result
+
+            return wrapper
+
+        return decorator
+
+
+    @staticmethod
+    def _emit(record: dict) -> None:
+        """
+        Bir ölçüm kaydını, tek satırlık JSON olarak hedefe yazan, özel
+        metot. Ölçüm hatası asıl işlemi durdurmaz.
+        """
+        line = json_dumps(record, ensure_ascii=False) + "\n"
+        try:
+            if Metrics._target == "stderr":
+                sys.stderr.write(line)
+                return
+            if Metrics._file is None:
+                # Ekleme kipinde, birden fazla süreç aynı dosyaya satır
+                # satır yazabilir.
+                Metrics._file = open(
+                    Metrics._target, "a", encoding="utf-8", buffering=1
+                )
+            Metrics._file.write(line)
+        except OSError:
+            pass
+
+
+    @staticmethod
+    def summarize(file_path: pathlib_path) -> dict:
+        """
+        Bir JSONL dosyasındaki kayıtları aşama bazında toplar.
+
+        Returns:
+            dict: Aşama adına göre kayıt sayısı, toplam/ortalama/en uzun
+            süre ve toplam sayaçlar.
+
+        Raises:
+            FileNotFoundError: Dosya belirtilen konumda yoksa.
+            RuntimeError: Beklenmeyen hatalar oluşmuşsa.
+        """
+        FileValidator.validate_file(file_path)  # FileNotFoundError
+
+        summary = {}
+        try:
+            with open(file_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    record = json_loads(line)
+                    stage = summary.setdefault(
+                        record["stage"],
+                        {"count": 0, "seconds": 0.0, "max_seconds": 0.0}
+                    )
+                    stage["count"] += 1
+                    stage["seconds"] += record["seconds"]
+                    stage["max_seconds"] = max(
+                        stage["max_seconds"], record["seconds"]
+                    )
+                    for key in (
+                        "bytes_read", "bytes_written", "pixels", "peak_alloc"
+                    ):
+                        if key in record:
+                            if key == "peak_alloc":
+                                stage[key] = max(
+                                    stage.get(key, 0), record[key]
+                                )
+                            else:
+                                stage[key] = stage.get(key, 0) + record[key]
+        except Exception as e:
+            raise RuntimeError(
+                f"Dosya okuma sırasında beklenmedik bir hata oluştu: {e}"
+            )
+
+        for stage in summary.values():
+            stage["mean_seconds"] = stage["seconds"] / stage["count"]
+
+        return summary
+
+
+Metrics.configure(
+    os_environ.get("RESIZER_METRICS"),
+    track_memory=os_environ.get("RESIZER_METRICS_MEMORY") == "1"
+)
 
 
 class FileValidator:
@@ -21,7 +386,17 @@ class FileValidator:
         Dosya, okuma izinlerine sahip değilse bir istisna fırlatır.
         validate_file_name (None): Bir dosya adının boş bir metin olup
         olmadığını kontrol eder. Boşsa bir istisna fırlatır.
+        validate_output_format (str): Bir çıktı dosyasının uzantısına göre
+        kaydedileceği biçimi belirler. Biçim desteklenmiyorsa bir istisna
+        fırlatır.
     """
+    # Kaydedilemeyen, ancak BMP içeriğiyle yanlışlıkla oluşturulabilecek
+    # resim uzantıları.
+    UNSUPPORTED_SUFFIXES = (
+        ".jpg", ".jpeg", ".ico", ".gif", ".tif", ".tiff", ".webp"
+    )
+
+
     @staticmethod
     def validate_path(file_path: pathlib_path) -> None:
         """
@@ -78,6 +453,31 @@ class FileValidator:
             )
 
 
+    @staticmethod
+    def validate_output_format(file_path: pathlib_path) -> str:
+        """
+        Bir çıktı dosyasının uzantısına göre kaydedileceği biçimi belirler.
+        '.png' uzantılı dosyalar PNG, diğerleri BMP olarak kaydedilir.
+
+        Returns:
+            str: 'png' veya 'bmp'.
+
+        Raises:
+            ValueError: Uzantı desteklenmeyen bir resim biçimiyse (örneğin
+            '.jpg', '.ico').
+        """
+        suffix = pathlib_path(file_path).suffix.lower()
+        if suffix == ".png":
+            return "png"
+        if suffix in FileValidator.UNSUPPORTED_SUFFIXES:
+            raise ValueError(
+                f"'{suffix}' biçiminde kaydetme desteklenmiyor; '.bmp' veya "
+                f"'.png' uzantısı kullanılmalı."
+            )
+
+        return "bmp"
+
+
 class FilePathManager:
     """
     Dosya yollarını oluşturmak, yönetmek ve saklamak gibi sıkça kullanılan 
@@ -181,6 +581,10 @@ class FilePathManager:
     
 
     @staticmethod
+    @Metrics.measure(
+        "read_f_path",
+        lambda result: {"bytes_read": len(result.encode("utf-8"))}
+    )
     def read_f_path(file_path: pathlib_path) -> str:
         """
         Belirtilen kayıt dosyasında saklanan yol bilgisini okur.
@@ -210,378 +614,9151 @@ class FilePathManager:
             )
   
 
-class ImageResizer:
+class AtomicWriter:
     """
-    'BMP' uzantılı bir dosyaya ızgara eklemek ve yeniden boyutlandırmak için
-    işlevler sağlar.
+    Bir dosyayı önce aynı klasördeki geçici bir dosyaya yazar; yazma
+    başarıyla biterse geçici dosyayı 'os.replace' ile hedefin üzerine
+    taşır. Yazma yarıda kesilirse (hata, çökme) hedef dosya değişmez ve
+    yarım yazılmış bir dosya oluşmaz. Geçici dosya taşınmadan önce, klasör
+    de taşındıktan sonra diske işlenir ('os.fsync'); böylece sistem
+    çöktükten sonra hedefte boş veya yarım bir dosya görünmez.
+
+    Yazılan parçalar kopyalanmadan biriktirilir ve 'os.writev' ile tek bir
+    sistem çağrısında diske yazılır ('os.writev' olmayan sistemlerde sırayla
+    yazılır). Böylece başlık ve piksel satırları, tek bir bitişik ara
+    bellekte birleştirilmeden yazılabilir.
+
+    Çok sayıda küçük dosya, bütün olarak taşınacak geçici bir klasöre
+    yazılıyorsa (örneğin 'save_slices') 'staged' verilir: dosya doğrudan
+    hedefe yazılır; geçici dosya, taşıma ve 'os.fsync' atlanır. Klasörün
+    taşınması ve dosyaların diske işlenmesi çağıran tarafa bırakılır.
+
+    Örnek:
+        with AtomicWriter(file_path) as writer:
+            writer.write(header)
+            writer.writelines(rows)
+
+    Attributes:
+        file_path (pathlib.Path): Hedef dosyanın yolu.
+        bytes_written (int): Yazılan toplam bayt sayısı.
+        staged (bool): Dosya, bütün olarak taşınacak geçici bir klasöre mi
+        yazılıyor?
 
     Methods:
-        _validate_byte_len (None): Mevcut bayt sayısı ile beklenen bayt 
-        sayısını karşılaştıran, özel metot. Bayt sayıları eşit değilse 
-        bir istisna fırlatır.
-        _split_bytes (int): Bit derinliğini baza alarak, piksel başına bayt
-        sayısını belirleyen, özel metot. Bit derinliği desteklenmiyorsa bir
-        istisna fırlatır.
-        _convert_to_int (int): Tanımlı renk adını, RGB formatında bir 
-        bytearray'e dönüştüren, özel metot. Renk tanımlı değilse bir istisna
-        fırlatır.
-        _convert_color_to_byte (bytearray): Tanımlı renk adını, RGB formatında
-        bir bytearray'e dönüştüren, özel metot. Renk tanımlı değilse bir 
-        istisna fırlatır.
+        write (None): Bir parçayı yazma kuyruğuna ekler.
+        writelines (None): Birden fazla parçayı yazma kuyruğuna ekler.
+        patch (None): Daha önce yazılmış baytların üzerine yazar.
+        _flush (None): Kuyruktaki parçaları diske yazan, özel metot.
+        _sync_dir (None): Bir klasördeki ad değişikliklerini diske işleyen,
+        özel metot.
+    """
+    # Kuyruk bu boyutu veya parça sayısını aşınca diske yazılır. Parça
+    # sayısı, 'os.writev' için sistemlerin izin verdiği en düşük sınırın
+    # (IOV_MAX) altında tutulur.
+    CHUNK_BYTES = 1 << 20
+    MAX_BUFFERS = 512
 
-        read_image (bytearray): Görüntüyü binary (ikili) olarak okur.
-        save_image (None): Görüntü dosyasının güncellenmiş binary içeriğin
-        belirtilen konuma kaydeder.
+    __slots__ = (
+        "file_path", "bytes_written", "staged", "_temp_path", "_file",
+        "_pending", "_pending_bytes"
+    )
 
-        add_grid (bytearray): Resme ızgara ekler.
-        resize_image (bytearray):  Resmi yeniden boyutlandırır.
-    """
-    @staticmethod
-    def _validate_byte_len(byte_len: int, excepted_len: int) -> None:
-        """
-        Mevcut bayt sayısı ile beklenen bayt sayısını karşılaştıran,
-        özel metot.
 
-        Raises:
-            ValueError: Mevcut bayt sayısı, beklenen bayt sayısına eşit
-            değilse.
-        """
-        if byte_len != excepted_len:
-            raise ValueError(
-                f"Piksel baytlarının sayısı ({byte_len}) "
-                f"beklenenden ({excepted_len}) farklı."
-                "\n(?) Bu hata genellikle bir iç işlem sorunudur ve "
-                "kullanıcı hatasından kaynaklanmaz."
-                "Eğer bir geliştirici değilseniz, lütfen bu sorun hakkında "
-                "proje geliştiricisi ile iletişime geçin. Daha fazla bilgi "
-                "ve destek için proje belgelerine göz atabilirsiniz."
+    def __init__(
+        self,
+        file_path: pathlib_path,
+        *,
+        staged: bool = False
+    ) -> None:
+        self.file_path = pathlib_path(file_path)
+        self.bytes_written = 0
+        self.staged = staged
+        self._temp_path = self.file_path
+        if not staged:
+            self._temp_path = self.file_path.with_name(
+                f".{self.file_path.name}.{os_getpid()}.tmp"
             )
+        self._file = None
+        self._pending = []
+        self._pending_bytes = 0
+
+
+    def __enter__(self) -> "AtomicWriter":
+        # 'os.writev' dosya tanımlayıcısına doğrudan yazar; Python'un ara
+        # belleği yalnızca sırayla yazarken kullanılır.
+        self._file = open(
+            self._temp_path, "wb", buffering=0 if os_writev else -1
+        )
+        return self
+
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        try:
+            if exc_type is None:
+                self._flush()
+                self._file.flush()
+                if not self.staged:
+                    os_fsync(self._file.fileno())
+            self._file.close()
+            if exc_type is None and not self.staged:
+                os_replace(self._temp_path, self.file_path)
+                AtomicWriter._sync_dir(self.file_path.parent)
+        except BaseException:
+            self._file.close()
+            self._temp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            self._pending.clear()
+
+        if exc_type is not None:
+            self._temp_path.unlink(missing_ok=True)
 
 
     @staticmethod
-    def _split_bytes(bit_depth: int) -> int:
+    def _sync_dir(directory: pathlib_path) -> None:
         """
-        Bit derinliğini baza alarak, piksel başına bayt sayısını belirleyen,
-        özel metot.
+        Bir klasördeki ad değişikliklerini (os.replace) diske işleyen, özel
+        metot. Klasörler Windows'ta açılamadığından orada atlanır.
+        """
+        try:
+            fd = os_open(directory, os_O_RDONLY)
+        except OSError:  # Windows
+            return
+        try:
+            os_fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os_close(fd)
 
-        Returns:
-            int: Piksel başına düşen bayt sayısı.
 
-        Raises:
-            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+    def write(self, buffer: bytes | bytearray | memoryview) -> None:
         """
-        if bit_depth == 32:
-            return 4  # bytes_per_pixel = 4 Byte
-        elif bit_depth == 24:
-            return 3
-        elif bit_depth == 16:
-            return 2
-        elif bit_depth == 8:
-            return 1
-        else:
-            raise ValueError(f"Desteklenmeyen bit derinliği: {bit_depth}")
+        Bir parçayı yazma kuyruğuna ekler. Parça kopyalanmaz; bu nedenle
+        dosya kapanana kadar değiştirilmemelidir.
+        """
+        buffer = memoryview(buffer).cast("B")
+        if not buffer:
+            return
 
+        self._pending.append(buffer)
+        self._pending_bytes += len(buffer)
+        if (
+            self._pending_bytes >= AtomicWriter.CHUNK_BYTES
+            or len(self._pending) >= AtomicWriter.MAX_BUFFERS
+        ):
+            self._flush()
 
-    @staticmethod
-    def _convert_to_int(number: str) -> int:
+
+    def writelines(self, buffers) -> None:
         """
-        Sayısal bir metin değerini 'int' bir değere dönüştüren, özel metot. 
+        Birden fazla parçayı sırasıyla yazma kuyruğuna ekler.
+        """
+        for buffer in buffers:
+            self.write(buffer)
 
-        Returns:
-            int: Dönüştürülen tamsayı değeri.
 
-        Raises:
-            TypeError: Girilen değer 'str' türünde değilse.
-            ValueError: Girilen metin sayısal bir değer içermiyorsa.
+    def patch(self, offset: int, buffer: bytes | bytearray) -> None:
         """
-        try:
-            return int(number)
-        except (TypeError, ValueError):
-            raise TypeError (
-                f"'{number}' bir tamsayı değil."
-            )
+        Geçici dosyada daha önce yazılmış baytların üzerine yazar (örneğin
+        boyutu ancak yazma bitince belli olan bir başlığı güncellemek
+        için). Önce kuyruk diske yazılır; dosya uzunluğu değişmez.
 
-
-    @staticmethod
-    def _convert_color_to_byte(
-        color: Literal[
-            "white",
-            "black",
-            "red",
-            "green",
-            "blue",
-            "yellow",
-            "magenta",
-            "cyan"
-        ]
-    ) -> bytearray:
+        Raises:
+            ValueError: Henüz yazılmamış bir bölgenin üzerine yazılmak
+            istenirse.
+            OSError: Dosyaya yazılamıyorsa.
         """
-        Tanımlı renk adını, RGB formatında bir 'bytearray''e dönüştüren,
-        özel metot.
+        self._flush()
+        if offset + len(buffer) > self.bytes_written:
+            raise ValueError("Yazılmamış bir bölgenin üzerine yazılamaz.")
+        self._file.seek(offset)
+        self._file.write(buffer)
+        self._file.seek(0, 2)
 
-        Renkler şu şekilde dönüştürülür:
-        - color_name -> B\\G\\R\\
-        - "white" -> \\xFF\\xFF\\xFF
-        - "black" -> \\x00\\x00\\x00
-        - "red" -> \\x00\\x00\\xFF
-        - "green" -> \\x00\\xFF\\x00
-        - "blue" -> \\xFF\\x00\\x00
-        - "yellow" -> \\x00\\xFF\\xFF
-        - "magenta" -> \\xFF\\x00\\xFF
-        - "cyan" -> \\xFF\\xFF\\x00
 
-        Returns:
-            bytearray: Bayt dizisine dönüştürülmüş renk bilgisi.
+    def _flush(self) -> None:
+        """
+        Kuyruktaki parçaları diske yazan, özel metot. 'os.writev' parçaların
+        yalnızca bir kısmını yazabilir; kalan kısım tekrar yazılır.
 
         Raises:
-            ValueError: Tanımlanmamış bir renk girilmişse.
+            OSError: Dosyaya yazılamıyorsa.
         """
-        match color:
-            case "white":
-                return bytearray(b'\xFF\xFF\xFF')
-            case "black":
-                return bytearray(b'\x00\x00\x00')
-            case "red":
-                return bytearray(b'\x00\x00\xFF')
-            case "green":
-                return bytearray(b'\x00\xFF\x00')
-            case "blue":
-                return bytearray(b'\xFF\x00\x00')
-            case "yellow":
-                return bytearray(b'\x00\xFF\xFF')
-            case "magenta":
-                return bytearray(b'\xFF\x00\xFF')
-            case "cyan":
-                return bytearray(b'\xFF\xFF\x00')
-            case _:
-                raise ValueError(f"Desteklenmeyen bir renk: {color}")
+        pending = self._pending
+        if os_writev is None:
+            for buffer in pending:
+                self._file.write(buffer)
+        else:
+            fd = self._file.fileno()
+            while pending:
+                written = os_writev(fd, pending)
+                while written:
+                    if written < len(pending[0]):
+                        pending[0] = pending[0][written:]
+                        break
+                    written -= len(pending.pop(0))
+
+        self.bytes_written += self._pending_bytes
+        self._pending = []
+        self._pending_bytes = 0
+
+
+
+class BmpHeader:
+    """
+    BMP dosya başlığını ve DIB başlığını bir kez çözümleyerek alanlarını
+    saklar. Böylece işlemler başlığı ham konumlardan tekrar tekrar okumaz.
+
+    Desteklenen DIB başlıkları:
+    - BITMAPCOREHEADER (12 bayt)
+    - BITMAPINFOHEADER (40 bayt)
+    - BITMAPV2INFOHEADER / BITMAPV3INFOHEADER (52 / 56 bayt)
+    - OS/2 BITMAPINFOHEADER2 (64 bayt, ilk 40 baytı okunur)
+    - BITMAPV4HEADER (108 bayt)
+    - BITMAPV5HEADER (124 bayt)
+
+    Attributes:
+        file_size (int): Başlıkta yazan dosya boyutu.
+        pixel_offset (int): Piksel dizisinin dosya başına olan uzaklığı.
+        dib_size (int): DIB başlığının boyutu.
+        width (int): Resmin genişliği (piksel cinsinden).
+        height (int): Resmin yüksekliği (piksel cinsinden, her zaman
+        pozitif).
+        top_down (bool): Satırlar yukarıdan aşağıya sıralıysa (negatif
+        yükseklik) 'True'.
+        bit_depth (int): Piksel başına bit sayısı.
+        compression (int): Sıkıştırma türü (BI_RGB, BI_RLE8, ...).
+        image_size (int): Başlıkta yazan piksel dizisi boyutu.
+        colors_used (int): Paletteki renk sayısı (0 = varsayılan).
+        red_mask, green_mask, blue_mask, alpha_mask (int): Renk kanalı
+        maskeleri. BI_RGB için bit derinliğinin varsayılan maskeleri.
+        palette (tuple): Paletteki renkler (B, G, R) demetleri olarak.
+        stride (int): Bir piksel satırının dolgu dahil uzunluğu.
+
+    Methods:
+        from_bytes (BmpHeader): Bir dosya içeriğinin başlığını çözümler.
+        Başlık geçersiz veya desteklenmiyorsa bir istisna fırlatır.
+        resized (BmpHeader): Aynı biçimde, farklı boyutlarda bir resmin
+        başlığını oluşturur.
+        converted (BmpHeader): Aynı boyutlarda, farklı bit derinliğinde
+        bir resmin başlığını oluşturur.
+        pack_into (None): Boyuta bağlı başlık alanlarını ham içeriğe yazar.
+        to_bytes (bytearray): Başlığı piksel dizisinden önceki baytlara
+        dönüştürür.
+    """
+    BI_RGB = 0
+    BI_RLE8 = 1
+    BI_RLE4 = 2
+    BI_BITFIELDS = 3
+    BI_ALPHABITFIELDS = 6
+
+    __slots__ = (
+        "file_size",
+        "pixel_offset",
+        "dib_size",
+        "width",
+        "height",
+        "top_down",
+        "bit_depth",
+        "compression",
+        "image_size",
+        "colors_used",
+        "red_mask",
+        "green_mask",
+        "blue_mask",
+        "alpha_mask",
+        "palette",
+        "stride",
+    )
 
 
     @staticmethod
-    def read_image(file_path: pathlib_path) -> bytearray:
+    def from_bytes(data: bytearray) -> "BmpHeader":
         """
-        Görüntü dosyasını binary (ikili) olarak okur.
+        Bir dosya içeriğinin başlığını çözümler.
 
         Args:
-            file_path (pathlib.Path): Görüntü dosyasının bulunduğu dizin.
-        
+            data (bytearray): Görüntü dosyasının içeriği.
+
+        Returns:
+            BmpHeader: Çözümlenmiş başlık.
+
         Raises:
-            ValueError: Boş bir yol veya geçersiz bir değer girilmişse.
-            FileNotFoundError: Dosya belirtilen konumda yoksa.
-            PermissionError: Dosyanın okuma izinleri yoksa.
-            RuntimeError: Beklenmeyen hatalar oluşmuşsa.
-        """      
+            ValueError: İçerik bir BMP dosyası değilse.
+            ValueError: DIB başlığı desteklenmiyorsa.
+        """
+        if len(data) < 26 or data[0:2] != b"BM":
+            raise ValueError("Dosya geçerli bir BMP dosyası değil.")
+
+        header = BmpHeader()
+        # byteorder = little-endian
+        header.file_size = int.from_bytes(data[2:6], byteorder="little")
+        header.pixel_offset = int.from_bytes(data[10:14], byteorder="little")
+        header.dib_size = int.from_bytes(data[14:18], byteorder="little")
+
+        if header.dib_size == 12:
+            # BITMAPCOREHEADER: 16 bit boyutlar, sıkıştırma yok.
+            header.width = int.from_bytes(data[18:20], byteorder="little")
+            height = int.from_bytes(data[20:22], byteorder="little")
+            header.bit_depth = int.from_bytes(data[24:26], byteorder="little")
+            header.compression = BmpHeader.BI_RGB
+            header.image_size = 0
+            header.colors_used = 0
+            palette_entry = 3
+        elif header.dib_size in (40, 52, 56, 64, 108, 124):
+            if len(data) < 14 + header.dib_size:
+                raise ValueError("BMP başlığı eksik.")
+            header.width = int.from_bytes(
+                data[18:22], byteorder="little", signed=True
+            )
+            height = int.from_bytes(
+                data[22:26], byteorder="little", signed=True
+            )
+            header.bit_depth = int.from_bytes(data[28:30], byteorder="little")
+            header.compression = int.from_bytes(
+                data[30:34], byteorder="little"
+            )
+            header.image_size = int.from_bytes(data[34:38], byteorder="little")
+            header.colors_used = int.from_bytes(
+                data[46:50], byteorder="little"
+            )
+            palette_entry = 4
+        else:
+            raise ValueError(
+                f"Desteklenmeyen BMP başlık boyutu: {header.dib_size}"
+            )
+
+        if header.width <= 0 or height == 0:
+            raise ValueError(
+                f"Geçersiz resim boyutları: {header.width}x{height}"
+            )
+        header.top_down = height < 0
+        header.height = abs(height)
+
+        # Renk kanalı maskeleri. BITMAPINFOHEADER'da maskeler başlıktan
+        # hemen sonra gelir; V2 ve sonraki başlıklarda başlığın içindedir.
+        palette_offset = 14 + header.dib_size
+        masks = (0, 0, 0, 0)
+        if header.compression in (
+            BmpHeader.BI_BITFIELDS, BmpHeader.BI_ALPHABITFIELDS
+        ):
+            if header.dib_size == 40 or header.dib_size == 64:
+                mask_count = 3
+                if header.compression == BmpHeader.BI_ALPHABITFIELDS:
+                    mask_count = 4
+                mask_start = palette_offset
+                palette_offset += 4 * mask_count
+            else:
+                mask_count = 4 if header.dib_size >= 56 else 3
+                mask_start = 54
+            masks = tuple(
+                int.from_bytes(
+                    data[mask_start + 4 * i:mask_start + 4 * i + 4],
+                    byteorder="little"
+                )
+                for i in range(mask_count)
+            ) + (0,) * (4 - mask_count)
+        elif header.bit_depth == 16:
+            masks = (0x7C00, 0x03E0, 0x001F, 0)
+        elif header.bit_depth in (24, 32):
+            masks = (0x00FF0000, 0x0000FF00, 0x000000FF, 0)
+        (
+            header.red_mask,
+            header.green_mask,
+            header.blue_mask,
+            header.alpha_mask
+        ) = masks
+
+        # Palet yalnızca 8 bit ve altında zorunludur.
+        palette_count = header.colors_used
+        if not palette_count and header.bit_depth <= 8:
+            palette_count = 1 << header.bit_depth
+        palette_count = min(
+            palette_count,
+            max(0, (header.pixel_offset - palette_offset) // palette_entry)
+        )
+        header.palette = tuple(
+            tuple(data[start:start + 3])
+            for start in range(
+                palette_offset,
+                palette_offset + palette_count * palette_entry,
+                palette_entry
+            )
+        )
+
+        header.stride = ImageResizer._row_stride(
+            header.width, header.bit_depth
+        )
+
+        return header
+
+
+    def resized(self, width: int, height: int) -> "BmpHeader":
+        """
+        Aynı biçimde (bit derinliği, maskeler, palet, yön), farklı
+        boyutlarda bir resmin başlığını oluşturur.
+
+        Returns:
+            BmpHeader: Yeni boyutlara göre güncellenmiş başlık kopyası.
+        """
+        header = BmpHeader()
+        for name in BmpHeader.__slots__:
+            setattr(header, name, getattr(self, name))
+
+        header.width = width
+        header.height = height
+        header.stride = ImageResizer._row_stride(width, self.bit_depth)
+        header.image_size = header.stride * height
+        header.file_size = header.pixel_offset + header.image_size
+
+        return header
+
+
+    def converted(
+        self,
+        bit_depth: int,
+        *,
+        palette: tuple = (),
+        masks: tuple[int, int, int, int] = None
+    ) -> "BmpHeader":
+        """
+        Aynı boyutlarda ve yönde, farklı bit derinliğinde bir resmin
+        başlığını oluşturur. Yeni başlık BITMAPINFOHEADER (40 bayt)
+        biçimindedir; maskeler verilirse BI_BITFIELDS, verilmezse BI_RGB
+        olarak yazılır.
+
+        Args:
+            bit_depth (int): Yeni bit derinliği.
+            palette (tuple): Paletteki renkler (B, G, R) demetleri olarak.
+            masks (tuple[int, int, int, int]): (kırmızı, yeşil, mavi, alfa)
+            maskeleri. Alfa maskesi BITMAPINFOHEADER'da yazılmaz.
+
+        Returns:
+            BmpHeader: Yeni biçime göre güncellenmiş başlık kopyası.
+        """
+        header = self.resized(self.width, self.height)
+
+        header.dib_size = 40
+        header.bit_depth = bit_depth
+        header.palette = tuple(palette)
+        header.colors_used = len(header.palette)
+        if masks:
+            header.compression = BmpHeader.BI_BITFIELDS
+        else:
+            header.compression = BmpHeader.BI_RGB
+            masks = (0, 0, 0, 0)
+            if bit_depth in (24, 32):
+                masks = (0x00FF0000, 0x0000FF00, 0x000000FF, 0)
+        (
+            header.red_mask,
+            header.green_mask,
+            header.blue_mask,
+            header.alpha_mask
+        ) = masks
+
+        header.pixel_offset = (
+            14 + 40 + (12 if header.compression else 0)
+            + 4 * len(header.palette)
+        )
+        header.stride = ImageResizer._row_stride(header.width, bit_depth)
+        header.image_size = header.stride * header.height
+        header.file_size = header.pixel_offset + header.image_size
+
+        return header
+
+
+    def pack_into(self, data: bytearray) -> None:
+        """
+        Boyuta bağlı başlık alanlarını (dosya boyutu, genişlik, yükseklik,
+        piksel dizisi boyutu) ham içeriğe yazar.
+        """
+        data[2:6] = self.file_size.to_bytes(length=4, byteorder="little")
+
+        height = -self.height if self.top_down else self.height
+        if self.dib_size == 12:
+            data[18:20] = self.width.to_bytes(length=2, byteorder="little")
+            data[20:22] = height.to_bytes(length=2, byteorder="little")
+            return
+
+        data[18:22] = self.width.to_bytes(length=4, byteorder="little")
+        data[22:26] = height.to_bytes(
+            length=4, byteorder="little", signed=True
+        )
+        data[34:38] = self.image_size.to_bytes(length=4, byteorder="little")
+
+
+    def to_bytes(self) -> bytearray:
+        """
+        Başlığı, piksel dizisinden önceki baytlara (BITMAPINFOHEADER,
+        BI_BITFIELDS ise üç renk kanalı maskesi ve palet) dönüştürür.
+        Yalnızca 'converted' ile oluşturulan 40 baytlık başlıklar içindir.
+
+        Returns:
+            bytearray: 'pixel_offset' uzunluğunda baytlar.
+        """
+        data = bytearray(self.pixel_offset)
+        data[0:2] = b"BM"
+        data[10:14] = self.pixel_offset.to_bytes(length=4, byteorder="little")
+        data[14:18] = self.dib_size.to_bytes(length=4, byteorder="little")
+        data[26:28] = (1).to_bytes(length=2, byteorder="little")
+        data[28:30] = self.bit_depth.to_bytes(length=2, byteorder="little")
+        data[30:34] = self.compression.to_bytes(length=4, byteorder="little")
+        # 72 DPI (2835 piksel/metre)
+        data[38:46] = (2835).to_bytes(length=4, byteorder="little") * 2
+        data[46:50] = self.colors_used.to_bytes(length=4, byteorder="little")
+        self.pack_into(data)
+
+        offset = 54
+        if self.compression == BmpHeader.BI_BITFIELDS:
+            for mask in (self.red_mask, self.green_mask, self.blue_mask):
+                data[offset:offset + 4] = mask.to_bytes(
+                    length=4, byteorder="little"
+                )
+                offset += 4
+        for color in self.palette:
+            data[offset:offset + 3] = bytes(color)
+            offset += 4
+
+        return data
+
+
+class BmpImage:
+    """
+    Bir kez çözümlenmiş başlığı ve piksel satırlarına bir 'memoryview'
+    görünümünü birlikte tutar. İşlemler bu nesne üzerinden dosyayı tekrar
+    okumadan ve başlığı tekrar çözümlemeden zincirlenebilir.
+
+    Satır sıraları resmin sol alt köşesinden başlar (y = 0 en alt satır).
+    Yukarıdan aşağıya sıralı (top-down) dosyalarda bu sıra, dosyadaki
+    satır sırasına 'row_index' ile dönüştürülür.
+
+    Attributes:
+        data (bytearray | mmap.mmap): Görüntü dosyasının tam içeriği veya
+        dosyanın belleğe eşlenmiş (memory-mapped) görünümü.
+        header (BmpHeader): Çözümlenmiş başlık.
+        pixels (memoryview): Dolgu dahil piksel satırları.
+
+    Methods:
+        from_bytes (BmpImage): Bir dosya içeriğinden görüntü nesnesi
+        oluşturur.
+        _validate_header (None): Başlığın işlenebilir bir piksel dizisini
+        tarif ettiğini doğrulayan, özel metot.
+        blank_like (BmpImage): Aynı biçimde, farklı boyutlarda boş bir
+        görüntü oluşturur.
+        header_like (tuple): Aynı biçimde, farklı boyutlarda bir resmin
+        piksel dizisinden önceki baytlarını oluşturur.
+        header_for (tuple): Bir işlem hattının çıktı başlığı için piksel
+        dizisinden önceki baytları oluşturur.
+        row_index (int): Sol alt köşeye göre satır sırasını, dosyadaki
+        satır sırasına dönüştürür.
+        row (memoryview): Bir satırın dolgu hariç piksel baytlarını verir.
+    """
+    __slots__ = ("data", "header", "pixels")
+
+
+    def __init__(self, data: bytearray, header: BmpHeader) -> None:
+        self.data = data
+        self.header = header
+        self.pixels = memoryview(data)[
+            header.pixel_offset:
+            header.pixel_offset + header.stride * header.height
+        ]
+
+
+    @staticmethod
+    def from_bytes(data: bytearray) -> "BmpImage":
+        """
+        Bir dosya içeriğinden görüntü nesnesi oluşturur.
+
+        RLE ile sıkıştırılmış içerik, BI_RGB biçiminde yeni bir diziye
+        açılır ('RleCodec.decode').
+
+        Raises:
+            ValueError: İçerik bir BMP dosyası değilse veya başlık
+            desteklenmiyorsa.
+            ValueError: Sıkıştırılmış (JPEG, PNG) bir BMP girilmişse.
+            ValueError: Piksel verisi başlıkta belirtilenden kısaysa.
+        """
+        if RleCodec.is_compressed(data):
+            data = RleCodec.decode(data)  # ValueError
+        header = BmpHeader.from_bytes(data)  # ValueError
+        BmpImage._validate_header(header, len(data))  # ValueError
+
+        return BmpImage(data, header)
+
+
+    @staticmethod
+    def _validate_header(header: BmpHeader, data_len: int) -> None:
+        """
+        Başlığın işlenebilir bir piksel dizisini tarif ettiğini doğrulayan,
+        özel metot.
+
+        Raises:
+            ValueError: Sıkıştırılmış (RLE, JPEG, PNG) bir BMP girilmişse
+            (RLE içerik önce 'RleCodec.decode' ile açılmalıdır).
+            ValueError: Piksel verisi başlıkta belirtilenden kısaysa.
+        """
+        if header.compression not in (
+            BmpHeader.BI_RGB,
+            BmpHeader.BI_BITFIELDS,
+            BmpHeader.BI_ALPHABITFIELDS
+        ):
+            raise ValueError(
+                f"Desteklenmeyen sıkıştırma türü: {header.compression}"
+            )
+        if header.pixel_offset + header.stride * header.height > data_len:
+            raise ValueError(
+                "Piksel verisi, başlıkta belirtilen boyutlardan kısa."
+            )
+
+
+    @staticmethod
+    def blank_like(image: "BmpImage", width: int, height: int) -> "BmpImage":
+        """
+        Aynı biçimde (başlık, palet, yön), farklı boyutlarda ve pikselleri
+        sıfırlanmış bir görüntü oluşturur.
+
+        Returns:
+            BmpImage: Yeni görüntü nesnesi.
+        """
+        prefix, header = BmpImage.header_like(image, width, height)
+
+        data = bytearray(header.file_size)
+        data[:header.pixel_offset] = prefix
+
+        return BmpImage(data, header)
+
+
+    @staticmethod
+    def header_like(
+        image: "BmpImage",
+        width: int,
+        height: int
+    ) -> tuple[bytearray, BmpHeader]:
+        """
+        Aynı biçimde, farklı boyutlarda bir resmin piksel dizisinden önceki
+        baytlarını (başlıklar ve palet) oluşturur. Satırları ayrı ayrı
+        yazılacak resimler için tam boyutlu bir ara bellek ayrılmaz.
+
+        Returns:
+            tuple[bytearray, BmpHeader]: (piksel dizisinden önceki baytlar,
+            yeni başlık)
+        """
+        header = image.header.resized(width, height)
+
+        prefix = bytearray(image.data[:header.pixel_offset])
+        header.pack_into(prefix)
+
+        # V5 başlığında piksel dizisinden sonra gelen renk profili yeni
+        # dosyaya taşınmaz; profil bilgisini sıfırla.
+        if header.dib_size == 124:
+            profile_start = 14 + int.from_bytes(
+                prefix[126:130], byteorder="little"
+            )
+            if profile_start >= header.pixel_offset:
+                prefix[126:134] = bytes(8)
+
+        return prefix, header
+
+
+    @staticmethod
+    def header_for(
+        image: "BmpImage",
+        header: BmpHeader
+    ) -> tuple[bytearray, BmpHeader]:
+        """
+        Bir işlem hattının çıktı başlığı için piksel dizisinden önceki
+        baytları oluşturur. Biçim (bit derinliği, sıkıştırma, maskeler,
+        palet) kaynakla aynıysa kaynağın başlıkları korunur
+        ('header_like'); bir dönüşüm aşaması biçimi değiştirdiyse başlık
+        yeniden yazılır ('BmpHeader.to_bytes'), çözünürlük kaynaktan
+        taşınır.
+
+        Returns:
+            tuple[bytearray, BmpHeader]: (piksel dizisinden önceki baytlar,
+            yeni başlık)
+        """
+        source = image.header
+        fields = (
+            "bit_depth",
+            "compression",
+            "red_mask",
+            "green_mask",
+            "blue_mask",
+            "alpha_mask",
+            "palette",
+        )
+        if all(
+            getattr(header, name) == getattr(source, name) for name in fields
+        ):
+            return BmpImage.header_like(image, header.width, header.height)
+
+        prefix = header.to_bytes()
+        if source.dib_size >= 40:
+            prefix[38:46] = image.data[38:46]
+
+        return prefix, header
+
+
+    def row_index(self, y: int) -> int:
+        """
+        Sol alt köşeye göre satır sırasını, dosyadaki satır sırasına
+        dönüştürür.
+        """
+        if self.header.top_down:
+            return self.header.height - 1 - y
+        return y
+
+
+    def row(self, y: int) -> memoryview:
+        """
+        Sol alt köşeye göre 'y' sırasındaki satırın dolgu hariç piksel
+        baytlarını verir.
+        """
+        start = self.row_index(y) * self.header.stride
+        return self.pixels[
+            start:start + (self.header.width * self.header.bit_depth + 7) // 8
+        ]
+
+
+class BandedImage:
+    """
+    Bir BMP dosyasının piksel dizisini belleğe almadan (ve belleğe
+    eşlemeden), bir bellek sınırına göre boyutlandırılmış yatay bantlar
+    halinde okur. Dosyanın tamamından büyük olmayan, sabit bir bellekle
+    çalışır; böylece bellekten büyük resimler de işlenebilir.
+
+    'BmpImage' ile aynı 'header', 'data' ve 'row' arayüzünü sağlar:
+    'data' yalnızca piksel dizisinden önceki baytları (başlıklar ve palet)
+    tutar. İşlem hattının aşamaları ('Pipeline.run_file') ve piramit
+    ('ImageResizer.save_pyramid') satırları 'row' ile istediğinden bu
+    nesneyle değişiklik yapılmadan çalışır. İstenen satır yüklü bantta
+    değilse, okuma yönünde yeni bir bant okunur. Her bant yeni bir diziye
+    okunur; yazma kuyruğunda ('AtomicWriter') bekleyen satırlar bu sayede
+    değişmez.
+
+    Örnek:
+        with BandedImage.open(file_path, max_memory=512 * 2**20) as image:
+            Pipeline.parse(spec).run_file(
+                file_path, output, image=image
+            )
+
+    Attributes:
+        data (bytearray): Piksel dizisinden önceki baytlar.
+        header (BmpHeader): Çözümlenmiş başlık.
+        band_rows (int): Bir bantta okunan satır sayısı.
+
+    Methods:
+        open (BandedImage): Dosyayı açıp başlığını çözümler.
+        parse_size (int): '512M', '4G' gibi bir boyut değerini bayta
+        dönüştürür.
+        row_index (int): Sol alt köşeye göre satır sırasını, dosyadaki
+        satır sırasına dönüştürür.
+        row (memoryview): Bir satırın dolgu hariç piksel baytlarını verir.
+        _load (None): Bir satırı içeren bandı dosyadan okuyan, özel metot.
+        close (None): Dosyayı kapatır.
+    """
+    # Bellek sınırının bir banda ayrılan payı. Aynı anda en fazla iki bant
+    # (yüklü bant ve yazma kuyruğunun hâlâ başvurduğu bant) bellekte
+    # bulunur; kalan pay aşamaların ara satırlarına ve yazma kuyruğuna
+    # bırakılır.
+    BAND_SHARE = 4
+    # Boyut değerlerindeki birimler (birimsiz değerler MB'dir).
+    UNITS = {"K": 2**10, "M": 2**20, "G": 2**30, "T": 2**40}
+
+    __slots__ = (
+        "data", "header", "band_rows", "_file", "_row_len", "_band",
+        "_band_start", "_band_end"
+    )
+
+
+    def __init__(
+        self,
+        file,
+        data: bytearray,
+        header: BmpHeader,
+        band_rows: int
+    ) -> None:
+        self.data = data
+        self.header = header
+        self.band_rows = band_rows
+        self._file = file
+        self._row_len = (header.width * header.bit_depth + 7) // 8
+        self._band = memoryview(b"")
+        self._band_start = 0
+        self._band_end = 0
+
+
+    def __enter__(self) -> "BandedImage":
+        return self
+
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+
+    @staticmethod
+    def open(file_path: pathlib_path, *, max_memory: int) -> "BandedImage":
+        """
+        Dosyayı açıp yalnızca piksel dizisinden önceki baytlarını okur ve
+        başlığı çözümler. Bant yüksekliği, bellek sınırının 'BAND_SHARE'
+        payına sığan satır sayısıdır.
+
+        Args:
+            file_path (pathlib.Path): Görüntü dosyasının bulunduğu dizin.
+            max_memory (int): Bellek sınırı (bayt).
+
+        Raises:
+            ValueError: Boş bir yol veya geçersiz bir değer girilmişse.
+            FileNotFoundError: Dosya belirtilen konumda yoksa.
+            PermissionError: Dosyanın okuma izinleri yoksa.
+            RuntimeError: Beklenmeyen hatalar oluşmuşsa.
+            ValueError: Dosya geçerli bir BMP dosyası değilse veya RLE ile
+            sıkıştırılmışsa.
+            ValueError: Bellek sınırı iki satırı bile okumaya yetmiyorsa.
+        """
         FileValidator.validate_path(file_path)  # ValueError
-        FileValidator.validate_path(file_path)  # FileNotFoundError
+        FileValidator.validate_file(file_path)  # FileNotFoundError
         FileValidator.validate_read_permission(file_path)  # PermissionError
 
         try:
-            with open(file_path, "rb") as file:
-                # İkili diziye çevir ve döndür.
-                return bytearray(file.read())  
-        except Exception as e:
-            raise RuntimeError(
-                f"Dosya okuma sırasında beklenmedik bir hata oluştu: {e}"
-            )
-    
+            file = open(file_path, "rb", buffering=0)
+        except Exception as e:
+            raise RuntimeError(
+                f"Dosya okuma sırasında beklenmedik bir hata oluştu: {e}"
+            )
+
+        try:
+            data = bytearray(file.read(14))
+            if len(data) < 14 or data[0:2] != b"BM":
+                raise ValueError("Dosya geçerli bir BMP dosyası değil.")
+            pixel_offset = int.from_bytes(data[10:14], byteorder="little")
+            data += file.read(max(0, pixel_offset - 14))
+
+            if RleCodec.is_compressed(data):
+                # Sıkıştırılmış satırların dosyadaki konumları, önceki
+                # satırlar çözülmeden bilinemez.
+                raise ValueError(
+                    "RLE ile sıkıştırılmış dosyalar bant bant okunamaz."
+                )
+            header = BmpHeader.from_bytes(data)  # ValueError
+            BmpImage._validate_header(
+                header, os_fstat(file.fileno()).st_size
+            )  # ValueError
+
+            band_rows = min(
+                header.height,
+                max_memory // BandedImage.BAND_SHARE // header.stride
+            )
+            if band_rows < min(header.height, 2):
+                raise ValueError(
+                    "Bellek sınırı bu resim için çok düşük; en az "
+                    f"{2 * BandedImage.BAND_SHARE * header.stride} bayt "
+                    "olmalıdır."
+                )
+        except BaseException:
+            file.close()
+            raise
+
+        return BandedImage(file, data, header, band_rows)
+
+
+    @staticmethod
+    def parse_size(value: str) -> int:
+        """
+        '512M', '4G' gibi bir boyut değerini bayta dönüştürür. Birim
+        verilmezse değer MB olarak alınır.
+
+        Raises:
+            TypeError: Sayısal bir değer girilmemişse.
+            ValueError: Değer pozitif değilse.
+        """
+        text = str(value).strip().upper().removesuffix("B")
+        unit = BandedImage.UNITS["M"]
+        if text[-1:] in BandedImage.UNITS:
+            unit = BandedImage.UNITS[text[-1]]
+            text = text[:-1]
+        try:
+            size = int(float(text) * unit)
+        except ValueError:
+            raise TypeError(f"'{value}' bir boyut değeri değil.")
+        if size <= 0:
+            raise ValueError(f"'{value}' değeri pozitif olmalıdır.")
+
+        return size
+
+
+    def row_index(self, y: int) -> int:
+        """
+        Sol alt köşeye göre satır sırasını, dosyadaki satır sırasına
+        dönüştürür.
+        """
+        if self.header.top_down:
+            return self.header.height - 1 - y
+        return y
+
+
+    def row(self, y: int) -> memoryview:
+        """
+        Sol alt köşeye göre 'y' sırasındaki satırın dolgu hariç piksel
+        baytlarını verir. Satır yüklü bantta değilse bant okunur.
+
+        Raises:
+            OSError: Dosya okunamıyorsa.
+        """
+        index = self.row_index(y)
+        if not self._band_start <= index < self._band_end:
+            self._load(index)
+
+        start = (index - self._band_start) * self.header.stride
+        return self._band[start:start + self._row_len]
+
+
+    def _load(self, index: int) -> None:
+        """
+        Dosyadaki 'index' sırasındaki satırı içeren bandı okuyan, özel
+        metot. Bant okuma yönünde uzanır; ölçekleme gibi komşu satırları
+        da isteyen aşamalar için geride bandın dörtte biri kadar satır
+        bırakılır.
+
+        Raises:
+            OSError: Dosya okunamıyorsa.
+        """
+        header = self.header
+        margin = self.band_rows // 4
+        if index >= self._band_end:
+            start = max(0, index - margin)
+        else:
+            start = max(0, index + 1 + margin - self.band_rows)
+        end = min(header.height, start + self.band_rows)
+
+        band = bytearray((end - start) * header.stride)
+        view = memoryview(band)
+        self._file.seek(header.pixel_offset + start * header.stride)
+        filled = 0
+        while filled < len(band):
+            count = self._file.readinto(view[filled:])
+            if not count:
+                raise OSError("Dosya beklenenden kısa.")
+            filled += count
+
+        self._band = view
+        self._band_start = start
+        self._band_end = end
+
+
+    def close(self) -> None:
+        """
+        Dosyayı kapatır.
+        """
+        self._file.close()
+        self._band = memoryview(b"")
+        self._band_start = self._band_end = 0
+
+
+
+class RleCodec:
+    """
+    BI_RLE8 ve BI_RLE4 ile sıkıştırılmış piksel dizilerini satır satır
+    çözer ve kodlar. Sıkıştırılmış resimler okunurken BI_RGB biçimine
+    açılır; böylece tüm işlemler sıkıştırılmamış satırlar üzerinde çalışır.
+    Kodlama isteğe bağlıdır ve yalnızca kaydederken yapılır.
+
+    Sıkıştırılmış dizi, (sayı, değer) çiftlerinden oluşur:
+    - sayı > 0 -> 'değer' (RLE4'te iki piksel dönüşümlü) 'sayı' kez
+    tekrarlanır (kodlanmış mod).
+    - 0, 0 -> Satır sonu. 0, 1 -> Resim sonu. 0, 2, dx, dy -> Konum
+    atlaması; atlanan pikseller 0. sıradaki renktir.
+    - 0, n (n >= 3) -> Ardından gelen n piksel olduğu gibi kopyalanır
+    (mutlak mod); veri 2 bayt sınırına tamamlanır.
+
+    Methods:
+        is_compressed (bool): İçeriğin RLE ile sıkıştırılmış bir BMP olup
+        olmadığını belirler.
+        can_encode (bool): Bir resmin RLE ile kodlanabilir olup olmadığını
+        belirler.
+        decode_rows (Iterator): Sıkıştırılmış piksel dizisini satır satır
+        palet sıralarına çözer.
+        decode (bytearray): Sıkıştırılmış bir dosya içeriğini BI_RGB
+        içeriğe dönüştürür.
+        _literal (bytes): Tekrarlanmayan pikselleri kodlayan, özel metot.
+        encode_row (bytes): Tek bir satırın palet sıralarını kodlar.
+        encode_rows (generator): Bir resmin tüm satırlarını kodlar.
+        compressed_prefix (tuple): Piksel dizisinden önceki baytları
+        sıkıştırılmış dizinin boyutuna göre günceller.
+    """
+    # En az bu kadar tekrarlanan pikseller kodlanmış modda yazılır.
+    MIN_RUN = 3
+    _RUN_PATTERN = re_compile(rb"(.)\1{%d,}" % (MIN_RUN - 1), re_DOTALL)
+    END_OF_LINE = b"\x00\x00"
+    END_OF_BITMAP = b"\x00\x01"
+
+
+    @staticmethod
+    def is_compressed(data: bytearray) -> bool:
+        """
+        İçeriğin RLE (BI_RLE8, BI_RLE4) ile sıkıştırılmış bir BMP olup
+        olmadığını, başlığın tamamını çözümlemeden belirler.
+        """
+        return (
+            len(data) >= 34
+            and data[0:2] == b"BM"
+            and int.from_bytes(data[14:18], byteorder="little") != 12
+            and int.from_bytes(data[30:34], byteorder="little") in (
+                BmpHeader.BI_RLE8, BmpHeader.BI_RLE4
+            )
+        )
+
+
+    @staticmethod
+    def can_encode(header: BmpHeader) -> bool:
+        """
+        Bir resmin RLE ile kodlanabilir olup olmadığını belirler. RLE
+        yalnızca 4 ve 8 bit, aşağıdan yukarıya sıralı ve en az 40 baytlık
+        başlığa sahip resimler için tanımlıdır.
+        """
+        return (
+            header.bit_depth in (4, 8)
+            and not header.top_down
+            and header.dib_size >= 40
+        )
+
+
+    @staticmethod
+    def decode_rows(data: bytearray, header: BmpHeader):
+        """
+        Sıkıştırılmış piksel dizisini baştan sona bir kez okuyarak satır
+        satır palet sıralarına çözer. Satırlar sol alt köşeden başlayarak
+        sırayla üretilir; resim sonu işaretinden sonraki veya dizi erken
+        biterse eksik kalan satırlar 0. sıradaki renktir.
+
+        Yields:
+            bytes: Piksel başına bir palet sırası içeren, 'width'
+            uzunluğunda satır.
+        """
+        width = header.width
+        height = header.height
+        rle4 = header.compression == BmpHeader.BI_RLE4
+        end = len(data)
+        if header.image_size:
+            end = min(end, header.pixel_offset + header.image_size)
+
+        def fitted(row: bytearray) -> bytes:
+            return bytes(row[:width]) + bytes(max(0, width - len(row)))
+
+        position = header.pixel_offset
+        row = bytearray()
+        y = 0
+        while y < height and position + 2 <= end:
+            count, value = data[position], data[position + 1]
+            position += 2
+            if count:
+                # Kodlanmış mod.
+                if rle4:
+                    row += (bytes((value >> 4, value & 0x0F)) * (
+                        (count + 1) // 2
+                    ))[:count]
+                else:
+                    row += bytes((value,)) * count
+            elif value == 0:
+                # Satır sonu.
+                yield fitted(row)
+                row = bytearray()
+                y += 1
+            elif value == 1:
+                # Resim sonu.
+                break
+            elif value == 2:
+                # Konum atlaması: (x, y) -> (x + dx, y + dy)
+                dx, dy = data[position:position + 2].ljust(2, b"\x00")
+                position += 2
+                x = len(row)
+                for _ in range(min(dy, height - y)):
+                    yield fitted(row)
+                    row = bytearray(x)
+                    y += 1
+                row += bytes(dx)
+            else:
+                # Mutlak mod; veri 2 bayt sınırına tamamlanmıştır.
+                byte_count = (value + 1) // 2 if rle4 else value
+                chunk = data[position:position + byte_count]
+                if rle4:
+                    chunk = ImageResizer._unpack_row(chunk, 4, value)
+                row += chunk
+                position += (byte_count + 1) & ~1
+
+        if y < height and row:
+            yield fitted(row)
+            y += 1
+        for _ in range(height - y):
+            yield bytes(width)
+
+
+    @staticmethod
+    def decode(data: bytearray) -> bytearray:
+        """
+        RLE ile sıkıştırılmış bir dosya içeriğini, aynı başlık ve paletle
+        BI_RGB içeriğe dönüştürür. Sıkıştırılmış dizi yalnızca bir kez,
+        baştan sona okunur.
+
+        Returns:
+            bytearray: Sıkıştırılmamış dosya içeriği.
+
+        Raises:
+            ValueError: İçerik bir BMP dosyası değilse veya başlık
+            desteklenmiyorsa.
+            ValueError: Sıkıştırma türü bit derinliğine uymuyorsa veya
+            resim yukarıdan aşağıya sıralıysa.
+        """
+        header = BmpHeader.from_bytes(data)  # ValueError
+        expected = {
+            BmpHeader.BI_RLE8: 8, BmpHeader.BI_RLE4: 4
+        }.get(header.compression)
+        if header.bit_depth != expected:
+            raise ValueError(
+                f"Sıkıştırma türü ({header.compression}) bit derinliğine "
+                f"({header.bit_depth}) uymuyor."
+            )
+        if header.top_down:
+            raise ValueError(
+                "RLE ile sıkıştırılmış bir resim yukarıdan aşağıya sıralı "
+                "olamaz."
+            )
+
+        prefix, new_header = BmpImage.header_like(
+            BmpImage(data, header), header.width, header.height
+        )
+        new_header.compression = BmpHeader.BI_RGB
+        prefix[30:34] = BmpHeader.BI_RGB.to_bytes(length=4, byteorder="little")
+
+        new_data = bytearray(new_header.file_size)
+        new_data[:new_header.pixel_offset] = prefix
+        image = BmpImage(new_data, new_header)
+        for y, row in enumerate(RleCodec.decode_rows(data, header)):
+            if header.bit_depth == 4:
+                row = ImageResizer._pack_row(row, 4)
+            image.row(y)[:] = row
+
+        return new_data
+
+
+    @staticmethod
+    def _literal(indexes: bytes, bit_depth: int) -> bytes:
+        """
+        Tekrarlanmayan pikselleri kodlayan, özel metot. 3 ve daha fazla
+        piksel mutlak modda, daha azı kodlanmış modda yazılır.
+
+        Returns:
+            bytes: Kodlanmış baytlar.
+        """
+        encoded = bytearray()
+        for start in range(0, len(indexes), 255):
+            chunk = indexes[start:start + 255]
+            if len(chunk) >= 3:
+                encoded += bytes((0, len(chunk)))
+                if bit_depth == 4:
+                    chunk = ImageResizer._pack_row(chunk, 4)
+                encoded += chunk
+                encoded += bytes(len(chunk) & 1)
+            elif bit_depth == 4:
+                # İki farklı piksel, dönüşümlü tek bir çift olarak yazılır.
+                encoded += bytes((len(chunk), chunk[0] << 4 | chunk[-1]))
+            else:
+                for index in chunk:
+                    encoded += bytes((1, index))
+
+        return bytes(encoded)
+
+
+    @staticmethod
+    def encode_row(indexes: bytes, bit_depth: int) -> bytes:
+        """
+        Tek bir satırın palet sıralarını kodlar. Tekrarlar düzenli ifade
+        ile C düzeyinde bulunur; Python düzeyinde yalnızca tekrar ve
+        tekrarsız parça başına işlem yapılır. Satır sonu işareti eklenmez.
+
+        Args:
+            indexes (bytes): Piksel başına bir palet sırası.
+            bit_depth (int): Bit derinliği (4, 8).
+
+        Returns:
+            bytes: Kodlanmış satır.
+        """
+        encoded = bytearray()
+        start = 0
+        for match in RleCodec._RUN_PATTERN.finditer(indexes):
+            if match.start() > start:
+                encoded += RleCodec._literal(
+                    indexes[start:match.start()], bit_depth
+                )
+            value = indexes[match.start()]
+            if bit_depth == 4:
+                value |= value << 4
+            run = match.end() - match.start()
+            encoded += bytes((255, value)) * (run // 255)
+            if run % 255:
+                encoded += bytes((run % 255, value))
+            start = match.end()
+        if start < len(indexes):
+            encoded += RleCodec._literal(indexes[start:], bit_depth)
+
+        return bytes(encoded)
+
+
+    @staticmethod
+    def encode_rows(header: BmpHeader, read_row):
+        """
+        Bir resmin tüm satırlarını sol alt köşeden başlayarak kodlayan bir
+        üreteç (generator) döndürür; satırlar istendikçe kodlanır. Her
+        satırın sonuna satır sonu, en sona resim sonu işareti eklenir.
+
+        Args:
+            header (BmpHeader): Resmin başlığı ('can_encode' ile uygun).
+            read_row (Callable[[int], bytes]): Sol alt köşeye göre 'y'
+            sırasındaki satırın dolgu hariç piksel baytlarını veren
+            fonksiyon.
+
+        Yields:
+            bytes: Kodlanmış satırlar ve son olarak resim sonu işareti.
+        """
+        for y in range(header.height):
+            indexes = read_row(y)
+            if header.bit_depth == 4:
+                indexes = ImageResizer._unpack_row(indexes, 4, header.width)
+            yield (
+                RleCodec.encode_row(bytes(indexes), header.bit_depth)
+                + RleCodec.END_OF_LINE
+            )
+        yield RleCodec.END_OF_BITMAP
+
+
+    @staticmethod
+    def compressed_prefix(
+        prefix: bytes | bytearray,
+        header: BmpHeader,
+        image_size: int
+    ) -> tuple[bytearray, BmpHeader]:
+        """
+        Piksel dizisinden önceki baytları ve başlığı, sıkıştırma türüne ve
+        sıkıştırılmış dizinin boyutuna göre günceller.
+
+        Returns:
+            tuple[bytearray, BmpHeader]: (güncellenmiş baytlar, yeni başlık)
+        """
+        header = header.resized(header.width, header.height)
+        header.compression = BmpHeader.BI_RLE8
+        if header.bit_depth == 4:
+            header.compression = BmpHeader.BI_RLE4
+        header.image_size = image_size
+        header.file_size = header.pixel_offset + image_size
+
+        prefix = bytearray(prefix)
+        prefix[30:34] = header.compression.to_bytes(
+            length=4, byteorder="little"
+        )
+        header.pack_into(prefix)
+
+        return prefix, header
+
+
+class PngWriter:
+    """
+    Satırları PNG biçiminde, resmin tamamını bellekte oluşturmadan yazar.
+    Yalnızca standart kütüphane ('zlib') kullanılır.
+
+    - 1, 4, 8 bit -> Paletli PNG (aynı bit derinliği ve palet).
+    - 24 bit, 16 bit ve alfa maskesi olmayan 32 bit -> RGB.
+    - Alfa maskesi olan 32 bit -> RGBA.
+
+    Her satıra beş PNG filtresi (None, Sub, Up, Average, Paeth) uygulanır
+    ve işaretli bayt değerlerinin mutlak toplamı en küçük olan seçilir
+    (uyarlamalı filtreleme). Filtreler satır tek bir tamsayı olarak ele
+    alınıp bayt (Paeth'te 16 bit) şeritler üzerinde toplu işlemlerle
+    hesaplanır; piksel başına Python düzeyinde işlem yapılmaz.
+
+    'threads' birden fazlaysa filtrelenmiş veri 'BLOCK_BYTES' boyutunda
+    bloklara bölünür ve bloklar iş parçacıklarında (thread) paralel olarak
+    sıkıştırılır; 'zlib' sıkıştırırken GIL'i bıraktığından bloklar
+    gerçekten paralel işlenir. Her blok bağımsız bir ham deflate akışıdır
+    ve önceki bloğun son 32 KB'ı sözlük (zdict) olarak verilir; bloklar
+    'Z_SYNC_FLUSH' ile bayt sınırında bittiğinden art arda eklenerek tek
+    bir geçerli akış oluşturur.
+
+    Methods:
+        validate_level (int): Sıkıştırma düzeyini doğrular.
+        _chunk (bytes): Bir PNG parçasını (chunk) oluşturan, özel metot.
+        _scanlines (tuple): Başlığa göre PNG renk türünü, paleti ve
+        satırları PNG sırasına dönüştüren fonksiyonu belirleyen, özel
+        metot.
+        _sub_bytes (int): İki satırın baytlarını ayrı ayrı çıkaran, özel
+        metot.
+        _paeth (int): Paeth tahminini 16 bit şeritlerde hesaplayan, özel
+        metot.
+        _filter_row (bytes): Bir satıra en uygun filtreyi uygulayan, özel
+        metot.
+        _deflate_block (bytes): Bir bloğu bağımsız bir ham deflate akışı
+        olarak sıkıştıran, özel metot. İş parçacıklarında çalışır.
+        _emit (None): Sıkıştırılmış veriyi IDAT parçaları olarak yazan,
+        özel metot.
+        write_image (None): Resmi yukarıdan aşağıya satır satır yazar.
+        _write_parallel (None): Satırları bloklar halinde paralel olarak
+        sıkıştıran, özel metot.
+    """
+    SIGNATURE = b"\x89PNG\r\n\x1a\n"
+    DEFAULT_LEVEL = 6
+    # Paralel sıkıştırmada iş parçacığı başına blok boyutu.
+    BLOCK_BYTES = 1 << 18
+    # IDAT parçalarının en küçük boyutu.
+    IDAT_BYTES = 1 << 16
+    WINDOW_BYTES = 1 << 15
+
+    # İşaretli bayt değerinin mutlak değeri (0-128); filtre seçimi için.
+    _COST_TABLE = bytes(min(value, 256 - value) for value in range(256))
+
+    __slots__ = ("writer", "level", "threads", "_pending")
+
+
+    def __init__(
+        self,
+        writer: AtomicWriter,
+        *,
+        level: int = DEFAULT_LEVEL,
+        threads: int = 1
+    ) -> None:
+        self.writer = writer
+        self.level = level
+        self.threads = max(1, threads)
+        self._pending = []
+
+
+    @staticmethod
+    def validate_level(level: int) -> int:
+        """
+        Sıkıştırma düzeyini (0 = sıkıştırma yok, 9 = en küçük dosya)
+        doğrular.
+
+        Raises:
+            TypeError: Sayısal bir metin değeri girilmemişse.
+            ValueError: Düzey 0-9 aralığında değilse.
+        """
+        level = ImageResizer._convert_to_int(str(level))  # TypeError
+        if not 0 <= level <= 9:
+            raise ValueError(
+                f"PNG sıkıştırma düzeyi 0-9 aralığında olmalıdır: {level}"
+            )
+
+        return level
+
+
+    @staticmethod
+    def _chunk(kind: bytes, data: bytes) -> bytes:
+        """
+        Bir PNG parçasını (uzunluk, tür, veri, CRC) oluşturan, özel metot.
+        """
+        return (
+            len(data).to_bytes(4, byteorder="big")
+            + kind
+            + data
+            + zlib_crc32(data, zlib_crc32(kind)).to_bytes(4, byteorder="big")
+        )
+
+
+    @staticmethod
+    def _scanlines(header: BmpHeader, read_row) -> tuple:
+        """
+        Başlığa göre PNG renk türünü, bit derinliğini, paleti ve satırları
+        PNG bayt sırasına (RGB, RGBA veya palet sırası) dönüştüren
+        fonksiyonu belirleyen, özel metot.
+
+        Returns:
+            tuple: (renk türü, bit derinliği, PLTE verisi, filtre
+            uzaklığı (bayt), satır fonksiyonu)
+        """
+        bit_depth = header.bit_depth
+        width = header.width
+
+        if bit_depth <= 8:
+            palette = list(header.palette[:1 << bit_depth])
+            palette += [(0, 0, 0)] * ((1 << bit_depth) - len(palette))
+            plte = b"".join(bytes(color[::-1]) for color in palette)
+            return 3, bit_depth, plte, 1, read_row
+
+        masks = (header.red_mask, header.green_mask, header.blue_mask)
+        if ImageResizer._has_byte_channels(header) and bit_depth == 32:
+            if header.alpha_mask:
+                masks += (header.alpha_mask,)
+            offsets = [
+                ((mask & -mask).bit_length() - 1) // 8 if mask else None
+                for mask in masks
+            ]
+            channels = len(offsets)
+
+            def png_row(y: int) -> bytearray:
+                row = bytes(read_row(y))
+                new_row = bytearray(channels * width)
+                for channel, offset in enumerate(offsets):
+                    if offset is not None:
+                        new_row[channel::channels] = row[offset::4]
+                return new_row
+
+            return (6 if channels == 4 else 2), 8, b"", channels, png_row
+
+        bgr_row = ColorConverter.bgr_rows(header, read_row)
+
+        def png_row(y: int) -> bytearray:
+            row = bytes(bgr_row(y))
+            new_row = bytearray(row)
+            new_row[0::3] = row[2::3]
+            new_row[2::3] = row[0::3]
+            return new_row
+
+        return 2, 8, b"", 3, png_row
+
+
+    @staticmethod
+    def _sub_bytes(x: int, y: int, high: int, full: int) -> int:
+        """
+        Tamsayı olarak verilen iki satırın baytlarını, baytlar arasında
+        borç (borrow) taşımadan ayrı ayrı çıkaran (mod 256), özel metot.
+
+        Args:
+            x, y (int): Satırlar (little-endian).
+            high (int): Her baytı 0x80 olan maske.
+            full (int): Her baytı 0xFF olan maske.
+        """
+        return ((x | high) - (y & (full ^ high))) ^ ((x ^ y ^ full) & high)
+
+
+    @staticmethod
+    def _paeth(a: bytes, b: bytes, c: bytes) -> bytes:
+        """
+        Paeth tahminini (a = sol, b = üst, c = sol üst) baytları 16 bitlik
+        şeritlere açarak toplu olarak hesaplayan, özel metot. Mutlak
+        farklar ve karşılaştırmalar, şeritlere eklenen sabit bir kayma ile
+        işaret biti üzerinden seçim maskelerine dönüştürülür.
+
+        Returns:
+            bytes: Piksel başına tahmin edilen baytlar.
+        """
+        length = len(a)
+
+        def widen(row: bytes) -> int:
+            lanes = bytearray(2 * length)
+            lanes[0::2] = row
+            return int.from_bytes(lanes, byteorder="little")
+
+        def lanes(value: int) -> int:
+            return int.from_bytes(
+                value.to_bytes(2, byteorder="little") * length,
+                byteorder="little"
+            )
+
+        ones = lanes(1)
+        word = lanes(0xFFFF)
+
+        def select(bit: int, value: int) -> int:
+            # Şeridin 'bit' konumundaki biti 1 ise 0xFFFF, değilse 0.
+            flags = (value >> bit) & ones
+            return (flags << 16) - flags
+
+        def absolute(u: int, v: int, bit: int) -> int:
+            # |u - v|; her şeritte v < 2 ** bit.
+            offset = lanes(1 << bit)
+            difference = u + offset - v
+            mask = select(bit, difference)
+            return (
+                ((difference & mask) - (offset & mask))
+                + ((offset & ~mask & word) - (difference & ~mask & word))
+            )
+
+        def less_equal(x: int, y: int) -> int:
+            # x <= y olan şeritlerde 0xFFFF.
+            return select(10, y + lanes(1 << 10) - x)
+
+        a, b, c = widen(a), widen(b), widen(c)
+        pa = absolute(b, c, 8)
+        pb = absolute(a, c, 8)
+        pc = absolute(a + b, c << 1, 9)
+
+        use_a = less_equal(pa, pb) & less_equal(pa, pc)
+        use_b = ~use_a & word & less_equal(pb, pc)
+        use_c = word ^ use_a ^ use_b
+        predicted = (a & use_a) | (b & use_b) | (c & use_c)
+
+        return predicted.to_bytes(2 * length, byteorder="little")[0::2]
+
+
+    @staticmethod
+    def _filter_row(line: bytes, previous: bytes, distance: int) -> bytes:
+        """
+        Bir satıra beş PNG filtresini uygulayıp işaretli bayt değerlerinin
+        mutlak toplamı en küçük olanı seçen, özel metot.
+
+        Args:
+            line (bytes): Satırın PNG baytları.
+            previous (bytes): Bir üst satırın baytları (ilk satırda sıfır).
+            distance (int): Filtrenin karşılaştırdığı baytlar arası uzaklık
+            (piksel başına bayt, en az 1).
+
+        Returns:
+            bytes: Filtre türü baytı ve filtrelenmiş satır.
+        """
+        length = len(line)
+        full = (1 << (8 * length)) - 1
+        high = int.from_bytes(b"\x80" * length, byteorder="little")
+        shift = 8 * distance
+
+        x = int.from_bytes(line, byteorder="little")
+        b = int.from_bytes(previous, byteorder="little")
+        a = (x << shift) & full
+
+        average = (a & b) + (
+            ((a ^ b) & int.from_bytes(b"\xfe" * length, byteorder="little"))
+            >> 1
+        )
+        left = bytes(distance) + line[:-distance]
+        upper_left = bytes(distance) + previous[:-distance]
+        paeth = int.from_bytes(
+            PngWriter._paeth(left, previous, upper_left), byteorder="little"
+        )
+
+        candidates = [line]
+        for predicted in (a, b, average, paeth):
+            candidates.append(
+                PngWriter._sub_bytes(x, predicted, high, full).to_bytes(
+                    length, byteorder="little"
+                )
+            )
+
+        costs = [
+            sum(candidate.translate(PngWriter._COST_TABLE))
+            for candidate in candidates
+        ]
+        best = costs.index(min(costs))
+
+        return bytes((best,)) + candidates[best]
+
+
+    @staticmethod
+    def _deflate_block(block: bytes, level: int, window: bytes) -> bytes:
+        """
+        Bir bloğu, önceki bloğun son 32 KB'ını sözlük olarak kullanan
+        bağımsız bir ham deflate akışı olarak sıkıştıran, özel metot. Akış
+        'Z_SYNC_FLUSH' ile bayt sınırında bitirilir. İş parçacıklarında
+        çalışır.
+        """
+        if window:
+            compressor = zlib_compressobj(
+                level, zlib_DEFLATED, -15, zdict=window
+            )
+        else:
+            compressor = zlib_compressobj(level, zlib_DEFLATED, -15)
+
+        return compressor.compress(block) + compressor.flush(zlib_Z_SYNC_FLUSH)
+
+
+    def _emit(self, data: bytes, *, final: bool = False) -> None:
+        """
+        Sıkıştırılmış veriyi biriktirip en az 'IDAT_BYTES' boyutunda IDAT
+        parçaları olarak yazan, özel metot.
+        """
+        if data:
+            self._pending.append(data)
+        size = sum(map(len, self._pending))
+        if size and (final or size >= PngWriter.IDAT_BYTES):
+            self.writer.write(
+                PngWriter._chunk(b"IDAT", b"".join(self._pending))
+            )
+            self._pending.clear()
+
+
+    def write_image(self, header: BmpHeader, read_row) -> None:
+        """
+        Resmi yukarıdan aşağıya satır satır filtreleyip sıkıştırarak
+        yazar. Bellekte en fazla iki satır ve (paralel sıkıştırmada)
+        iş parçacığı başına iki blok tutulur.
+
+        Args:
+            header (BmpHeader): Resmin başlığı.
+            read_row (Callable[[int], bytes]): Sol alt köşeye göre 'y'
+            sırasındaki satırın dolgu hariç piksel baytlarını veren
+            fonksiyon.
+        """
+        color_type, bit_depth, plte, distance, png_row = (
+            PngWriter._scanlines(header, read_row)
+        )
+
+        self.writer.write(PngWriter.SIGNATURE)
+        self.writer.write(
+            PngWriter._chunk(
+                b"IHDR",
+                header.width.to_bytes(4, byteorder="big")
+                + header.height.to_bytes(4, byteorder="big")
+                + bytes((bit_depth, color_type, 0, 0, 0))
+            )
+        )
+        if plte:
+            self.writer.write(PngWriter._chunk(b"PLTE", plte))
+
+        def filtered_lines():
+            previous = None
+            # PNG satırları yukarıdan aşağıya sıralıdır.
+            for y in range(header.height - 1, -1, -1):
+                line = bytes(png_row(y))
+                if previous is None:
+                    previous = bytes(len(line))
+                yield PngWriter._filter_row(line, previous, distance)
+                previous = line
+
+        if self.threads == 1:
+            compressor = zlib_compressobj(self.level)
+            for line in filtered_lines():
+                self._emit(compressor.compress(line))
+            self._emit(compressor.flush(), final=True)
+        else:
+            self._write_parallel(filtered_lines())
+
+        self.writer.write(PngWriter._chunk(b"IEND", b""))
+
+
+    def _write_parallel(self, lines) -> None:
+        """
+        Filtrelenmiş satırları bloklar halinde iş parçacıklarında paralel
+        olarak sıkıştırıp sırayla yazan, özel metot. zlib başlığı ve
+        Adler-32 sağlama toplamı bloklardan bağımsız olarak eklenir.
+        """
+        # zlib başlığı: deflate, 32 KB pencere; FLEVEL sıkıştırma düzeyine
+        # göre, FCHECK başlığı 31'in katı yapar.
+        flag = (0, 0, 1, 1, 1, 1, 2, 3, 3, 3)[self.level] << 6
+        flag += 31 - (0x78 * 256 + flag) % 31
+        self._emit(bytes((0x78, flag)))
+
+        checksum = 1
+        window = b""
+        blocks = collections_deque()
+        with futures_ThreadPoolExecutor(max_workers=self.threads) as pool:
+            block = []
+            block_size = 0
+            for line in lines:
+                block.append(line)
+                block_size += len(line)
+                if block_size < PngWriter.BLOCK_BYTES:
+                    continue
+                data = b"".join(block)
+                block = []
+                block_size = 0
+                checksum = zlib_adler32(data, checksum)
+                blocks.append(
+                    pool.submit(
+                        PngWriter._deflate_block, data, self.level, window
+                    )
+                )
+                window = data[-PngWriter.WINDOW_BYTES:]
+                while len(blocks) > 2 * self.threads:
+                    self._emit(blocks.popleft().result())
+
+            if block:
+                data = b"".join(block)
+                checksum = zlib_adler32(data, checksum)
+                blocks.append(
+                    pool.submit(
+                        PngWriter._deflate_block, data, self.level, window
+                    )
+                )
+            while blocks:
+                self._emit(blocks.popleft().result())
+
+        # Akışı bitiren boş son blok ve Adler-32 sağlama toplamı.
+        self._emit(zlib_compressobj(self.level, zlib_DEFLATED, -15).flush())
+        self._emit(checksum.to_bytes(4, byteorder="big"), final=True)
+
+
+class ImageResizer:
+    """
+    'BMP' uzantılı bir dosyaya ızgara eklemek ve yeniden boyutlandırmak için
+    işlevler sağlar.
+
+    Methods:
+        set_backend (None): Piksel işlemlerini yapacak arka ucu (python,
+        numpy) seçer.
+        _validate_byte_len (None): Mevcut bayt sayısı ile beklenen bayt 
+        sayısını karşılaştıran, özel metot. Bayt sayıları eşit değilse 
+        bir istisna fırlatır.
+        _split_bytes (int): Bit derinliğini baza alarak, piksel başına bayt
+        sayısını belirleyen, özel metot. Bit derinliği desteklenmiyorsa bir
+        istisna fırlatır.
+        _convert_to_int (int): Tanımlı renk adını, RGB formatında bir 
+        bytearray'e dönüştüren, özel metot. Renk tanımlı değilse bir istisna
+        fırlatır.
+        _convert_color_to_byte (bytearray): Tanımlı renk adını, RGB formatında
+        bir bytearray'e dönüştüren, özel metot. Renk tanımlı değilse bir 
+        istisna fırlatır.
+        _row_stride (int): Bir piksel satırının 4 bayta hizalanmış
+        uzunluğunu hesaplayan, özel metot.
+        _is_packed (bool): Bit derinliğinin bir bayta birden fazla piksel
+        sığdıran (1, 4 bit) paketli bir biçim olup olmadığını belirleyen,
+        özel metot.
+        _slice_bits (bytes | memoryview): Paketli bir satırdan bit
+        aralığını bayt sınırına hizalayarak kesen, özel metot.
+        _unpack_row (bytes): Paketli bir satırı piksel başına bir bayta
+        açan, özel metot.
+        _pack_row (bytes): Piksel başına bir bayt olan satırı tekrar
+        paketleyen, özel metot.
+        _palette_index (int): Bir renge paletteki en yakın rengin sırasını
+        bulan, özel metot.
+        _validate_crop (tuple): Kırpma penceresinin değerlerini resmin
+        sınırlarına göre doğrulayan, özel metot.
+        _crop_rows (None): Kırpma penceresindeki satır aralıklarını tek
+        dilim halinde kopyalayan, özel metot.
+        _mask_channel (int): 8 bitlik bir renk kanalını, bir renk kanalı
+        maskesinin bitlerine yerleştiren, özel metot.
+        _pack_pixel_color (bytes): BGR renk bilgisini bit derinliğine ve
+        renk kanalı maskelerine uygun tek bir piksel değerine (veya palet
+        sırasına) dönüştüren, özel metot.
+        _has_byte_channels (bool): Resmin renk kanallarının bayt sınırında
+        olup olmadığını belirleyen, özel metot.
+        _validate_grid (tuple): Izgara değerlerini doğrulayıp ızgara
+        boyutunu ve çizgi pikselini hesaplayan, özel metot.
+        _grid_templates (dict): Izgara satırı ve dikey çizgiler için önceden
+        hesaplanmış bayt şablonlarını oluşturan, özel metot.
+        _paint_grid_rows (None): Izgara çizgilerini piksel dizisine yerinde
+        çizen, özel metot.
+        _validate_scale_method (None): Ölçekleme filtresinin tanımlı olup
+        olmadığını kontrol eden, özel metot.
+        _validate_scale (tuple): Ölçekleme değerlerini doğrulayan, özel
+        metot.
+        _scale_table (list): Bir eksen için çıktı sırası başına kaynak sıra
+        ve ağırlık tablosunu oluşturan, özel metot.
+        _byte_taps (list): Piksel tablosunu, satır baytları üzerinde çalışan
+        toplayıcı (gather) ve ağırlık dizilerine dönüştüren, özel metot.
+        _widen_row (int): Bir satırın baytlarını 32 bitlik şeritlere açarak
+        tek bir tamsayıya dönüştüren, özel metot.
+        _scale_row (int): Bir kaynak satırını yatay eksende ölçekleyen,
+        özel metot.
+        _blend_rows (bytes): Yatayda ölçeklenmiş satırları dikey
+        ağırlıklarla birleştiren, özel metot.
+        _scaled_rows (Callable): Kaynak satırlarını ölçekleyip çıktı
+        satırlarını sırası verildikçe üreten bir fonksiyon döndüren, özel
+        metot.
+        _scale_pixels (None): Piksel dizisini ayrılabilir (separable) iki
+        geçişte ölçekleyerek çıktı dizisine yazan, özel metot.
+        _packed_scaled_rows (Callable): Paketli (1, 4 bit) satırları palet
+        sıraları üzerinde ölçekleyen bir fonksiyon döndüren, özel metot.
+        _average_rows (bytearray): İki satırı 2x2 kutu ortalamasıyla yarı
+        genişlikte tek bir satıra indiren, özel metot.
+        _validate_rotation (int): Döndürme açısını doğrulayan, özel metot.
+        _validate_flip (str): Aynalama eksenini doğrulayan, özel metot.
+        _flip_row (bytes): Bir satırdaki piksellerin sırasını ters dilimlerle
+        çeviren, özel metot.
+        _rotate_pixels (None): Piksel dizisini önbelleğe sığan bantlar
+        halinde 90 derece döndüren, özel metot.
+        _count_pixels (dict): Bir işlemin sonucundaki piksel sayısını
+        ölçüm sayacı olarak veren, özel metot.
+        _as_image (BmpImage): İçeriği, başlığı çözümlenmiş bir 'BmpImage'
+        nesnesine dönüştüren, özel metot.
+
+        read_image (bytearray): Görüntüyü binary (ikili) olarak okur.
+        map_image (mmap.mmap): Görüntü dosyasını okumadan belleğe eşler.
+        open_image (BmpImage): Görüntüyü okuyup (veya belleğe eşleyip)
+        başlığını bir kez çözümler.
+        read_crop (bytearray): Dosyadan yalnızca kırpma penceresindeki
+        satırları okuyarak kırpılmış resmi oluşturur.
+        save_image (None): Görüntü dosyasının güncellenmiş binary içeriğin
+        belirtilen konuma kaydeder.
+
+        add_grid (bytearray | BmpImage): Resme ızgara ekler.
+        resize_image (bytearray | BmpImage):  Resmi yeniden boyutlandırır.
+        scale_image (bytearray | BmpImage): Resmin çözünürlüğünü değiştirir.
+        rotate_image (bytearray | BmpImage): Resmi 90, 180 veya 270 derece
+        döndürür.
+        flip_image (bytearray | BmpImage): Resmi yatay veya dikey eksende
+        aynalar.
+        build_pyramid (list): Resmin 1/2, 1/4, 1/8... boyutlarındaki
+        küçültülmüş kopyalarını tek geçişte oluşturur.
+        pyramid_sizes (list): Piramidin seviyelerinin boyutlarını belirler.
+        pyramid_rows (Generator): Piramidin satırlarını üretildikleri
+        sırayla verir.
+        pyramid_paths (list): Piramidin seviye dosyalarının yollarını
+        türetir.
+        save_pyramid (list): Piramidin seviyelerini, bellekte
+        oluşturmadan ayrı dosyalara satır satır yazar.
+        slice_sizes (tuple): Karoların boyutunu ve satır, sütun sayısını
+        belirler.
+        slice_cells (Generator): Karoların piksel dizilerini, kaynağı tek
+        geçişte okuyarak verir.
+        slice_path (pathlib.Path): Bir karonun dosya yolunu türetir.
+        save_slices (list): Resmi karolara bölüp her karoyu ayrı bir
+        dosyaya yazar.
+    """
+    # Ölçekleme ağırlıkları sabit noktalı tamsayılardır: 1.0 = 1 << 12.
+    _WEIGHT_BITS = 12
+    # Bir 'tap' içinde maske ile gruplanacak en fazla farklı ağırlık sayısı.
+    _MAX_WEIGHT_GROUPS = 16
+    # 90 ve 270 derece döndürmede bir seferde aktarılan kaynak satır
+    # sayısı. Bir sütun diliminin dokunduğu önbellek satırları
+    # (1024 x 64 bayt) L2 önbelleğine sığar; ardışık sütunlar aynı önbellek
+    # satırlarından okunur.
+    _TRANSPOSE_ROWS = 1024
+    # Pikseli tek bir öğe olarak okunabilen bit derinliklerinin 'memoryview'
+    # biçimleri. 24 bit satırlar kanal kanal çevrilir ('_flip_row').
+    _PIXEL_FORMATS = {8: "B", 16: "H", 32: "I"}
+    # Karoları ('save_slices') yazan iş parçacığı sayısı. Dosya açma, yazma
+    # ve taşıma çağrıları GIL'i bıraktığından çekirdek sayısından
+    # bağımsızdır; her iş parçacığı için en fazla iki karo grubu bekletilir.
+    _SLICE_WRITERS = 8
+    # Kırpma, ızgara ve ölçeklemeyi yapan arka uç ('set_backend').
+    backend = None
+    # 1 ve 4 bit satırları bayt başına bir palet sırasına açan ve tekrar
+    # paketleyen tablolar. Baytın en yüksek bitleri ilk pikseldir.
+    _UNPACK_TABLES = {
+        bits: [
+            bytes(
+                (value >> (8 - bits * (k + 1))) & ((1 << bits) - 1)
+                for value in range(256)
+            )
+            for k in range(8 // bits)
+        ]
+        for bits in (1, 4)
+    }
+    _PACK_TABLES = {
+        bits: [
+            bytes(
+                ((value & ((1 << bits) - 1)) << (8 - bits * (k + 1)))
+                for value in range(256)
+            )
+            for k in range(8 // bits)
+        ]
+        for bits in (1, 4)
+    }
+
+    @staticmethod
+    def set_backend(name: Literal["auto", "python", "numpy"]) -> None:
+        """
+        Piksel işlemlerini yapacak arka ucu (backend) seçer. 'auto', NumPy
+        yüklüyse NumPy arka ucunu, değilse standart kütüphane arka ucunu
+        seçer. Tüm arka uçlar bayt bayt aynı çıktıyı üretir.
+
+        Raises:
+            ValueError: Tanımlanmamış bir arka uç girilmişse.
+            ValueError: 'numpy' seçilmiş ancak NumPy yüklü değilse.
+        """
+        if name == "auto":
+            name = "numpy" if NumpyBackend.available() else "python"
+
+        if name == "python":
+            ImageResizer.backend = PythonBackend
+        elif name == "numpy":
+            if not NumpyBackend.available():
+                raise ValueError("NumPy arka ucu için NumPy yüklü değil.")
+            ImageResizer.backend = NumpyBackend
+        else:
+            raise ValueError(f"Desteklenmeyen bir arka uç: {name}")
+
+
+    @staticmethod
+    def _validate_byte_len(byte_len: int, excepted_len: int) -> None:
+        """
+        Mevcut bayt sayısı ile beklenen bayt sayısını karşılaştıran,
+        özel metot.
+
+        Raises:
+            ValueError: Mevcut bayt sayısı, beklenen bayt sayısına eşit
+            değilse.
+        """
+        if byte_len != excepted_len:
+            raise ValueError(
+                f"Piksel baytlarının sayısı ({byte_len}) "
+                f"beklenenden ({excepted_len}) farklı."
+                "\n(?) Bu hata genellikle bir iç işlem sorunudur ve "
+                "kullanıcı hatasından kaynaklanmaz."
+                "Eğer bir geliştirici değilseniz, lütfen bu sorun hakkında "
+                "proje geliştiricisi ile iletişime geçin. Daha fazla bilgi "
+                "ve destek için proje belgelerine göz atabilirsiniz."
+            )
+
+
+    @staticmethod
+    def _split_bytes(bit_depth: int) -> int:
+        """
+        Bit derinliğini baza alarak, piksel başına bayt sayısını belirleyen,
+        özel metot.
+
+        Returns:
+            int: Piksel başına düşen bayt sayısı.
+
+        Raises:
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+        """
+        if bit_depth == 32:
+            return 4  # bytes_per_pixel = 4 Byte
+        elif bit_depth == 24:
+            return 3
+        elif bit_depth == 16:
+            return 2
+        elif bit_depth == 8:
+            return 1
+        else:
+            raise ValueError(f"Desteklenmeyen bit derinliği: {bit_depth}")
+
+
+    @staticmethod
+    def _convert_to_int(number: str) -> int:
+        """
+        Sayısal bir metin değerini 'int' bir değere dönüştüren, özel metot. 
+
+        Returns:
+            int: Dönüştürülen tamsayı değeri.
+
+        Raises:
+            TypeError: Girilen değer 'str' türünde değilse.
+            ValueError: Girilen metin sayısal bir değer içermiyorsa.
+        """
+        try:
+            return int(number)
+        except (TypeError, ValueError):
+            raise TypeError (
+                f"'{number}' bir tamsayı değil."
+            )
+
+
+    @staticmethod
+    def _convert_color_to_byte(
+        color: Literal[
+            "white",
+            "black",
+            "red",
+            "green",
+            "blue",
+            "yellow",
+            "magenta",
+            "cyan"
+        ]
+    ) -> bytearray:
+        """
+        Tanımlı renk adını, RGB formatında bir 'bytearray''e dönüştüren,
+        özel metot.
+
+        Renkler şu şekilde dönüştürülür:
+        - color_name -> B\\G\\R\\
+        - "white" -> \\xFF\\xFF\\xFF
+        - "black" -> \\x00\\x00\\x00
+        - "red" -> \\x00\\x00\\xFF
+        - "green" -> \\x00\\xFF\\x00
+        - "blue" -> \\xFF\\x00\\x00
+        - "yellow" -> \\x00\\xFF\\xFF
+        - "magenta" -> \\xFF\\x00\\xFF
+        - "cyan" -> \\xFF\\xFF\\x00
+
+        Returns:
+            bytearray: Bayt dizisine dönüştürülmüş renk bilgisi.
+
+        Raises:
+            ValueError: Tanımlanmamış bir renk girilmişse.
+        """
+        match color:
+            case "white":
+                return bytearray(b'\xFF\xFF\xFF')
+            case "black":
+                return bytearray(b'\x00\x00\x00')
+            case "red":
+                return bytearray(b'\x00\x00\xFF')
+            case "green":
+                return bytearray(b'\x00\xFF\x00')
+            case "blue":
+                return bytearray(b'\xFF\x00\x00')
+            case "yellow":
+                return bytearray(b'\x00\xFF\xFF')
+            case "magenta":
+                return bytearray(b'\xFF\x00\xFF')
+            case "cyan":
+                return bytearray(b'\xFF\xFF\x00')
+            case _:
+                raise ValueError(f"Desteklenmeyen bir renk: {color}")
+
+
+    @staticmethod
+    def _row_stride(width: int, bit_depth: int) -> int:
+        """
+        Bir piksel satırının 4 bayta hizalanmış uzunluğunu (stride)
+        hesaplayan, özel metot.
+
+        BMP dosyalarında her satır 4 baytın katı olacak şekilde sıfırlarla
+        doldurulur. Bu nedenle genişliği 4'ün katı olmayan resimlerde satır
+        uzunluğu 'width * bytes_per_pixel' değerinden büyük olabilir.
+
+        Returns:
+            int: Dolgu baytları dahil satır uzunluğu (bayt cinsinden).
+        """
+        return ((width * bit_depth + 31) // 32) * 4
+
+
+    @staticmethod
+    def _is_packed(bit_depth: int) -> bool:
+        """
+        Bit derinliğinin bir bayta birden fazla piksel sığdıran paketli
+        bir biçim (1, 4 bit) olup olmadığını belirleyen, özel metot.
+
+        Returns:
+            bool: 1 veya 4 bit ise 'True'; 8, 16, 24 veya 32 bit ise
+            'False'.
+
+        Raises:
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+        """
+        if bit_depth in (1, 4):
+            return True
+        ImageResizer._split_bytes(bit_depth)  # ValueError
+
+        return False
+
+
+    @staticmethod
+    def _slice_bits(
+        row: memoryview,
+        start_bit: int,
+        bit_len: int
+    ) -> bytes | memoryview:
+        """
+        Paketli bir satırdan 'start_bit' konumundan başlayan 'bit_len'
+        bitlik aralığı, ilk biti bayt sınırına gelecek şekilde kesen, özel
+        metot. Son baytta aralık dışında kalan bitler sıfırlanır.
+
+        Aralık bayt sınırında başlayıp bitiyorsa kopyalama yapılmaz,
+        satırın dilimi döner. Aksi halde kaydırma, satır tek bir tamsayıya
+        dönüştürülerek tek işlemle yapılır.
+
+        Returns:
+            bytes | memoryview: '(bit_len + 7) // 8' baytlık aralık.
+        """
+        first = start_bit >> 3
+        shift = start_bit & 7
+        new_len = (bit_len + 7) >> 3
+        if not shift and not bit_len & 7:
+            return row[first:first + new_len]
+
+        chunk = row[first:first + ((shift + bit_len + 7) >> 3)]
+        value = int.from_bytes(chunk, byteorder="big")
+        value >>= 8 * len(chunk) - shift - bit_len
+        value &= (1 << bit_len) - 1
+
+        return (value << (8 * new_len - bit_len)).to_bytes(
+            new_len, byteorder="big"
+        )
+
+
+    @staticmethod
+    def _unpack_row(row: memoryview, bit_depth: int, width: int) -> bytes:
+        """
+        Paketli (1, 4 bit) bir satırı, piksel başına bir palet sırası
+        içeren baytlara açan, özel metot. Her bit konumu tek bir 'translate'
+        çağrısıyla çıkarılır; piksel başına Python düzeyinde işlem yapılmaz.
+
+        Returns:
+            bytes: 'width' uzunluğunda palet sıraları.
+        """
+        tables = ImageResizer._UNPACK_TABLES[bit_depth]
+        row = bytes(row)
+        indexes = bytearray(len(row) * len(tables))
+        for k, table in enumerate(tables):
+            indexes[k::len(tables)] = row.translate(table)
+
+        return bytes(indexes[:width])
+
+
+    @staticmethod
+    def _pack_row(indexes: bytes, bit_depth: int) -> bytes:
+        """
+        Piksel başına bir palet sırası içeren satırı tekrar paketleyen
+        (1, 4 bit), özel metot. Her bit konumu 'translate' ile yerine
+        kaydırılır ve konumlar tamsayı olarak tek işlemle birleştirilir.
+        Son baytta satır dışında kalan bitler sıfırdır.
+
+        Returns:
+            bytes: '(len(indexes) * bit_depth + 7) // 8' baytlık satır.
+        """
+        tables = ImageResizer._PACK_TABLES[bit_depth]
+        per_byte = len(tables)
+        new_len = -(-len(indexes) // per_byte)
+        indexes = bytes(indexes) + bytes(new_len * per_byte - len(indexes))
+
+        value = 0
+        for k, table in enumerate(tables):
+            value |= int.from_bytes(
+                indexes[k::per_byte].translate(table), byteorder="big"
+            )
+
+        return value.to_bytes(new_len, byteorder="big")
+
+
+    @staticmethod
+    def _palette_index(palette: tuple, pixel_color: bytearray) -> int:
+        """
+        BGR bir renge paletteki en yakın (öklid uzaklığı) rengin sırasını
+        bulan, özel metot. İşlem başına bir kez çağrılır; çizim sırasında
+        pikseller yalnızca bu sırayla boyanır.
+
+        Returns:
+            int: Paletteki sıra.
+
+        Raises:
+            ValueError: Resmin paleti boşsa.
+        """
+        if not palette:
+            raise ValueError("Resmin renk paleti boş.")
+
+        return min(
+            range(len(palette)),
+            key=lambda index: sum(
+                (channel - target) ** 2
+                for channel, target in zip(palette[index], pixel_color)
+            )
+        )
+
+
+    @staticmethod
+    def _validate_crop(
+        header: BmpHeader,
+        *,
+        new_width: str,
+        new_height: str,
+        startx: str,
+        starty: str
+    ) -> tuple[int, int, int, int]:
+        """
+        Kırpma penceresinin değerlerini tamsayıya dönüştürüp resmin
+        sınırlarına göre doğrulayan, özel metot.
+
+        Returns:
+            tuple[int, int, int, int]: (new_width, new_height, startx,
+            starty)
+
+        Raises:
+            TypeError: Sayısal bir metin değeri girilmemişse.
+            ValueError: Pencere resmin sınırları dışında kalıyorsa.
+        """
+        width = header.width
+        height = header.height
+
+        new_width = ImageResizer._convert_to_int(new_width)  # TypeError
+        if new_width < 4 or new_width > width:
+            raise ValueError(
+                f"'{new_width}' değeri '4 <= Yeni Genişlik <= {width}' "
+                "eşitliğini sağlamalıdır."
+            )
+        new_height = ImageResizer._convert_to_int(new_height)  # TypeError
+        if new_height < 4 or new_height > height:
+            raise ValueError(
+                f"'{new_height}' değeri '4 <= Yeni Yükseklik <= {height}' "
+                "eşitliğini sağlamalıdır."
+            )
+
+        startx = ImageResizer._convert_to_int(startx)  # TypeError
+        if startx < 0:
+            raise ValueError("Başlangıç x pozitif bir tamsayı olmalı.")
+        elif startx + new_width > width:
+            # Kontrol sırarası ihtimali yüksek -> ihtimali düşük.
+            raise ValueError(
+                f"'Başlangıç x + Genişlik ({startx + new_width})' "
+                "orjinal sınırlar dışında kalıyor."
+            )
+        starty = ImageResizer._convert_to_int(starty)  # TypeError
+        if starty < 0:
+            raise ValueError("Başlangıç y pozitif bir tamsayı olmalı.")
+        elif starty + new_height > height:
+            raise ValueError(
+                f"'Başlangıç y + Yükseklik ({starty + new_height })' "
+                "orjinal sınırlar dışında kalıyor."
+            )
+
+        return new_width, new_height, startx, starty
+
+
+    @staticmethod
+    def _crop_rows(
+        pixel_data: memoryview,
+        new_pixels: memoryview,
+        *,
+        src_stride: int,
+        dst_stride: int,
+        first_row: int,
+        row_count: int,
+        row_offset: int,
+        row_len: int
+    ) -> None:
+        """
+        Kırpma penceresindeki satır aralıklarını tek dilim halinde kopyalayan,
+        özel metot.
+
+        Pencere dışındaki satırlar hiç ziyaret edilmez; her çıktı satırı için
+        yalnızca bir 'memoryview' dilimi kopyalanır. Böylece işlem maliyeti
+        kaynak piksel sayısıyla değil, çıktı satırı sayısıyla ölçeklenir.
+
+        Args:
+            pixel_data (memoryview): Kaynak piksel dizisi.
+            new_pixels (memoryview): Çıktı piksel dizisi (dolgu dahil).
+            src_stride (int): Kaynak satır uzunluğu (dolgu dahil).
+            dst_stride (int): Çıktı satır uzunluğu (dolgu dahil).
+            first_row (int): Kopyalanacak ilk satırın sırası.
+            row_count (int): Kopyalanacak satır sayısı.
+            row_offset (int): Satır içinde pencerenin başladığı bayt.
+            row_len (int): Satır içinde pencerenin bayt uzunluğu.
+        """
+        src_start = first_row * src_stride + row_offset
+        dst_start = 0
+        for _ in range(row_count):
+            new_pixels[dst_start:dst_start + row_len] = pixel_data[
+                src_start:src_start + row_len
+            ]
+            src_start += src_stride
+            dst_start += dst_stride
+
+
+    @staticmethod
+    def _mask_channel(value: int, mask: int) -> int:
+        """
+        8 bitlik bir renk kanalı değerini, bir renk kanalı maskesinin
+        genişliğine ölçekleyip maskenin bitlerine yerleştiren, özel metot.
+
+        Returns:
+            int: Maskenin bitlerine yerleştirilmiş değer (maske 0 ise 0).
+        """
+        if not mask:
+            return 0
+        shift = (mask & -mask).bit_length() - 1
+        maximum = mask >> shift
+
+        return ((value * maximum + 127) // 255) << shift & mask
+
+
+    @staticmethod
+    def _pack_pixel_color(
+        pixel_color: bytearray,
+        bit_depth: int,
+        palette: tuple = (),
+        masks: tuple[int, int, int, int] = None
+    ) -> bytes:
+        """
+        BGR renk bilgisini bit derinliğine uygun tek bir piksel değerine
+        dönüştüren, özel metot.
+
+        - 32 bit -> Renk kanalı maskelerine göre (varsayılan B\\G\\R\\A\\).
+        Maskelerin dışında kalan bitler (alfa) tamamen opaktır.
+        - 24 bit -> B\\G\\R\\
+        - 16 bit -> Renk kanalı maskelerine göre (varsayılan X1R5G5B5,
+        BI_BITFIELDS ile örneğin R5G6B5). Alfa maskesi varsa opaktır.
+        - 1, 4, 8 bit -> Paletteki en yakın rengin sırası (tek bayt)
+
+        Args:
+            pixel_color (bytearray): BGR renk.
+            bit_depth (int): Bit derinliği.
+            palette (tuple): 1, 4 ve 8 bit resimlerin paleti.
+            masks (tuple[int, int, int, int]): 16 ve 32 bit resimlerin
+            (kırmızı, yeşil, mavi, alfa) maskeleri.
+
+        Returns:
+            bytes: Bir pikselin bayt karşılığı (little-endian).
+
+        Raises:
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+            ValueError: Paletli bir resmin paleti boşsa.
+        """
+        blue, green, red = pixel_color
+        if bit_depth in (1, 4, 8):
+            index = ImageResizer._palette_index(
+                palette[:1 << bit_depth], pixel_color  # ValueError
+            )
+            return bytes((index,))
+        elif bit_depth in (16, 32):
+            if masks is None:
+                masks = (0x7C00, 0x03E0, 0x001F, 0)
+                if bit_depth == 32:
+                    masks = (0x00FF0000, 0x0000FF00, 0x000000FF, 0)
+            red_mask, green_mask, blue_mask, alpha_mask = masks
+            packed = (
+                ImageResizer._mask_channel(red, red_mask)
+                | ImageResizer._mask_channel(green, green_mask)
+                | ImageResizer._mask_channel(blue, blue_mask)
+                | alpha_mask
+            )
+            if bit_depth == 32:
+                packed |= ~(red_mask | green_mask | blue_mask) & 0xFFFFFFFF
+            return (packed & ((1 << bit_depth) - 1)).to_bytes(
+                length=bit_depth // 8, byteorder="little"
+            )
+        elif bit_depth == 24:
+            return bytes((blue, green, red))
+        else:
+            raise ValueError(
+                f"Izgara çizimi için desteklenmeyen bit derinliği: {bit_depth}"
+            )
+
+
+    @staticmethod
+    def _has_byte_channels(header: BmpHeader) -> bool:
+        """
+        Resmin renk kanallarının bayt sınırında olup olmadığını (24 bit
+        veya maskeleri tam bayt olan 32 bit) belirleyen, özel metot.
+        Kanalların ortalaması yalnızca bu durumda bayt bayt alınabilir.
+
+        Returns:
+            bool: Her renk kanalı ayrı bir bayt ise 'True'.
+        """
+        if header.bit_depth == 24:
+            return True
+        if header.bit_depth != 32:
+            return False
+
+        byte_masks = (0, 0xFF, 0xFF00, 0xFF0000, 0xFF000000)
+        return all(
+            mask in byte_masks
+            for mask in (
+                header.red_mask,
+                header.green_mask,
+                header.blue_mask,
+                header.alpha_mask
+            )
+        )
+
+
+    @staticmethod
+    def _validate_grid(
+        header: BmpHeader,
+        *,
+        grid_size: str,
+        grid_color: str
+    ) -> tuple[int, bytes]:
+        """
+        Izgara değerlerini doğrulayıp ızgara boyutunu ve çizgi pikselini
+        hesaplayan, özel metot.
+
+        Returns:
+            tuple[int, bytes]: (grid_size, bit derinliğine uygun piksel)
+
+        Raises:
+            TypeError: Sayısal bir metin değeri girilmemişse.
+            ValueError: Grid boyutu 1'den küçükse.
+            ValueError: Tanımlanmamış bir renk girilmişse.
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+        """
+        grid_size = ImageResizer._convert_to_int(grid_size)  # TypeError
+        if grid_size < 1:
+            raise ValueError(
+                f"'{grid_size}' değeri '1 <= Grid Boyutu' eşitliğini "
+                "sağlamalıdır."
+            )
+        pixel_color = ImageResizer._convert_color_to_byte(
+            grid_color  # ValueError
+        )
+        pixel = ImageResizer._pack_pixel_color(
+            pixel_color,
+            header.bit_depth,
+            header.palette,
+            (
+                header.red_mask,
+                header.green_mask,
+                header.blue_mask,
+                header.alpha_mask
+            )
+        )  # ValueError
+
+        return grid_size, pixel
+
+
+    @staticmethod
+    def _grid_templates(
+        width: int,
+        *,
+        grid_size: int,
+        pixel: bytes,
+        bit_depth: int = None
+    ) -> dict:
+        """
+        Izgara satırı ve dikey çizgiler için önceden hesaplanmış bayt
+        şablonlarını oluşturan, özel metot.
+
+        16 ve 32 bit resimlerde bir piksel tek bir makine sözcüğüdür
+        (word); dikey çizgiler için sözcük başına bir dolgu hazırlanır ve
+        çizim sözcük görünümünde ('memoryview.cast') tek bir adımlı
+        atamayla yapılır. 8 ve 24 bit resimlerde her renk kanalı ayrı bir
+        adımlı atamayla boyanır.
+
+        Paketli (1, 4 bit) resimlerde bir dikey çizgi pikseli, bir baytın
+        yalnızca birkaç bitidir. Çizgilerin bayt içindeki konumları
+        'piksel/bayt / ebob(grid_size, piksel/bayt)' çizgide bir tekrar
+        eder; her konum için baytlar adımlı bir dilim oluşturur. Bu
+        dilimler, yalnızca ilgili bitleri palet sırasına ayarlayan bir
+        'translate' tablosuyla boyanır.
+
+        Returns:
+            dict: '_paint_grid_rows' parametreleri:
+            - line: Tamamı çizgi rengindeki satır.
+            - column_fills: Her renk kanalı (16 ve 32 bitte her sözcük) için
+            dikey çizgi sayısı uzunluğunda dolgu.
+            - column_masks: Paketli resimlerde her bit konumu için (ilk
+            bayt, son bayt + 1, adım, tablo).
+            - word_size: Sözcük görünümünde çizilecekse piksel başına bayt
+            sayısı (2, 4), aksi halde 1.
+        """
+        if bit_depth is None or not ImageResizer._is_packed(bit_depth):
+            line = pixel * width
+            line_count = len(range(0, width, grid_size))
+            if len(pixel) in (2, 4):
+                return {
+                    "line": line,
+                    "column_fills": [pixel * line_count],
+                    "column_masks": [],
+                    "word_size": len(pixel)
+                }
+            column_fills = [
+                bytes((channel,)) * line_count for channel in pixel
+            ]
+            return {
+                "line": line,
+                "column_fills": column_fills,
+                "column_masks": [],
+                "word_size": 1
+            }
+
+        index = pixel[0]
+        per_byte = 8 // bit_depth
+        line = ImageResizer._pack_row(pixel * width, bit_depth)
+
+        period = per_byte // math_gcd(grid_size, per_byte)
+        step = period * grid_size // per_byte
+        column_masks = []
+        for x in range(0, min(width, period * grid_size), grid_size):
+            shift = 8 - bit_depth * (x % per_byte + 1)
+            mask = ((1 << bit_depth) - 1) << shift
+            first = x // per_byte
+            last = first + (width - 1 - x) // (period * grid_size) * step
+            column_masks.append(
+                (
+                    first,
+                    last + 1,
+                    step,
+                    bytes(
+                        (value & ~mask) | (index << shift)
+                        for value in range(256)
+                    )
+                )
+            )
+
+        return {
+            "line": line,
+            "column_fills": [],
+            "column_masks": column_masks,
+            "word_size": 1
+        }
+
+
+    @staticmethod
+    def _paint_grid_rows(
+        pixel_data: memoryview,
+        *,
+        stride: int,
+        grid_size: int,
+        line: bytes,
+        column_fills: list[bytes],
+        first_row: int,
+        last_row: int,
+        row_index_offset: int = 0,
+        column_masks: list[tuple[int, int, int, bytes]] = (),
+        word_size: int = 1
+    ) -> None:
+        """
+        Izgara çizgilerini piksel dizisine yerinde çizen, özel metot.
+
+        Izgara satırları önceden hesaplanmış tek bir satır şablonu ile,
+        dikey çizgiler ise her renk kanalı için adımlı (strided) dilim
+        ataması ile boyanır. 16 ve 32 bit resimlerde dizi, pikseli tek bir
+        sözcük olan bir görünüme dönüştürülür ve dikey çizgiler satır başına
+        tek bir adımlı atamayla boyanır. Paketli (1, 4 bit) resimlerde
+        dikey çizgiler, adımlı dilimlerin 'translate' ile dönüştürülmesiyle
+        boyanır. Piksel başına Python düzeyinde işlem yapılmaz.
+
+        Args:
+            pixel_data (memoryview): Yerinde değiştirilecek piksel dizisi.
+            stride (int): Satır uzunluğu (dolgu dahil).
+            grid_size (int): Grid karelerinin boyutu (piksel cinsinden).
+            line (bytes): Tamamı çizgi rengindeki satır şablonu.
+            column_fills (list[bytes]): Kanal başına dikey çizgi dolguları.
+            first_row (int): Boyanacak ilk satır (dizi içindeki sıra).
+            last_row (int): Boyanacak son satırın bir fazlası.
+            row_index_offset (int): Dizideki satır sırasının, ızgara
+            hesabında kullanılan satır sırasına uzaklığı.
+            column_masks (list[tuple[int, int, int, bytes]]): Paketli
+            resimlerde bit konumu başına dikey çizgi dilimleri.
+            word_size (int): 16 ve 32 bit resimlerde piksel başına bayt
+            sayısı; 'column_fills' tek bir sözcük dolgusu içerir.
+        """
+        row_len = len(line)
+        step = grid_size * len(column_fills)
+        start = first_row * stride
+
+        if word_size > 1:
+            # Satır uzunluğu 4'ün katı olduğundan her satır bir sözcük
+            # sınırında başlar. Dolgu, dosyadaki bayt sırasıyla kopyalanır.
+            code = "H" if word_size == 2 else "I"
+            words = pixel_data.cast(code)
+            word_fill = memoryview(column_fills[0]).cast(code)
+
+        for y in range(first_row, last_row):  # Satır sırası
+            end = start + row_len
+            if (y + row_index_offset) % grid_size == 0:
+                pixel_data[start:end] = line
+            elif word_size > 1:
+                words[
+                    start // word_size:end // word_size:grid_size
+                ] = word_fill
+            else:
+                for channel, fill in enumerate(column_fills):
+                    pixel_data[start + channel:end:step] = fill
+                for first, last, mask_step, table in column_masks:
+                    columns = slice(start + first, start + last, mask_step)
+                    pixel_data[columns] = bytes(
+                        pixel_data[columns]
+                    ).translate(table)
+            start += stride
+
+
+    @staticmethod
+    def _validate_scale_method(method: str) -> None:
+        """
+        Ölçekleme filtresinin tanımlı olup olmadığını kontrol eden,
+        özel metot.
+
+        Raises:
+            ValueError: Tanımlanmamış bir filtre girilmişse.
+        """
+        if method not in ("nearest", "bilinear", "box"):
+            raise ValueError(f"Desteklenmeyen bir ölçekleme filtresi: {method}")
+
+
+    @staticmethod
+    def _validate_scale(
+        header: BmpHeader,
+        *,
+        new_width: str,
+        new_height: str,
+        method: str
+    ) -> tuple[int, int]:
+        """
+        Ölçekleme değerlerini tamsayıya dönüştürüp filtrenin resmin bit
+        derinliğiyle kullanılabildiğini doğrulayan, özel metot.
+
+        Returns:
+            tuple[int, int]: (new_width, new_height)
+
+        Raises:
+            ValueError: Tanımlanmamış bir filtre girilmişse.
+            ValueError: 'bilinear' veya 'box' filtresi 24 ve 32 bit dışında
+            bir bit derinliği veya kanalları bayt sınırında olmayan 32 bit
+            maskelerle kullanılmışsa.
+            TypeError: Sayısal bir metin değeri girilmemişse.
+            ValueError: '1 <= new_width' veya '1 <= new_height' değilse.
+        """
+        ImageResizer._validate_scale_method(method)  # ValueError
+        if method != "nearest" and not ImageResizer._has_byte_channels(header):
+            # 16 bit ve maskeli 32 bit kanallar bayt sınırında olmayabilir,
+            # 1, 4 ve 8 bit ise paletin sırasını tutar; bu değerlerin
+            # bayt bayt ortalaması alınamaz.
+            raise ValueError(
+                f"'{method}' filtresi {header.bit_depth} bit derinliğinde "
+                "kullanılamaz."
+            )
+
+        new_width = ImageResizer._convert_to_int(new_width)  # TypeError
+        if new_width < 1:
+            raise ValueError(
+                f"'{new_width}' değeri '1 <= Yeni Genişlik' eşitliğini "
+                "sağlamalıdır."
+            )
+        new_height = ImageResizer._convert_to_int(new_height)  # TypeError
+        if new_height < 1:
+            raise ValueError(
+                f"'{new_height}' değeri '1 <= Yeni Yükseklik' eşitliğini "
+                "sağlamalıdır."
+            )
+
+        return new_width, new_height
+
+
+    @staticmethod
+    def _scale_table(
+        src_len: int,
+        dst_len: int,
+        method: Literal["nearest", "bilinear", "box"]
+    ) -> list[tuple[tuple[int, ...], tuple[int, ...]]]:
+        """
+        Bir eksen için çıktı sırası başına kaynak sıra ve ağırlık tablosunu
+        oluşturan, özel metot.
+
+        Ağırlıklar toplamı tam olarak '1 << _WEIGHT_BITS' olan tamsayılardır.
+        Böylece iç döngüde indeks hesabı veya kayan noktalı işlem yapılmaz.
+
+        - nearest: Çıktı pikselinin merkezine en yakın kaynak piksel.
+        - bilinear: Merkeze komşu iki kaynak piksel arasında doğrusal geçiş.
+        - box: Çıktı pikselinin kapladığı alandaki kaynak piksellerin,
+        kapladıkları alan oranında ortalaması.
+
+        Returns:
+            list[tuple[tuple[int, ...], tuple[int, ...]]]: Her çıktı sırası
+            için (kaynak sıraları, ağırlıklar).
+        """
+        one = 1 << ImageResizer._WEIGHT_BITS
+        table = []
+
+        for i in range(dst_len):
+            if method == "nearest":
+                table.append((((2 * i + 1) * src_len // (2 * dst_len),), (one,)))
+                continue
+
+            if method == "bilinear":
+                center = (i + 0.5) * src_len / dst_len - 0.5
+                left = int(center // 1)
+                frac = center - left
+                indexes = (
+                    min(max(left, 0), src_len - 1),
+                    min(max(left + 1, 0), src_len - 1)
+                )
+                weights = [1.0 - frac, frac]
+            else:
+                # Sınırlar, '1 / dst_len' piksel biriminde tamsayıdır.
+                start = i * src_len
+                end = start + src_len
+                indexes = tuple(range(start // dst_len, -(-end // dst_len)))
+                weights = [
+                    (min(end, (j + 1) * dst_len) - max(start, j * dst_len))
+                    / src_len
+                    for j in indexes
+                ]
+
+            # Ağırlıklar aşağı yuvarlanır; eksik kalan birimler kesir kısmı
+            # en büyük olan ağırlıklara birer birer eklenir (toplam = one).
+            # Böylece hiçbir ağırlık negatif olmaz.
+            scaled = [weight * one for weight in weights]
+            int_weights = [int(weight) for weight in scaled]
+            for k in sorted(
+                range(len(scaled)),
+                key=lambda k: int_weights[k] - scaled[k]
+            )[:one - sum(int_weights)]:
+                int_weights[k] += 1
+
+            # Kenarda aynı kaynağa düşen ağırlıkları birleştir, sıfır
+            # ağırlıklı kaynakları tablodan çıkar.
+            taps = {}
+            for index, weight in zip(indexes, int_weights):
+                taps[index] = taps.get(index, 0) + weight
+            taps = [(index, weight) for index, weight in taps.items() if weight]
+            table.append(
+                (
+                    tuple(index for index, _ in taps),
+                    tuple(weight for _, weight in taps)
+                )
+            )
+
+        return table
+
+
+    @staticmethod
+    def _byte_taps(
+        table: list[tuple[tuple[int, ...], tuple[int, ...]]],
+        bytes_per_pixel: int
+    ) -> list[tuple[operator_itemgetter, tuple, list | None]]:
+        """
+        Piksel tablosunu, satır baytları üzerinde çalışan toplayıcı (gather)
+        ve ağırlık dizilerine dönüştüren, özel metot.
+
+        Her çıktı baytı, aynı renk kanalındaki kaynak baytlarından beslenir.
+        Kaynak sayısı az olan pikseller sıfır ağırlıklı kaynaklarla
+        tamamlanır, böylece her 'tap' bir satırın tamamını tek bir C düzeyi
+        çağrıyla toplar.
+
+        Ölçek oranı sade bir kesir olduğunda (örneğin 2:1, 3:2) bir 'tap'
+        içindeki farklı ağırlık sayısı azdır. Bu durumda baytlar ağırlığa
+        göre maskelerle gruplanır ve çarpma, şeritler üzerinde grup başına
+        tek bir tamsayı işlemiyle yapılır.
+
+        Returns:
+            list[tuple[operator.itemgetter, tuple, list | None]]: Her 'tap'
+            için (bayt toplayıcı, bayt başına ağırlıklar, (ağırlık, şerit
+            maskesi) grupları veya grup sayısı fazlaysa None).
+        """
+        tap_count = max(len(indexes) for indexes, _ in table)
+        taps = []
+
+        for tap in range(tap_count):
+            byte_indexes = []
+            byte_weights = []
+            for indexes, weights in table:
+                if tap < len(indexes):
+                    index, weight = indexes[tap], weights[tap]
+                else:
+                    index, weight = indexes[0], 0
+                for channel in range(bytes_per_pixel):
+                    byte_indexes.append(index * bytes_per_pixel + channel)
+                    byte_weights.append(weight)
+
+            # Tek elemanlı 'itemgetter' demet yerine tek değer döndürür;
+            # bu nedenle sona sıfır ağırlıklı bir bayt eklenir.
+            byte_indexes.append(0)
+            byte_weights.append(0)
+
+            groups = None
+            distinct = set(byte_weights) - {0}
+            if len(distinct) <= ImageResizer._MAX_WEIGHT_GROUPS:
+                groups = []
+                for weight in sorted(distinct):
+                    mask = bytearray(4 * len(byte_weights))
+                    mask[0::4] = bytes(
+                        0xFF if byte_weight == weight else 0
+                        for byte_weight in byte_weights
+                    )
+                    if 0 not in byte_weights[:-1] and len(distinct) == 1:
+                        # Tüm baytlar aynı ağırlıkta; maske gereksiz.
+                        groups.append((weight, None))
+                    else:
+                        groups.append(
+                            (weight, int.from_bytes(mask, byteorder="little"))
+                        )
+
+            taps.append(
+                (
+                    operator_itemgetter(*byte_indexes),
+                    tuple(byte_weights),
+                    groups
+                )
+            )
+
+        return taps
+
+
+    @staticmethod
+    def _widen_row(row: bytes) -> int:
+        """
+        Bir satırın her baytını 32 bitlik bir şeride (lane) yerleştirerek
+        tek bir tamsayıya dönüştüren, özel metot.
+
+        Şeritler little-endian sırada yan yana durduğundan, tamsayının bir
+        sabitle çarpılması veya başka bir satırla toplanması, satırdaki tüm
+        baytlar için aynı işlemi tek bir C düzeyi çağrıyla yapar.
+
+        Returns:
+            int: 32 bitlik şeritlere açılmış satır.
+        """
+        lanes = bytearray(4 * len(row))
+        lanes[0::4] = row
+
+        return int.from_bytes(lanes, byteorder="little")
+
+
+    @staticmethod
+    def _scale_row(
+        row: memoryview,
+        taps: list[tuple[operator_itemgetter, tuple, list | None]]
+    ) -> int:
+        """
+        Bir kaynak satırını yatay eksende ölçekleyen, özel metot.
+
+        Sonuç, her çıktı baytı için 32 bitlik bir şeritte tutulan ve henüz
+        yuvarlanmamış ağırlıklı toplamdır (en fazla 20 bit).
+
+        Returns:
+            int: Şeritlere açılmış ağırlıklı toplamlar.
+        """
+        acc = 0
+        for getter, weights, groups in taps:
+            gathered = getter(row)
+            if groups is None:
+                acc += int.from_bytes(
+                    array_array(
+                        "I", map(operator_mul, gathered, weights)
+                    ).tobytes(),
+                    byteorder="little"
+                )
+                continue
+
+            lanes = ImageResizer._widen_row(bytes(gathered))
+            for weight, mask in groups:
+                if mask is None:
+                    acc += lanes * weight
+                else:
+                    acc += (lanes & mask) * weight
+
+        return acc
+
+
+    @staticmethod
+    def _blend_rows(
+        rows: list[int],
+        weights: tuple[int, ...],
+        *,
+        half: int,
+        byte_count: int
+    ) -> bytes:
+        """
+        Yatayda ölçeklenmiş satırları dikey ağırlıklarla birleştiren ve
+        sabit noktalı değerleri bayta yuvarlayan, özel metot.
+
+        Ağırlıkların toplamı '1 << _WEIGHT_BITS' olduğundan her şeritteki
+        değer 32 biti aşmaz ve komşu şeride taşmaz; yuvarlama ve kaydırma
+        da tüm şeritler için tek seferde yapılır.
+
+        Args:
+            rows (list[int]): Şeritlere açılmış yatay sonuçlar.
+            weights (tuple[int, ...]): Satır başına dikey ağırlıklar.
+            half (int): Her şeritte yarım birim (yuvarlama için).
+            byte_count (int): Şerit sayısı.
+
+        Returns:
+            bytes: Ölçeklenmiş çıktı satırı (dolgu hariç).
+        """
+        acc = half
+        for row, weight in zip(rows, weights):
+            acc += row * weight
+
+        new_row = (acc >> (2 * ImageResizer._WEIGHT_BITS)).to_bytes(
+            4 * byte_count, byteorder="little"
+        )
+
+        # Her şeridin en düşük baytı sonuç baytıdır. Son eleman,
+        # '_byte_taps' içindeki tek elemanlı toplayıcı önlemidir.
+        return new_row[0:-4:4]
+
+
+    @staticmethod
+    def _scaled_rows(
+        read_row,
+        *,
+        width: int,
+        height: int,
+        new_width: int,
+        new_height: int,
+        bytes_per_pixel: int,
+        method: Literal["nearest", "bilinear", "box"],
+        top_down: bool = False
+    ):
+        """
+        Kaynak satırlarını ayrılabilir (separable) iki geçişte ölçekleyen
+        ve çıktı satırlarını sırası verildikçe üreten bir fonksiyon
+        döndüren, özel metot.
+
+        Önce kaynak satırları yatay eksende ölçeklenir, ardından çıktı
+        satırları dikey ağırlıklarla birleştirilir. Yatay geçiş her kaynak
+        satır için en fazla bir kez yapılır; aynı kaynak satırı kullanan
+        ardışık çıktı satırları önbellekteki sonucu paylaşır. Çıktı
+        satırları artan veya azalan sırada istendiğinde önbellekte yalnızca
+        filtrenin kapladığı birkaç satır tutulur.
+
+        Args:
+            read_row (Callable[[int], memoryview]): Sırası verilen kaynak
+            satırının dolgu hariç baytlarını veren fonksiyon.
+            width (int): Kaynak genişliği.
+            height (int): Kaynak yüksekliği.
+            new_width (int): Çıktı genişliği.
+            new_height (int): Çıktı yüksekliği.
+            bytes_per_pixel (int): Piksel başına bayt sayısı.
+            method (str): Ölçekleme filtresi.
+            top_down (bool): Satırlar yukarıdan aşağıya sıralıysa 'True'.
+
+        Returns:
+            Callable[[int], bytes]: Sırası verilen çıktı satırını (dolgu
+            hariç) üreten fonksiyon.
+        """
+        row_len = new_width * bytes_per_pixel
+
+        column_table = ImageResizer._scale_table(width, new_width, method)
+        row_table = ImageResizer._scale_table(height, new_height, method)
+        if top_down:
+            # Dosyadaki satır sırası, sol alt köşeye göre sıranın tersidir.
+            row_table = [
+                (tuple(height - 1 - index for index in indexes), weights)
+                for indexes, weights in reversed(row_table)
+            ]
+        taps = ImageResizer._byte_taps(column_table, bytes_per_pixel)
+
+        # Şerit sayısı, toplayıcıdaki ek bayt nedeniyle bir fazladır.
+        byte_count = row_len + 1
+        half = 1 << (2 * ImageResizer._WEIGHT_BITS - 1)
+        half = int.from_bytes(
+            half.to_bytes(length=4, byteorder="little") * byte_count,
+            byteorder="little"
+        )
+
+        cache = {}
+
+        def scaled_row(y: int) -> bytes:
+            indexes, weights = row_table[y]
+
+            # Artık kullanılmayacak satırları (filtrenin dışında kalanları)
+            # önbellekten çıkar.
+            first, last = min(indexes), max(indexes)
+            for index in [
+                index for index in cache if not first <= index <= last
+            ]:
+                del cache[index]
+
+            if method == "nearest":
+                index = indexes[0]
+                if index not in cache:
+                    cache[index] = bytes(taps[0][0](read_row(index)))[:-1]
+                return cache[index]
+
+            for index in indexes:
+                if index not in cache:
+                    cache[index] = ImageResizer._scale_row(
+                        read_row(index), taps
+                    )
+            return ImageResizer._blend_rows(
+                [cache[index] for index in indexes],
+                weights,
+                half=half,
+                byte_count=byte_count
+            )
+
+        return scaled_row
+
+
+    @staticmethod
+    def _scale_pixels(
+        pixel_data: memoryview,
+        new_pixels: memoryview,
+        *,
+        width: int,
+        height: int,
+        new_width: int,
+        new_height: int,
+        bytes_per_pixel: int,
+        method: Literal["nearest", "bilinear", "box"],
+        top_down: bool = False,
+        first_row: int = 0,
+        last_row: int = None
+    ) -> None:
+        """
+        Piksel dizisini ayrılabilir (separable) iki geçişte ölçekleyerek
+        çıktı dizisine yazan, özel metot.
+
+        Args:
+            pixel_data (memoryview): Kaynak piksel dizisi.
+            new_pixels (memoryview): Çıktı piksel dizisi (dolgu dahil).
+            width (int): Kaynak genişliği.
+            height (int): Kaynak yüksekliği.
+            new_width (int): Çıktı genişliği.
+            new_height (int): Çıktı yüksekliği.
+            bytes_per_pixel (int): Piksel başına bayt sayısı.
+            method (str): Ölçekleme filtresi.
+            top_down (bool): Satırlar yukarıdan aşağıya sıralıysa 'True'.
+            first_row (int): Yazılacak ilk çıktı satırı.
+            last_row (int): Yazılacak son çıktı satırının bir fazlası.
+        """
+        if last_row is None:
+            last_row = new_height
+
+        src_stride = ImageResizer._row_stride(width, bytes_per_pixel * 8)
+        dst_stride = ImageResizer._row_stride(new_width, bytes_per_pixel * 8)
+        src_len = width * bytes_per_pixel
+        row_len = new_width * bytes_per_pixel
+
+        scaled_row = ImageResizer._scaled_rows(
+            lambda index: pixel_data[
+                index * src_stride:index * src_stride + src_len
+            ],
+            width=width,
+            height=height,
+            new_width=new_width,
+            new_height=new_height,
+            bytes_per_pixel=bytes_per_pixel,
+            method=method,
+            top_down=top_down
+        )
+
+        dst_start = first_row * dst_stride
+        for y in range(first_row, last_row):
+            new_pixels[dst_start:dst_start + row_len] = scaled_row(y)
+            dst_start += dst_stride
+
+
+    @staticmethod
+    def _packed_scaled_rows(
+        read_row,
+        *,
+        bit_depth: int,
+        width: int,
+        height: int,
+        new_width: int,
+        new_height: int,
+        method: Literal["nearest", "bilinear", "box"]
+    ):
+        """
+        Paketli (1, 4 bit) satırları palet sıraları üzerinde ölçekleyen ve
+        çıktı satırlarını sırası verildikçe üreten bir fonksiyon döndüren,
+        özel metot.
+
+        Kaynak satırlar yalnızca ihtiyaç duyulduğunda, tek tek piksel
+        başına bir bayta açılır ('_unpack_row'); ölçeklenen satır tekrar
+        paketlenir. Resmin açılmış bir kopyası bellekte tutulmaz. Aynı
+        kaynak satırdan üretilen ardışık çıktı satırları bir kez paketlenir.
+
+        Args:
+            read_row (Callable[[int], memoryview]): Sırası verilen kaynak
+            satırının dolgu hariç baytlarını veren fonksiyon.
+            bit_depth (int): Bit derinliği (1, 4).
+            width, height, new_width, new_height, method:
+            '_scaled_rows' ile aynı.
+
+        Returns:
+            Callable[[int], bytes]: Sırası verilen çıktı satırını (dolgu
+            hariç, paketli) üreten fonksiyon.
+        """
+        scaled_row = ImageResizer._scaled_rows(
+            lambda y: ImageResizer._unpack_row(read_row(y), bit_depth, width),
+            width=width,
+            height=height,
+            new_width=new_width,
+            new_height=new_height,
+            bytes_per_pixel=1,
+            method=method
+        )
+        last = [None, None]
+
+        def packed_row(y: int) -> bytes:
+            row = scaled_row(y)
+            if row is not last[0]:
+                last[:] = row, ImageResizer._pack_row(row, bit_depth)
+            return last[1]
+
+        return packed_row
+
+
+    @staticmethod
+    def _average_rows(
+        row0: memoryview,
+        row1: memoryview,
+        *,
+        new_width: int,
+        bytes_per_pixel: int,
+        half: int
+    ) -> bytearray:
+        """
+        İki satırı 2x2 kutu (box) ortalamasıyla yarı genişlikte tek bir
+        satıra indiren, özel metot.
+
+        Satırlar 32 bitlik şeritlere açılıp toplanır; komşu pikselin
+        şeritleri, tamsayı bir piksel kaydırılarak tek işlemle eklenir.
+        Her şeritteki toplam en fazla 4 * 255 + 2 olduğundan komşu şeride
+        taşmaz ve yuvarlama ile bölme tüm şeritler için tek seferde
+        yapılır. Tek genişlikli satırlarda son sütun kullanılmaz.
+
+        Args:
+            row0 (memoryview): Alttaki satır (dolgu hariç).
+            row1 (memoryview): Üstteki satır (dolgu hariç).
+            new_width (int): Çıktı satırının genişliği.
+            bytes_per_pixel (int): Piksel başına bayt sayısı.
+            half (int): Her şeritte yuvarlama için 2.
+
+        Returns:
+            bytearray: Ortalaması alınmış satır (dolgu hariç).
+        """
+        lanes = ImageResizer._widen_row(row0) + ImageResizer._widen_row(row1)
+        lanes += (lanes >> (32 * bytes_per_pixel)) + half
+        averages = (lanes >> 2).to_bytes(
+            4 * len(row0), byteorder="little"
+        )[0::4]
+
+        # Çift sıradaki piksellerin şeritleri çiftin ortalamasıdır.
+        step = 2 * bytes_per_pixel
+        end = new_width * step
+        new_row = bytearray(new_width * bytes_per_pixel)
+        for channel in range(bytes_per_pixel):
+            new_row[channel::bytes_per_pixel] = averages[channel:end:step]
+
+        return new_row
+
+
+    @staticmethod
+    def _validate_rotation(angle: str) -> int:
+        """
+        Döndürme açısını tamsayıya dönüştürüp doğrulayan, özel metot.
+        Negatif açılar saat yönünün tersine döndürmedir (-90 = 270).
+
+        Returns:
+            int: Saat yönünde 90, 180 veya 270.
+
+        Raises:
+            TypeError: Sayısal bir metin değeri girilmemişse.
+            ValueError: Açı 90 derecenin katı değilse veya döndürme
+            gerektirmiyorsa (0, 360).
+        """
+        angle = ImageResizer._convert_to_int(angle) % 360  # TypeError
+        if angle not in (90, 180, 270):
+            raise ValueError(
+                "Döndürme açısı 90, 180 veya 270 derece olmalıdır."
+            )
+
+        return angle
+
+
+    @staticmethod
+    def _validate_flip(axis: str) -> str:
+        """
+        Aynalama eksenini doğrulayan, özel metot.
+
+        Returns:
+            str: 'horizontal' (sağ-sol) veya 'vertical' (alt-üst).
+
+        Raises:
+            ValueError: Tanımlanmamış bir eksen girilmişse.
+        """
+        axis = str(axis).strip().lower()
+        if axis in ("h", "horizontal"):
+            return "horizontal"
+        if axis in ("v", "vertical"):
+            return "vertical"
+
+        raise ValueError(
+            f"Aynalama ekseni 'horizontal' (h) veya 'vertical' (v) "
+            f"olmalıdır: {axis}"
+        )
+
+
+    @staticmethod
+    def _flip_row(
+        row: memoryview,
+        *,
+        bit_depth: int,
+        width: int
+    ) -> bytes | bytearray:
+        """
+        Bir satırdaki piksellerin sırasını ters çeviren (sağ-sol aynalama),
+        özel metot. Piksel başına Python düzeyinde işlem yapılmaz: 8, 16 ve
+        32 bit satırlar tek bir ters dilimle, 24 bit satırlar kanal başına
+        bir ters dilimle, paketli (1, 4 bit) satırlar palet sıraları
+        açılarak çevrilir.
+
+        Returns:
+            bytes | bytearray: Ters çevrilmiş satır (dolgu hariç).
+        """
+        if ImageResizer._is_packed(bit_depth):
+            return ImageResizer._pack_row(
+                ImageResizer._unpack_row(row, bit_depth, width)[::-1],
+                bit_depth
+            )
+
+        row = memoryview(row)
+        pixel_format = ImageResizer._PIXEL_FORMATS.get(bit_depth)
+        if pixel_format is not None:
+            return row.cast(pixel_format)[::-1].tobytes()
+
+        # Adımlı dilimler 'bytes' üzerinde 'memoryview' üzerinde olduğundan
+        # çok daha hızlıdır.
+        row = row.tobytes()
+        bytes_per_pixel = bit_depth // 8
+        new_row = bytearray(len(row))
+        for channel in range(bytes_per_pixel):
+            new_row[channel::bytes_per_pixel] = row[
+                len(row) - bytes_per_pixel + channel::-bytes_per_pixel
+            ]
+
+        return new_row
+
+
+    @staticmethod
+    def _rotate_pixels(
+        pixel_data: memoryview,
+        new_pixels: memoryview,
+        *,
+        width: int,
+        height: int,
+        bit_depth: int,
+        clockwise: bool,
+        top_down: bool = False,
+        first_row: int = 0,
+        last_row: int = None
+    ) -> None:
+        """
+        Piksel dizisini 90 derece (saat yönünde veya tersine) döndürerek
+        çıktı dizisine yazan, özel metot. Çıktının satırları kaynağın
+        sütunlarıdır (transpose).
+
+        Kaynak, '_TRANSPOSE_ROWS' satırlık bantlar halinde aktarılır
+        (cache blocking): her sütunun bu banttaki pikselleri tek bir adımlı
+        (strided) dilimle toplanıp çıktı satırına tek dilim olarak yazılır.
+        Ardışık sütunlar aynı önbellek satırlarından okunduğundan bant
+        önbellekte kalır; büyük resimlerde sütunun tamamını okumak gibi
+        her piksel için yeni bir önbellek satırı yüklenmez.
+
+        Args:
+            pixel_data (memoryview): Kaynağın 'first_row' ve 'last_row'
+            arasındaki dosya satırları (dolgu dahil). Satırlar bant bant
+            üretiliyorsa (işlem hattı) yalnızca bant verilir.
+            new_pixels (memoryview): Çıktı piksel dizisi (dolgu dahil);
+            'height' genişliğinde ve 'width' yüksekliğinde.
+            width (int): Kaynak genişliği.
+            height (int): Kaynak yüksekliği.
+            bit_depth (int): Bit derinliği (8, 16, 24 veya 32).
+            clockwise (bool): Saat yönünde (90) veya tersine (270).
+            top_down (bool): Kaynak ve çıktının satırları yukarıdan aşağıya
+            sıralıysa.
+            first_row (int): 'pixel_data' içindeki ilk dosya satırının
+            sırası.
+            last_row (int): 'pixel_data' içindeki son dosya satırından
+            sonraki sıra.
+        """
+        if last_row is None:
+            last_row = height
+
+        bytes_per_pixel = bit_depth // 8
+        src_stride = ImageResizer._row_stride(width, bit_depth)
+        dst_stride = ImageResizer._row_stride(height, bit_depth)
+
+        # Saat yönünde döndürmede çıktının (sol alt köşeye göre) y
+        # sırasındaki satırı, kaynağın 'width - 1 - y' sütunudur ve
+        # kaynağın satırları soldan sağa dizilir; tersinde y sütunudur ve
+        # satırlar sağdan sola dizilir. Yukarıdan aşağıya sıralı dosyalarda
+        # her iki sıra da terstir.
+        reverse_columns = clockwise != top_down
+        reverse_rows = clockwise == top_down
+
+        for start in range(first_row, last_row, ImageResizer._TRANSPOSE_ROWS):
+            end = min(start + ImageResizer._TRANSPOSE_ROWS, last_row)
+            # Adımlı dilimler 'bytes' ve 'bytearray' üzerinde, 'memoryview'
+            # üzerinde olduğundan çok daha hızlıdır; bant bir kez kopyalanır
+            # ve her çıktı dilimi önce küçük bir diziye toplanır.
+            band = bytes(
+                pixel_data[
+                    (start - first_row) * src_stride:
+                    (end - first_row) * src_stride
+                ]
+            )
+            if reverse_rows:
+                offset = (height - end) * bytes_per_pixel
+                band_start = (end - start - 1) * src_stride
+                step = -src_stride
+            else:
+                offset = start * bytes_per_pixel
+                band_start = 0
+                step = src_stride
+            segment = bytearray((end - start) * bytes_per_pixel)
+
+            for row_index in range(width):
+                column = row_index
+                if reverse_columns:
+                    column = width - 1 - row_index
+                first = band_start + column * bytes_per_pixel
+                for channel in range(bytes_per_pixel):
+                    segment[channel::bytes_per_pixel] = band[
+                        first + channel::step
+                    ]
+                target_start = row_index * dst_stride + offset
+                new_pixels[target_start:target_start + len(segment)] = segment
+
+
+    @staticmethod
+    def _is_uniform(
+        cell: bytearray,
+        *,
+        width: int,
+        height: int,
+        bit_depth: int
+    ) -> bool:
+        """
+        Bir karonun (dolgu dahil piksel dizisi) tüm piksellerinin ilk
+        pikselle aynı olup olmadığını kontrol eden, özel metot. Karo, ilk
+        pikselden oluşturulan tek renkli bir karoyla tek işlemde
+        karşılaştırılır; piksel başına işlem yapılmaz.
+
+        Returns:
+            bool: Karo tek renkliyse True.
+        """
+        row_len = (width * bit_depth + 7) // 8
+        padding = bytes(ImageResizer._row_stride(width, bit_depth) - row_len)
+        if ImageResizer._is_packed(bit_depth):
+            index = ImageResizer._unpack_row(cell[:1], bit_depth, 1)
+            row = ImageResizer._pack_row(index * width, bit_depth)
+        else:
+            row = cell[:bit_depth // 8] * width
+
+        return cell == (row + padding) * height
+
+
+    @staticmethod
+    def _count_pixels(data: bytearray | BmpImage) -> dict:
+        """
+        Bir işlemin sonucundaki piksel sayısını ölçüm sayacı olarak veren,
+        özel metot. Yalnızca ölçüm açıkken çağrılır.
+
+        Returns:
+            dict: {"pixels": genişlik * yükseklik}
+        """
+        header = ImageResizer._as_image(data).header
+
+        return {"pixels": header.width * header.height}
+
+
+    @staticmethod
+    def _as_image(data: bytearray | BmpImage) -> BmpImage:
+        """
+        İçeriği, başlığı çözümlenmiş bir 'BmpImage' nesnesine dönüştüren,
+        özel metot. İçerik zaten 'BmpImage' ise başlık tekrar çözümlenmez.
+
+        Raises:
+            ValueError: İçerik geçerli bir BMP dosyası değilse.
+        """
+        if isinstance(data, BmpImage):
+            return data
+        return BmpImage.from_bytes(data)  # ValueError
+
+
+    @staticmethod
+    @Metrics.measure(
+        "read_image", lambda result: {"bytes_read": len(result)}
+    )
+    def read_image(file_path: pathlib_path) -> bytearray:
+        """
+        Görüntü dosyasını binary (ikili) olarak okur. RLE (BI_RLE8,
+        BI_RLE4) ile sıkıştırılmış dosyalar satır satır çözülerek BI_RGB
+        içerik olarak döndürülür.
+
+        Args:
+            file_path (pathlib.Path): Görüntü dosyasının bulunduğu dizin.
+        
+        Raises:
+            ValueError: Boş bir yol veya geçersiz bir değer girilmişse.
+            FileNotFoundError: Dosya belirtilen konumda yoksa.
+            PermissionError: Dosyanın okuma izinleri yoksa.
+            RuntimeError: Beklenmeyen hatalar oluşmuşsa.
+            ValueError: Sıkıştırılmış dosyanın başlığı geçersizse.
+        """      
+        FileValidator.validate_path(file_path)  # ValueError
+        FileValidator.validate_path(file_path)  # FileNotFoundError
+        FileValidator.validate_read_permission(file_path)  # PermissionError
+
+        try:
+            with open(file_path, "rb") as file:
+                # İkili diziye çevir.
+                data = bytearray(file.read())  
+        except Exception as e:
+            raise RuntimeError(
+                f"Dosya okuma sırasında beklenmedik bir hata oluştu: {e}"
+            )
+
+        if RleCodec.is_compressed(data):
+            return RleCodec.decode(data)  # ValueError
+
+        return data
+    
+
+    @staticmethod
+    @Metrics.measure(
+        "open_image",
+        lambda result: {
+            "pixels": result.header.width * result.header.height
+        }
+    )
+    def open_image(
+        file_path: pathlib_path,
+        *,
+        use_mmap: bool = False
+    ) -> BmpImage:
+        """
+        Görüntü dosyasını okuyup başlığını bir kez çözümler. Dönen nesne
+        'add_grid', 'resize_image' ve 'scale_image' işlemlerine doğrudan
+        verilerek işlemler bellekte zincirlenebilir.
+
+        'use_mmap' verilirse dosya okunmaz, belleğe eşlenir (copy-on-write).
+        İşletim sistemi yalnızca erişilen sayfaları diskten yükler; böylece
+        büyük bir dosyadan küçük bir pencere kırpmak, dosyanın tamamını
+        belleğe almaz. Eşlenmiş görüntü üzerinde yapılan yerinde
+        değişiklikler (örneğin 'add_grid') dosyaya yansımaz.
+
+        Args:
+            file_path (pathlib.Path): Görüntü dosyasının bulunduğu dizin.
+            use_mmap (bool): Dosya belleğe eşlenerek açılsın mı?
+
+        Raises:
+            ValueError: Boş bir yol veya geçersiz bir değer girilmişse.
+            FileNotFoundError: Dosya belirtilen konumda yoksa.
+            PermissionError: Dosyanın okuma izinleri yoksa.
+            RuntimeError: Beklenmeyen hatalar oluşmuşsa.
+            ValueError: Dosya geçerli bir BMP dosyası değilse.
+        """
+        if not use_mmap:
+            data = ImageResizer.read_image(file_path)
+
+            return BmpImage.from_bytes(data)  # ValueError
+
+        data = ImageResizer.map_image(
+            file_path
+        )  # ValueError, FileNotFoundError, PermissionError, RuntimeError
+
+        return BmpImage.from_bytes(data)  # ValueError
+
+
+    @staticmethod
+    def map_image(file_path: pathlib_path) -> mmap_mmap:
+        """
+        Görüntü dosyasını okumadan belleğe eşler (copy-on-write). Dönen
+        eşleme, dosyanın ham baytlarıdır (örneğin içerik özeti için); başlık
+        'BmpImage.from_bytes' ile çözümlenir.
+
+        Raises:
+            ValueError: Boş bir yol girilmişse veya dosya boşsa.
+            FileNotFoundError: Dosya belirtilen konumda yoksa.
+            PermissionError: Dosyanın okuma izinleri yoksa.
+            RuntimeError: Beklenmeyen hatalar oluşmuşsa.
+        """
+        FileValidator.validate_path(file_path)  # ValueError
+        FileValidator.validate_file(file_path)  # FileNotFoundError
+        FileValidator.validate_read_permission(file_path)  # PermissionError
+
+        if os_path.getsize(file_path) == 0:
+            raise ValueError("Dosya geçerli bir BMP dosyası değil.")
+
+        try:
+            with open(file_path, "rb") as file:
+                # Eşleme, dosya kapatıldıktan sonra da geçerlidir.
+                return mmap_mmap(file.fileno(), 0, access=mmap_ACCESS_COPY)
+        except Exception as e:
+            raise RuntimeError(
+                f"Dosya okuma sırasında beklenmedik bir hata oluştu: {e}"
+            )
+
+
+    @staticmethod
+    @Metrics.measure(
+        "read_crop", lambda result: {"bytes_read": len(result)}
+    )
+    def read_crop(
+        file_path: pathlib_path,
+        *,
+        new_width: str,
+        new_height: str,
+        startx: str,
+        starty: str
+    ) -> bytearray:
+        """
+        Görüntü dosyasından yalnızca kırpma penceresindeki satır aralıklarını
+        okuyarak kırpılmış resmi oluşturur.
+
+        Dosyanın tamamı okunmaz: önce başlık ve palet okunur, ardından
+        penceredeki her satır için dosyada ilgili konuma gidilip (seek)
+        yalnızca o satırın pencere içindeki baytları doğrudan çıktı dizisine
+        okunur. Sonuç, 'read_image' ve 'resize_image' ile aynıdır.
+
+        Args:
+            file_path (pathlib.Path): Görüntü dosyasının bulunduğu dizin.
+            new_width (str): İstenilen genişlik.
+            new_height (str): İstenilen yükseklik.
+            startx (str): Yatay eksende sol alt köşeye olan uzaklık.
+            starty (str): Dikey eksende sol alt köşeye olan uzaklık.
+
+        Raises:
+            ValueError: Boş bir yol veya geçersiz bir değer girilmişse.
+            FileNotFoundError: Dosya belirtilen konumda yoksa.
+            PermissionError: Dosyanın okuma izinleri yoksa.
+            RuntimeError: Beklenmeyen hatalar oluşmuşsa.
+            ValueError: Dosya geçerli bir BMP dosyası değilse.
+            ValueError, TypeError: Pencere değerleri geçersizse
+            ('resize_image' ile aynı kurallar).
+        """
+        FileValidator.validate_path(file_path)  # ValueError
+        FileValidator.validate_file(file_path)  # FileNotFoundError
+        FileValidator.validate_read_permission(file_path)  # PermissionError
+
+        try:
+            # Tamponsuz (raw) okuma, istenmeyen baytların önden okunmasını
+            # (read-ahead) engeller.
+            file = open(file_path, "rb", buffering=0)
+        except Exception as e:
+            raise RuntimeError(
+                f"Dosya okuma sırasında beklenmedik bir hata oluştu: {e}"
+            )
+
+        with file:
+            try:
+                head = bytearray(file.read(18))
+                if len(head) == 18 and head[0:2] == b"BM":
+                    # Başlık ve palet, piksel dizisinin başladığı konuma
+                    # kadar olan kısımdır.
+                    pixel_offset = int.from_bytes(
+                        head[10:14], byteorder="little"
+                    )
+                    head += file.read(max(0, pixel_offset - 18))
+                file_size = os_fstat(file.fileno()).st_size
+            except Exception as e:
+                raise RuntimeError(
+                    f"Dosya okuma sırasında beklenmedik bir hata oluştu: {e}"
+                )
+
+            header = BmpHeader.from_bytes(head)  # ValueError
+            if RleCodec.is_compressed(head):
+                # Sıkıştırılmış satırların dosyadaki konumu bilinmediğinden
+                # resmin tamamı çözülüp kırpılır.
+                return ImageResizer.resize_image(
+                    ImageResizer.read_image(file_path),
+                    new_width=new_width,
+                    new_height=new_height,
+                    startx=startx,
+                    starty=starty
+                )
+            BmpImage._validate_header(header, file_size)  # ValueError
+            # Yalnızca başlık okunduğundan, bu nesnenin piksel görünümü
+            # boştur; 'blank_like' için başlık kaynağı olarak kullanılır.
+            image = BmpImage(head, header)
+
+            new_width, new_height, startx, starty = (
+                ImageResizer._validate_crop(
+                    header,
+                    new_width=new_width,
+                    new_height=new_height,
+                    startx=startx,
+                    starty=starty
+                )
+            )  # ValueError, TypeError
+            packed = ImageResizer._is_packed(header.bit_depth)  # ValueError
+
+            new_image = BmpImage.blank_like(image, new_width, new_height)
+
+            first_row = starty
+            if header.top_down:
+                first_row = header.height - starty - new_height
+
+            # Paketli (1, 4 bit) resimlerde pencere bir baytın ortasında
+            # başlayabilir; bu durumda satır geçici bir tampona okunup
+            # bit düzeyinde kesilir.
+            row_offset, shift = divmod(startx * header.bit_depth, 8)
+            bit_len = new_width * header.bit_depth
+            row_len = (bit_len + 7) // 8
+            buffer = bytearray((shift + bit_len + 7) // 8) if packed else None
+
+            src_start = (
+                header.pixel_offset + first_row * header.stride + row_offset
+            )
+            dst_start = 0
+            try:
+                for _ in range(new_height):
+                    file.seek(src_start)
+                    if packed:
+                        file.readinto(buffer)
+                        new_image.pixels[dst_start:dst_start + row_len] = (
+                            ImageResizer._slice_bits(buffer, shift, bit_len)
+                        )
+                    else:
+                        file.readinto(
+                            new_image.pixels[dst_start:dst_start + row_len]
+                        )
+                    src_start += header.stride
+                    dst_start += new_image.header.stride
+            except Exception as e:
+                raise RuntimeError(
+                    f"Dosya okuma sırasında beklenmedik bir hata oluştu: {e}"
+                )
+
+        return new_image.data
+
+
+    @staticmethod
+    def save_image(
+        file_path: pathlib_path,
+        *,
+        data: bytearray,
+        rle: bool = False,
+        level: int = PngWriter.DEFAULT_LEVEL,
+        threads: int = 1,
+        staged: bool = False
+    ) -> None:
+        """
+        Görüntü dosyasının güncellenmiş binary içeriğini belirtilen konuma
+        kaydeder. İçerik önce geçici bir dosyaya yazılır; yazma yarıda
+        kesilirse hedefte yarım bir dosya kalmaz ('AtomicWriter').
+
+        Dosya uzantısı '.png' ise resim PNG biçimine dönüştürülerek
+        kaydedilir ('PngWriter').
+
+        Args:
+            data (bytearray): Kaydedilecek içerik.
+            file_path (pathlib.Path): Görüntü dosyasının kaydedileceği dizin.
+            rle (bool): Resim 4 veya 8 bit ve aşağıdan yukarıya sıralıysa
+            RLE ile sıkıştırılarak kaydedilsin mi? Diğer resimler
+            sıkıştırılmadan kaydedilir.
+            level (int): PNG sıkıştırma düzeyi (0-9).
+            threads (int): PNG sıkıştırmasında kullanılacak iş parçacığı
+            sayısı.
+            staged (bool): Dosya, bütün olarak taşınacak geçici bir
+            klasöre mi yazılıyor ('AtomicWriter')?
+
+        Raises:
+            ValueError: Boş bir yol veya geçersiz bir değer girilmişse.
+            RuntimeError: Beklenmeyen hatalar oluşmuşsa.
+            ValueError: Uzantı desteklenmeyen bir resim biçimiyse.
+            ValueError: PNG veya RLE ile kaydedilecek içerik geçerli bir
+            BMP dosyası değilse.
+            ValueError, TypeError: PNG sıkıştırma düzeyi geçersizse.
+
+        """
+        FileValidator.validate_path(file_path)  # ValueError
+        image_format = FileValidator.validate_output_format(
+            file_path
+        )  # ValueError
+
+        if rle or image_format == "png":
+            image = ImageResizer._as_image(data)  # ValueError
+            if image_format == "png" or RleCodec.can_encode(image.header):
+                ImageResizer.save_rows(
+                    file_path,
+                    prefix=image.data[:image.header.pixel_offset],
+                    header=image.header,
+                    read_row=image.row,
+                    rle=rle,
+                    level=level,
+                    threads=threads,
+                    staged=staged
+                )  # ValueError, TypeError, RuntimeError
+                return
+
+        try:
+            with Metrics.stage("save_image") as stage:
+                with AtomicWriter(file_path, staged=staged) as writer:
+                    writer.write(data)
+                stage.add(bytes_written=writer.bytes_written)
+        except Exception as e:
+            raise RuntimeError(
+                f"Dosya yazma sırasında beklenmedik bir hata oluştu: {e}"
+            )
+
+
+    @staticmethod
+    def save_rows(
+        file_path: pathlib_path,
+        *,
+        prefix: bytes | bytearray,
+        header: BmpHeader,
+        read_row,
+        rle: bool = False,
+        level: int = PngWriter.DEFAULT_LEVEL,
+        threads: int = 1,
+        staged: bool = False
+    ) -> None:
+        """
+        Bir resmi, tam içeriği bellekte oluşturulmadan satır satır
+        kaydeder. Satırlar dosyadaki sıralarıyla istenir ve dolgu baytları
+        eklenerek 'AtomicWriter' ile yazılır.
+
+        RLE ile sıkıştırmada satırlar kodlandıkça yazılır; sıkıştırılmış
+        dizinin boyutu ancak yazma bitince belli olduğundan başlık en sonda
+        güncellenir ('AtomicWriter.patch'). Dosya uzantısı '.png' ise satırlar
+        yukarıdan aşağıya istenip 'PngWriter' ile yazılır ('prefix' ve
+        'rle' kullanılmaz).
+
+        Args:
+            file_path (pathlib.Path): Görüntü dosyasının kaydedileceği dizin.
+            prefix (bytes | bytearray): Piksel dizisinden önceki baytlar
+            ('BmpImage.header_like').
+            header (BmpHeader): Kaydedilecek resmin başlığı.
+            read_row (Callable[[int], bytes]): Sol alt köşeye göre 'y'
+            sırasındaki satırın dolgu hariç piksel baytlarını veren
+            fonksiyon. Döndürülen satırlar sonradan değiştirilmemelidir.
+            rle (bool): Resim 4 veya 8 bit ve aşağıdan yukarıya sıralıysa
+            RLE ile sıkıştırılarak kaydedilsin mi?
+            level (int): PNG sıkıştırma düzeyi (0-9).
+            threads (int): PNG sıkıştırmasında kullanılacak iş parçacığı
+            sayısı.
+            staged (bool): Dosya, bütün olarak taşınacak geçici bir
+            klasöre mi yazılıyor ('AtomicWriter')?
+
+        Raises:
+            ValueError: Boş bir yol veya geçersiz bir değer girilmişse.
+            RuntimeError: Beklenmeyen hatalar oluşmuşsa.
+            ValueError: Uzantı desteklenmeyen bir resim biçimiyse.
+            ValueError, TypeError: PNG sıkıştırma düzeyi geçersizse.
+        """
+        FileValidator.validate_path(file_path)  # ValueError
+        image_format = FileValidator.validate_output_format(
+            file_path
+        )  # ValueError
+        if image_format == "png":
+            level = PngWriter.validate_level(level)  # ValueError, TypeError
+
+        row_len = (header.width * header.bit_depth + 7) // 8
+        padding = bytes(header.stride - row_len)
+        rows = range(header.height)
+        if header.top_down:
+            rows = reversed(rows)
+
+        compress = (
+            image_format == "bmp" and rle and RleCodec.can_encode(header)
+        )
+
+        try:
+            with Metrics.stage("save_image") as stage:
+                with AtomicWriter(file_path, staged=staged) as writer:
+                    if image_format == "png":
+                        PngWriter(
+                            writer, level=level, threads=threads
+                        ).write_image(header, read_row)
+                    elif compress:
+                        # Boyut alanları, yazma bitince güncellenir.
+                        writer.write(
+                            RleCodec.compressed_prefix(prefix, header, 0)[0]
+                        )
+                        image_size = 0
+                        for chunk in RleCodec.encode_rows(header, read_row):
+                            writer.write(chunk)
+                            image_size += len(chunk)
+                        writer.patch(
+                            0,
+                            RleCodec.compressed_prefix(
+                                prefix, header, image_size
+                            )[0]
+                        )
+                    else:
+                        writer.write(prefix)
+                        for y in rows:
+                            writer.write(read_row(y))
+                            writer.write(padding)
+                stage.add(bytes_written=writer.bytes_written)
+        except Exception as e:
+            raise RuntimeError(
+                f"Dosya yazma sırasında beklenmedik bir hata oluştu: {e}"
+            )
+        
+    
+    @staticmethod
+    @Metrics.measure(
+        "add_grid", lambda result: ImageResizer._count_pixels(result)
+    )
+    def add_grid(
+        data: bytearray | BmpImage,
+        *,
+        grid_size: str,
+        grid_color: str = "white",
+        workers: int = 1
+    ) -> bytearray | BmpImage:
+        """
+        Resme ızgara ekler.
+
+        Args:
+            data (bytearray | BmpImage): Grid eklenecek içerik. 'BmpImage'
+            verilirse sonuç da 'BmpImage' olarak döndürülür.
+            grid_size (int): Grid karelerinin boyutu (piksel cinsinden).
+            grid_color (str): Grid piksellerinin rengi.
+            workers (int): Büyük resimlerde kullanılacak işçi süreç sayısı.
+
+        Raises:
+            ValueError: İçerik geçerli bir BMP dosyası değilse.
+            ValueError: Tanımlanmamış bir renk girilmişse.
+            TypeError: Sayısal bir metin değeri girilmemişse.
+            ValueError: Grid boyutu 1'den küçükse.
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+            RuntimeError: Paralel çizim sırasında beklenmeyen bir hata
+            oluşmuşsa.
+        """
+        image = ImageResizer._as_image(data)  # ValueError
+        header = image.header
+
+        grid_size, pixel = ImageResizer._validate_grid(
+            header, grid_size=grid_size, grid_color=grid_color
+        )  # ValueError, TypeError
+        templates = ImageResizer._grid_templates(
+            header.width,
+            grid_size=grid_size,
+            pixel=pixel,
+            bit_depth=header.bit_depth
+        )
+
+        # Izgara, sol alt köşeden başlar. Yukarıdan aşağıya sıralı
+        # dosyalarda satır sırası tersine çevrilerek hesaplanır:
+        # (y - (height - 1)) % grid_size == 0
+        row_index_offset = 1 - header.height if header.top_down else 0
+
+        grid_args = {
+            "stride": header.stride,
+            "grid_size": grid_size,
+            "row_index_offset": row_index_offset,
+            **templates
+        }
+
+        # Büyük resimler, yatay bantlar halinde işçi süreçlerde çizilir.
+        if ParallelRenderer.should_split(
+            header.width * header.height, workers
+        ):
+            ParallelRenderer.paint_grid(
+                image.pixels,
+                workers=workers,
+                row_count=header.height,
+                **grid_args
+            )  # RuntimeError
+        else:
+            # Piksel dizisi kopyalanmadan, 'memoryview' üzerinden yerinde
+            # güncellenir.
+            ImageResizer.backend.paint_grid_rows(
+                image.pixels,
+                first_row=0,
+                last_row=header.height,
+                **grid_args
+            )
+
+        return image if isinstance(data, BmpImage) else image.data
+
+   
+    @staticmethod
+    @Metrics.measure(
+        "resize_image", lambda result: ImageResizer._count_pixels(result)
+    )
+    def resize_image(
+        data: bytearray | BmpImage,
+        *,
+        new_width: str,
+        new_height: str,
+        startx: str,
+        starty: str,
+    ) -> bytearray | BmpImage:
+        """
+        Resmi yeniden boyutlandırır.
+
+        Args:
+            data (bytearray | BmpImage): Yeniden boyutlandırılacak içerik.
+            'BmpImage' verilirse sonuç da 'BmpImage' olarak döndürülür.
+            new_width (str): İstenilen genişlik.
+            new_height (str): İstenilen yükseklik.
+            startx (str): Yatay eksende sol alt köşeye olan uzaklık.
+            starty (str): Dikey eksende sol alt köşeye olan uzaklık.
+
+        Raises:
+            ValueError: İçerik geçerli bir BMP dosyası değilse.
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+            TypeError: 'new_with' için sayısal bir metin değeri girilmemişse.
+            ValueError: '4 <= new_width <= width' değilse.
+            TypeError: 'new_heigth' için sayısal bir metin değeri
+            girilmemişse.
+            ValueError: '4 <= new_height <= height' değilse.
+            TypeError: 'startx' için sayısal bir metin değeri girilmemişse.
+            ValueError: 'startx' negatif bir değerse.
+            ValueError: 'Başlangıç x + Genişlik' orjinal sınırlar dışındaysa.
+            TypeError: 'starty' için sayısal bir metin değeri girilmemişse.
+            ValueError: 'starty' negatif bir değerse.
+            ValueError: 'Başlangıç y + Yükseklik' orjinal sınırlar dışındaysa.
+            ValueError: Mevcut bayt sayısı ve beklenen sayıya eşit değilse.
+        """
+        image = ImageResizer._as_image(data)  # ValueError
+        header = image.header
+
+        packed = ImageResizer._is_packed(header.bit_depth)  # ValueError
+
+        new_width, new_height, startx, starty = ImageResizer._validate_crop(
+            header,
+            new_width=new_width,
+            new_height=new_height,
+            startx=startx,
+            starty=starty
+        )  # ValueError, TypeError
+
+        new_image = BmpImage.blank_like(image, new_width, new_height)
+
+        if packed:
+            # Paketli (1, 4 bit) satırlar bit düzeyinde kesilir; pencere
+            # bayt sınırında başlamıyorsa satır, palet sıraları açılmadan
+            # tek işlemle kaydırılır.
+            for y in range(new_height):
+                new_image.row(y)[:] = ImageResizer._slice_bits(
+                    image.row(y + starty),
+                    startx * header.bit_depth,
+                    new_width * header.bit_depth
+                )
+            return new_image if isinstance(data, BmpImage) else new_image.data
+
+        bytes_per_pixel = ImageResizer._split_bytes(header.bit_depth)
+
+        # Yukarıdan aşağıya sıralı dosyalarda pencerenin dosyadaki ilk
+        # satırı, pencerenin en üst satırıdır.
+        first_row = starty
+        if header.top_down:
+            first_row = header.height - starty - new_height
+
+        # sıra (1, 2, ...) = n, index (0, 1, ...) = n-1 (width, height)
+        # Yalnızca pencere içindeki satırlar, tek dilim olarak kopyalanır.
+        ImageResizer.backend.crop_rows(
+            image.pixels,
+            new_image.pixels,
+            src_stride=header.stride,
+            dst_stride=new_image.header.stride,
+            first_row=first_row,
+            row_count=new_height,
+            row_offset=startx * bytes_per_pixel,
+            row_len=new_width * bytes_per_pixel
+        )
+
+        # Bayt sayılarını kontrol et.
+        ImageResizer._validate_byte_len(
+            byte_len=len(new_image.pixels),
+            excepted_len=new_image.header.stride * new_height
+        )  # ValueError
+
+        return new_image if isinstance(data, BmpImage) else new_image.data
+
+
+    @staticmethod
+    @Metrics.measure(
+        "scale_image", lambda result: ImageResizer._count_pixels(result)
+    )
+    def scale_image(
+        data: bytearray | BmpImage,
+        *,
+        new_width: str,
+        new_height: str,
+        method: Literal["nearest", "bilinear", "box"] = "nearest",
+        workers: int = 1
+    ) -> bytearray | BmpImage:
+        """
+        Resmin çözünürlüğünü değiştirir.
+
+        'resize_image' resmi kırparken, bu metot resmin tamamını seçilen
+        filtre ile yeni genişlik ve yüksekliğe yeniden örnekler.
+
+        Args:
+            data (bytearray | BmpImage): Ölçeklenecek içerik. 'BmpImage'
+            verilirse sonuç da 'BmpImage' olarak döndürülür.
+            new_width (str): İstenilen genişlik.
+            new_height (str): İstenilen yükseklik.
+            method (str): Ölçekleme filtresi (nearest, bilinear, box).
+            workers (int): Büyük resimlerde kullanılacak işçi süreç sayısı.
+
+        Raises:
+            ValueError: İçerik geçerli bir BMP dosyası değilse.
+            ValueError: Tanımlanmamış bir filtre girilmişse.
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+            ValueError: 'bilinear' veya 'box' filtresi 24 ve 32 bit dışında
+            bir bit derinliği ile kullanılmışsa.
+            TypeError: 'new_width' için sayısal bir metin değeri
+            girilmemişse.
+            ValueError: '1 <= new_width' değilse.
+            TypeError: 'new_height' için sayısal bir metin değeri
+            girilmemişse.
+            ValueError: '1 <= new_height' değilse.
+            ValueError: Mevcut bayt sayısı ve beklenen sayıya eşit değilse.
+            RuntimeError: Paralel ölçekleme sırasında beklenmeyen bir hata
+            oluşmuşsa.
+        """
+        image = ImageResizer._as_image(data)  # ValueError
+        header = image.header
+
+        packed = ImageResizer._is_packed(header.bit_depth)  # ValueError
+
+        new_width, new_height = ImageResizer._validate_scale(
+            header, new_width=new_width, new_height=new_height, method=method
+        )  # ValueError, TypeError
+
+        new_image = BmpImage.blank_like(image, new_width, new_height)
+
+        if packed:
+            # Paketli (1, 4 bit) resimler satır satır, palet sıraları
+            # üzerinde tek süreçte ölçeklenir.
+            scaled_row = ImageResizer._packed_scaled_rows(
+                image.row,
+                bit_depth=header.bit_depth,
+                width=header.width,
+                height=header.height,
+                new_width=new_width,
+                new_height=new_height,
+                method=method
+            )
+            for y in range(new_height):
+                new_image.row(y)[:] = scaled_row(y)
+            return new_image if isinstance(data, BmpImage) else new_image.data
+
+        bytes_per_pixel = ImageResizer._split_bytes(header.bit_depth)
+
+        scale_args = {
+            "width": header.width,
+            "height": header.height,
+            "new_width": new_width,
+            "new_height": new_height,
+            "bytes_per_pixel": bytes_per_pixel,
+            "method": method,
+            "top_down": header.top_down
+        }
+
+        # Büyük resimler, yatay bantlar halinde işçi süreçlerde ölçeklenir.
+        if ParallelRenderer.should_split(
+            max(header.width * header.height, new_width * new_height),
+            workers
+        ):
+            ParallelRenderer.scale_pixels(
+                image.pixels,
+                new_image.pixels,
+                workers=workers,
+                **scale_args
+            )  # RuntimeError
+        else:
+            ImageResizer.backend.scale_pixels(
+                image.pixels,
+                new_image.pixels,
+                **scale_args
+            )
+
+        # Bayt sayılarını kontrol et.
+        ImageResizer._validate_byte_len(
+            byte_len=len(new_image.pixels),
+            excepted_len=new_image.header.stride * new_height
+        )  # ValueError
+
+        return new_image if isinstance(data, BmpImage) else new_image.data
+
+
+    @staticmethod
+    @Metrics.measure(
+        "rotate_image", lambda result: ImageResizer._count_pixels(result)
+    )
+    def rotate_image(
+        data: bytearray | BmpImage,
+        *,
+        angle: str
+    ) -> bytearray | BmpImage:
+        """
+        Resmi saat yönünde 90, 180 veya 270 derece döndürür.
+
+        180 derecede satırlar ters sırayla alınıp ters dilimlerle
+        çevrilir ('_flip_row'); piksel başına işlem yapılmaz. 90 ve 270
+        derecede satırlar ve sütunlar yer değiştirir; kaynak, önbelleğe
+        sığan bantlar halinde aktarılır ('_rotate_pixels'). Paketli (1, 4
+        bit) resimler palet sıraları üzerinde döndürülür.
+
+        Args:
+            data (bytearray | BmpImage): Döndürülecek içerik. 'BmpImage'
+            verilirse sonuç da 'BmpImage' olarak döndürülür.
+            angle (str): Saat yönünde açı (90, 180, 270; -90 = 270).
+
+        Raises:
+            ValueError: İçerik geçerli bir BMP dosyası değilse.
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+            TypeError: 'angle' için sayısal bir metin değeri girilmemişse.
+            ValueError: 'angle' 90, 180 veya 270 değilse.
+            ValueError: Mevcut bayt sayısı ve beklenen sayıya eşit değilse.
+        """
+        image = ImageResizer._as_image(data)  # ValueError
+        header = image.header
+
+        packed = ImageResizer._is_packed(header.bit_depth)  # ValueError
+        angle = ImageResizer._validate_rotation(angle)  # TypeError, ValueError
+
+        if angle == 180:
+            new_image = BmpImage.blank_like(image, header.width, header.height)
+            for y in range(header.height):
+                new_image.row(y)[:] = ImageResizer._flip_row(
+                    image.row(header.height - 1 - y),
+                    bit_depth=header.bit_depth,
+                    width=header.width
+                )
+            return new_image if isinstance(data, BmpImage) else new_image.data
+
+        new_image = BmpImage.blank_like(image, header.height, header.width)
+        rotate_args = {
+            "width": header.width,
+            "height": header.height,
+            "clockwise": angle == 90,
+            "top_down": header.top_down
+        }
+
+        if packed:
+            # Satırlar piksel başına bir palet sırasına açılıp 8 bit olarak
+            # döndürülür, ardından tekrar paketlenir.
+            stride = ImageResizer._row_stride(header.width, 8)
+            pixels = bytearray(stride * header.height)
+            for y in range(header.height):
+                start = image.row_index(y) * stride
+                pixels[start:start + header.width] = ImageResizer._unpack_row(
+                    image.row(y), header.bit_depth, header.width
+                )
+            new_stride = ImageResizer._row_stride(header.height, 8)
+            new_pixels = bytearray(new_stride * header.width)
+            ImageResizer.backend.rotate_pixels(
+                memoryview(pixels),
+                memoryview(new_pixels),
+                bit_depth=8,
+                **rotate_args
+            )
+            for y in range(header.width):
+                start = new_image.row_index(y) * new_stride
+                new_image.row(y)[:] = ImageResizer._pack_row(
+                    new_pixels[start:start + header.height], header.bit_depth
+                )
+            return new_image if isinstance(data, BmpImage) else new_image.data
+
+        ImageResizer.backend.rotate_pixels(
+            image.pixels,
+            new_image.pixels,
+            bit_depth=header.bit_depth,
+            **rotate_args
+        )
+
+        # Bayt sayılarını kontrol et.
+        ImageResizer._validate_byte_len(
+            byte_len=len(new_image.pixels),
+            excepted_len=new_image.header.stride * header.width
+        )  # ValueError
+
+        return new_image if isinstance(data, BmpImage) else new_image.data
+
+
+    @staticmethod
+    @Metrics.measure(
+        "flip_image", lambda result: ImageResizer._count_pixels(result)
+    )
+    def flip_image(
+        data: bytearray | BmpImage,
+        *,
+        axis: Literal["horizontal", "vertical"]
+    ) -> bytearray | BmpImage:
+        """
+        Resmi yatay (sağ-sol) veya dikey (alt-üst) eksende aynalar.
+
+        Dikey aynalamada satırlar ters sırayla kopyalanır; yatay aynalamada
+        her satır ters dilimlerle çevrilir ('_flip_row'). Piksel başına
+        işlem yapılmaz.
+
+        Args:
+            data (bytearray | BmpImage): Aynalanacak içerik. 'BmpImage'
+            verilirse sonuç da 'BmpImage' olarak döndürülür.
+            axis (str): 'horizontal' (h) veya 'vertical' (v).
+
+        Raises:
+            ValueError: İçerik geçerli bir BMP dosyası değilse.
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+            ValueError: Tanımlanmamış bir eksen girilmişse.
+        """
+        image = ImageResizer._as_image(data)  # ValueError
+        header = image.header
+
+        ImageResizer._is_packed(header.bit_depth)  # ValueError
+        axis = ImageResizer._validate_flip(axis)  # ValueError
+
+        new_image = BmpImage.blank_like(image, header.width, header.height)
+        for y in range(header.height):
+            if axis == "vertical":
+                new_image.row(y)[:] = image.row(header.height - 1 - y)
+            else:
+                new_image.row(y)[:] = ImageResizer._flip_row(
+                    image.row(y),
+                    bit_depth=header.bit_depth,
+                    width=header.width
+                )
+
+        return new_image if isinstance(data, BmpImage) else new_image.data
+
+
+    @staticmethod
+    @Metrics.measure(
+        "build_pyramid",
+        lambda result: {
+            "pixels": sum(
+                ImageResizer._count_pixels(level)["pixels"]
+                for level in result
+            )
+        }
+    )
+    def build_pyramid(
+        data: bytearray | BmpImage,
+        *,
+        levels: str = None
+    ) -> list[bytearray | BmpImage]:
+        """
+        Resmin 1/2, 1/4, 1/8... boyutlarındaki küçültülmüş kopyalarını
+        (mipmap piramidi) bellekte oluşturur. Satırlar 'pyramid_rows' ile
+        üretilir; seviyeleri bellekte tutmadan dosyalara yazmak için
+        'save_pyramid' kullanılır.
+
+        Args:
+            data (bytearray | BmpImage): Küçültülecek içerik. 'BmpImage'
+            verilirse sonuçlar da 'BmpImage' olarak döndürülür.
+            levels (str): En fazla seviye sayısı. Verilmezse en küçük kenar
+            1 piksele inene kadar devam edilir.
+
+        Returns:
+            list[bytearray | BmpImage]: Büyükten küçüğe seviyeler.
+
+        Raises:
+            'pyramid_sizes' ile aynı istisnalar.
+            ValueError: İçerik geçerli bir BMP dosyası değilse.
+        """
+        image = ImageResizer._as_image(data)  # ValueError
+        sizes = ImageResizer.pyramid_sizes(
+            image.header, levels=levels
+        )  # ValueError, TypeError
+
+        pyramid = [
+            BmpImage.blank_like(image, width, height)
+            for width, height in sizes
+        ]
+        for level, y, row in ImageResizer.pyramid_rows(image, sizes=sizes):
+            pyramid[level].row(y)[:] = row
+
+        if isinstance(data, BmpImage):
+            return pyramid
+        return [level.data for level in pyramid]
+
+
+    @staticmethod
+    def pyramid_sizes(
+        header: BmpHeader,
+        *,
+        levels: str = None
+    ) -> list[tuple[int, int]]:
+        """
+        Piramidin seviyelerinin boyutlarını belirler. Her seviye, önceki
+        seviyenin boyutlarının yarısının tam kısmıdır.
+
+        Returns:
+            list[tuple[int, int]]: Büyükten küçüğe (genişlik, yükseklik).
+
+        Raises:
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+            ValueError: Resmin renk kanalları bayt sınırında değilse (24
+            bit ve maskeleri tam bayt olan 32 bit dışında).
+            TypeError: 'levels' için sayısal bir metin değeri girilmemişse.
+            ValueError: '1 <= levels' değilse.
+            ValueError: Resim 2x2 pikselden küçükse.
+        """
+        if not ImageResizer._has_byte_channels(header):
+            # 16 bit ve maskeli 32 bit kanallar bayt sınırında olmayabilir,
+            # 1, 4 ve 8 bit ise paletin sırasını tutar; bu değerlerin
+            # bayt bayt ortalaması alınamaz.
+            raise ValueError(
+                f"Piramit {header.bit_depth} bit derinliğinde oluşturulamaz."
+            )
+        if levels is not None:
+            levels = ImageResizer._convert_to_int(levels)  # TypeError
+            if levels < 1:
+                raise ValueError(
+                    f"'{levels}' değeri '1 <= Seviye Sayısı' eşitliğini "
+                    "sağlamalıdır."
+                )
+
+        sizes = []
+        width, height = header.width, header.height
+        while width >= 2 and height >= 2:
+            if levels is not None and len(sizes) == levels:
+                break
+            width //= 2
+            height //= 2
+            sizes.append((width, height))
+        if not sizes:
+            raise ValueError(
+                "Piramit için resim en az 2x2 piksel olmalıdır."
+            )
+
+        return sizes
+
+
+    @staticmethod
+    def pyramid_rows(
+        image: BmpImage,
+        *,
+        sizes: list[tuple[int, int]],
+        descending: bool = False
+    ):
+        """
+        Piramidin satırlarını üretildikleri sırayla veren bir üreteç
+        (generator) döndürür.
+
+        Kaynak satırları yalnızca bir kez, sırayla okunur. Her seviye, bir
+        önceki seviyenin iki satırının 2x2 kutu (box) ortalamasıdır; bir
+        seviyede çift tamamlanır tamamlanmaz üretilen satır verilir ve bir
+        sonraki seviyeye aktarılır. Böylece seviye başına en fazla iki satır
+        bellekte tutulur. Tek boyutlarda son satır veya sütun kullanılmaz.
+
+        Args:
+            image (BmpImage): Küçültülecek resim.
+            sizes (list[tuple[int, int]]): Seviyelerin boyutları
+            ('pyramid_sizes').
+            descending (bool): Satırlar yukarıdan aşağıya (y azalarak) mı
+            üretilsin? Her seviyenin satırları aynı sırayla verilir.
+
+        Yields:
+            tuple[int, int, bytearray]: (seviye sırası (0 = 1/2), sol alt
+            köşeye göre satır sırası, dolgu hariç satır)
+        """
+        header = image.header
+        bytes_per_pixel = ImageResizer._split_bytes(header.bit_depth)
+        # Seviye başına, kaynak satırın şerit sayısı kadar yuvarlama payı.
+        halves = [
+            int.from_bytes(
+                (2).to_bytes(length=4, byteorder="little")
+                * (source_width * bytes_per_pixel),
+                byteorder="little"
+            )
+            for source_width in [header.width] + [
+                width for width, _ in sizes[:-1]
+            ]
+        ]
+        # Her seviyede çiftini bekleyen satır.
+        pending = [None] * len(sizes)
+
+        rows = range(header.height)
+        if descending:
+            rows = reversed(rows)
+        for y in rows:
+            row = image.row(y)
+            level = 0
+            while level < len(sizes):
+                new_width, new_height = sizes[level]
+                if y >= 2 * new_height:
+                    # Tek yükseklikte artan son satır kullanılmaz.
+                    break
+                if pending[level] is None:
+                    pending[level] = row
+                    break
+
+                row = ImageResizer._average_rows(
+                    pending[level],
+                    row,
+                    new_width=new_width,
+                    bytes_per_pixel=bytes_per_pixel,
+                    half=halves[level]
+                )
+                pending[level] = None
+                y //= 2
+                yield level, y, row
+                level += 1
+
+
+    @staticmethod
+    def pyramid_paths(
+        file_path: pathlib_path,
+        count: int
+    ) -> list[pathlib_path]:
+        """
+        Piramidin seviye dosyalarının yollarını türetir: <ad>_mip1<uzantı>
+        (1/2), <ad>_mip2<uzantı> (1/4), ...
+
+        Returns:
+            list[pathlib.Path]: Büyükten küçüğe seviye dosyaları.
+        """
+        file_path = pathlib_path(file_path)
+
+        return [
+            file_path.with_name(
+                f"{file_path.stem}_mip{index}{file_path.suffix}"
+            )
+            for index in range(1, count + 1)
+        ]
+
+
+    @staticmethod
+    @Metrics.measure(
+        "save_pyramid",
+        lambda result: {"files": len(result)}
+    )
+    def save_pyramid(
+        data: bytearray | BmpImage | BandedImage,
+        file_path: pathlib_path,
+        *,
+        levels: str = None,
+        rle: bool = False,
+        level: int = PngWriter.DEFAULT_LEVEL,
+        threads: int = 1
+    ) -> list[pathlib_path]:
+        """
+        Piramidin seviyelerini, tam boyutlu bir seviye bellekte
+        oluşturulmadan ayrı dosyalara yazar: <ad>_mip1<uzantı> (1/2),
+        <ad>_mip2<uzantı> (1/4), ...
+
+        Kaynak tek bir geçişte okunur ('pyramid_rows'); her seviye, kendi
+        iş parçacığında çalışan bir 'save_rows' ile kaydedilir ve satırları
+        üretildikçe sınırlı bir kuyruk üzerinden bu yazıcıya aktarılır.
+        Kaynak satırları, yazıcıların satırları isteyeceği sırayla okunur
+        (PNG ve yukarıdan aşağıya sıralı BMP için y azalarak); bu sayede
+        kaynak bant bant da okunabilir ('BandedImage'). Bir seviye
+        yazılamazsa kaynak okunmaya devam edilmez ve diğer seviyelerin
+        yarım dosyaları silinir.
+
+        Args:
+            data (bytearray | BmpImage | BandedImage): Küçültülecek içerik.
+            file_path (pathlib.Path): Seviye dosyalarının adlarının
+            türetileceği yol.
+            levels (str): En fazla seviye sayısı.
+            rle, level, threads: 'save_rows' ile aynı.
+
+        Returns:
+            list[pathlib.Path]: Büyükten küçüğe kaydedilen dosyalar.
+
+        Raises:
+            'pyramid_sizes' ve 'save_rows' ile aynı istisnalar.
+            ValueError: İçerik geçerli bir BMP dosyası değilse.
+        """
+        image = data
+        if not isinstance(data, BandedImage):
+            image = ImageResizer._as_image(data)  # ValueError
+        sizes = ImageResizer.pyramid_sizes(
+            image.header, levels=levels
+        )  # ValueError, TypeError
+        file_path = pathlib_path(file_path)
+        image_format = FileValidator.validate_output_format(
+            file_path
+        )  # ValueError
+
+        paths = ImageResizer.pyramid_paths(file_path, len(sizes))
+        queues = [queue_Queue(maxsize=8) for _ in sizes]
+        # Bir yazıcı hata ile sonlanınca kurulur; diğer seviyelere satır
+        # aktarılması durdurulur.
+        failed = threading_Event()
+
+        def on_done(future):
+            if future.exception() is not None:
+                failed.set()
+
+        def push(futures, index, row):
+            # Bir yazıcı hata ile sonlanmışsa kuyruğu boşalmaz; hata burada
+            # fırlatılır.
+            while not failed.is_set():
+                try:
+                    queues[index].put(row, timeout=0.1)
+                    return
+                except queue_Full:
+                    if futures[index].done():
+                        return
+            for future in futures:
+                if future.done() and future.exception() is not None:
+                    future.result()  # ValueError, RuntimeError
+
+        def stop(futures):
+            # Bekleyen yazıcıların kuyrukları boşaltılır ve geçersiz bir
+            # satır eklenir. Kuyruklara yalnızca bu iş parçacığı yazdığından
+            # ekleme beklemez ve hata fırlatmaz.
+            for future, rows in zip(futures, queues):
+                if future.done():
+                    continue
+                try:
+                    while True:
+                        rows.get_nowait()
+                except queue_Empty:
+                    pass
+                rows.put_nowait(None)
+
+        with futures_ThreadPoolExecutor(max_workers=len(sizes)) as pool:
+            futures = []
+            for (width, height), path, rows in zip(sizes, paths, queues):
+                prefix, header = BmpImage.header_like(image, width, height)
+                futures.append(
+                    pool.submit(
+                        ImageResizer.save_rows,
+                        path,
+                        prefix=prefix,
+                        header=header,
+                        read_row=lambda _, rows=rows: rows.get(),
+                        rle=rle,
+                        level=level,
+                        threads=threads
+                    )
+                )
+                futures[-1].add_done_callback(on_done)
+
+            try:
+                for index, _, row in ImageResizer.pyramid_rows(
+                    image,
+                    sizes=sizes,
+                    descending=image_format == "png"
+                    or image.header.top_down
+                ):
+                    push(futures, index, row)
+            except BaseException:
+                # Bekleyen yazıcılar, geçersiz bir satırla sonlandırılır;
+                # yarım dosyaları 'AtomicWriter' siler.
+                stop(futures)
+                raise
+
+            for future in futures:
+                future.result()  # ValueError, RuntimeError
+
+        return paths
+
+
+    @staticmethod
+    def slice_sizes(
+        header: BmpHeader,
+        *,
+        cell_size: str = None,
+        grid: str = None
+    ) -> tuple[int, int, int, int]:
+        """
+        Karoların boyutunu ve satır, sütun sayısını belirler. Karolar,
+        ızgara gibi ('add_grid') sol alt köşeden başlar; karo boyutu resmin
+        boyutlarını tam bölmüyorsa üstte ve sağda kalan pikseller
+        kullanılmaz.
+
+        Args:
+            header (BmpHeader): Bölünecek resmin başlığı.
+            cell_size (str): Karo boyutu ('GENİŞLİKxYÜKSEKLİK' veya kare
+            karolar için tek değer).
+            grid (str): Satır ve sütun sayısı ('SATIRxSÜTUN' veya tek
+            değer).
+
+        Returns:
+            tuple[int, int, int, int]: (karo genişliği, karo yüksekliği,
+            satır sayısı, sütun sayısı)
+
+        Raises:
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+            ValueError: 'cell_size' ve 'grid' değerlerinden biri
+            verilmemişse veya ikisi birden verilmişse.
+            ValueError: Değer 'AxB' biçiminde değilse.
+            TypeError: Sayısal bir metin değeri girilmemişse.
+            ValueError: Karo resimden büyükse veya bir değer 1'den
+            küçükse.
+        """
+        ImageResizer._is_packed(header.bit_depth)  # ValueError
+        if (cell_size is None) == (grid is None):
+            raise ValueError(
+                "Karo boyutu veya satır x sütun sayısından yalnızca biri "
+                "verilmelidir."
+            )
+
+        value = cell_size if grid is None else grid
+        parts = str(value).lower().split("x")
+        if len(parts) not in (1, 2):
+            raise ValueError(
+                f"Değer 'AxB' biçiminde olmalıdır: {value}"
+            )
+        first = ImageResizer._convert_to_int(parts[0])  # TypeError
+        second = ImageResizer._convert_to_int(parts[-1])  # TypeError
+
+        if grid is None:
+            cell_width, cell_height = first, second
+        else:
+            rows, cols = first, second
+            if not 1 <= rows <= header.height or not 1 <= cols <= header.width:
+                raise ValueError(
+                    f"'{rows}x{cols}' değeri '1 <= Satır <= {header.height}' "
+                    f"ve '1 <= Sütun <= {header.width}' eşitliklerini "
+                    "sağlamalıdır."
+                )
+            cell_width = header.width // cols
+            cell_height = header.height // rows
+
+        if (
+            not 1 <= cell_width <= header.width
+            or not 1 <= cell_height <= header.height
+        ):
+            raise ValueError(
+                f"'{cell_width}x{cell_height}' değeri "
+                f"'1 <= Karo Genişliği <= {header.width}' ve "
+                f"'1 <= Karo Yüksekliği <= {header.height}' eşitliklerini "
+                "sağlamalıdır."
+            )
+
+        return (
+            cell_width,
+            cell_height,
+            header.height // cell_height,
+            header.width // cell_width
+        )
+
+
+    @staticmethod
+    def slice_cells(
+        image: BmpImage | BandedImage,
+        *,
+        cell_width: int,
+        cell_height: int,
+        rows: int,
+        cols: int,
+        skip_empty: bool = False,
+        skip_duplicates: bool = False
+    ):
+        """
+        Karoların piksel dizilerini (dolgu dahil, kaynakla aynı satır
+        yönünde) veren bir üreteç (generator) döndürür.
+
+        Kaynak satırları yalnızca bir kez, dosyadaki sırayla okunur; bu
+        sayede kaynak bant bant da okunabilir ('BandedImage'). Bir karo
+        satırının tüm karoları birlikte oluşturulur: her kaynak satır bir
+        kez alınır ve her karoya tek bir dilim kopyalanır. Bellekte
+        aynı anda yalnızca bir karo satırı bulunur.
+
+        Args:
+            image (BmpImage | BandedImage): Bölünecek resim.
+            cell_width, cell_height, rows, cols: Karoların boyutu ve
+            satır, sütun sayısı ('slice_sizes').
+            skip_empty (bool): Tek renkli (boş) karolar atlansın mı?
+            skip_duplicates (bool): Daha önce verilmiş bir karonun aynısı
+            olan karolar atlansın mı? Karolar, piksel dizilerinin SHA-256
+            özetiyle karşılaştırılır.
+
+        Yields:
+            tuple[int, int, bytearray]: (yukarıdan satır sırası, soldan
+            sütun sırası, karonun piksel dizisi)
+        """
+        header = image.header
+        bit_depth = header.bit_depth
+        packed = ImageResizer._is_packed(bit_depth)  # ValueError
+        stride = ImageResizer._row_stride(cell_width, bit_depth)
+        row_len = (cell_width * bit_depth + 7) // 8
+        seen = set()
+
+        # Karo satırları ve her karonun satırları, kaynağın dosyadaki
+        # sırasıyla oluşturulur.
+        bands = range(rows)
+        cell_rows = range(cell_height)
+        if header.top_down:
+            bands = bands[::-1]
+            cell_rows = cell_rows[::-1]
+
+        for band in bands:
+            cells = [bytearray(stride * cell_height) for _ in range(cols)]
+            start = 0
+            for y in cell_rows:
+                row = image.row(band * cell_height + y)
+                if packed:
+                    bit_len = cell_width * bit_depth
+                    for col, cell in enumerate(cells):
+                        cell[start:start + row_len] = ImageResizer._slice_bits(
+                            row, col * bit_len, bit_len
+                        )
+                else:
+                    offset = 0
+                    for cell in cells:
+                        cell[start:start + row_len] = row[
+                            offset:offset + row_len
+                        ]
+                        offset += row_len
+                start += stride
+
+            for col, cell in enumerate(cells):
+                if skip_empty and ImageResizer._is_uniform(
+                    cell,
+                    width=cell_width,
+                    height=cell_height,
+                    bit_depth=bit_depth
+                ):
+                    continue
+                if skip_duplicates:
+                    digest = hashlib_sha256(cell).digest()
+                    if digest in seen:
+                        continue
+                    seen.add(digest)
+                yield rows - 1 - band, col, cell
+
+
+    @staticmethod
+    def slice_path(
+        file_path: pathlib_path,
+        *,
+        row: int,
+        col: int,
+        rows: int,
+        cols: int
+    ) -> pathlib_path:
+        """
+        Bir karonun dosya yolunu türetir: <ad>/<ad>_r<satır>_c<sütun>
+        <uzantı>. Karolar, adı dosyanın uzantısız adı olan bir klasörde
+        toplanır. Sıralar, dosyalar ada göre sıralandığında karo sırasını
+        korumak için sıfırla doldurulur (örnek: sheet/sheet_r03_c12.bmp).
+
+        Returns:
+            pathlib.Path: Karonun dosya yolu.
+        """
+        file_path = pathlib_path(file_path)
+
+        return file_path.with_suffix("") / ImageResizer._slice_name_format(
+            file_path, rows=rows, cols=cols
+        ).format(row, col)
+
+
+    @staticmethod
+    def _slice_name_format(
+        file_path: pathlib_path,
+        *,
+        rows: int,
+        cols: int
+    ) -> str:
+        """
+        Karo dosyalarının adları için bir biçim metni oluşturan, özel metot
+        (örnek: 'sheet_r{:02d}_c{:03d}.bmp'). Çok sayıda karonun adı, her
+        biri için yol çözümlenmeden bu metinden türetilir.
+
+        Returns:
+            str: Satır ve sütun sırasıyla biçimlendirilecek ad.
+        """
+        row_digits = len(str(rows - 1))
+        col_digits = len(str(cols - 1))
+
+        return (
+            f"{file_path.stem}_r{{:0{row_digits}d}}_c{{:0{col_digits}d}}"
+            f"{file_path.suffix}"
+        )
+
+
+    @staticmethod
+    @Metrics.measure(
+        "save_slices",
+        lambda result: {"files": len(result)}
+    )
+    def save_slices(
+        data: bytearray | BmpImage | BandedImage,
+        file_path: pathlib_path,
+        *,
+        cell_size: str = None,
+        grid: str = None,
+        skip_empty: bool = False,
+        skip_duplicates: bool = False,
+        rle: bool = False,
+        level: int = PngWriter.DEFAULT_LEVEL
+    ) -> list[pathlib_path]:
+        """
+        Resmi karolara bölüp her karoyu ayrı bir dosyaya yazar:
+        <ad>/<ad>_r<satır>_c<sütun><uzantı> (satırlar yukarıdan, sütunlar
+        soldan sayılır).
+
+        Kaynak tek bir geçişte okunur ('slice_cells'); karolar
+        oluşturuldukça bir iş parçacığı havuzunda kaydedilir. Karolar önce
+        geçici bir klasöre, tek tek taşınmadan ve 'os.fsync' çağrılmadan
+        yazılır ('AtomicWriter'); tümü yazılınca klasör, karo klasörünün
+        yerine tek işlemle taşınır. Böylece yazma yarıda kesilirse önceki
+        karolar değişmez ve eksik bir karo klasörü oluşmaz. Yalnızca
+        klasörlerdeki ad değişiklikleri diske işlenir; karoların içeriğini
+        diske işlemek çağıran tarafa bırakılır (toplu işlem, tüm dosyalar
+        bitince bir kez 'os.sync' çağırır).
+
+        Args:
+            data (bytearray | BmpImage | BandedImage): Bölünecek içerik.
+            file_path (pathlib.Path): Karo klasörünün ve dosyalarının
+            adlarının türetileceği yol.
+            cell_size, grid: 'slice_sizes' ile aynı.
+            skip_empty, skip_duplicates: 'slice_cells' ile aynı.
+            rle, level: 'save_image' ile aynı.
+
+        Returns:
+            list[pathlib.Path]: Kaydedilen karo dosyaları.
+
+        Raises:
+            'slice_sizes' ve 'save_image' ile aynı istisnalar.
+            ValueError: İçerik geçerli bir BMP dosyası değilse.
+            RuntimeError: Karo klasörü oluşturulamıyor veya taşınamıyorsa.
+        """
+        image = data
+        if not isinstance(data, BandedImage):
+            image = ImageResizer._as_image(data)  # ValueError
+        cell_width, cell_height, rows, cols = ImageResizer.slice_sizes(
+            image.header, cell_size=cell_size, grid=grid
+        )  # ValueError, TypeError
+        file_path = pathlib_path(file_path)
+        FileValidator.validate_output_format(file_path)  # ValueError
+
+        directory = file_path.with_suffix("")
+        temp_dir = directory.with_name(f".{directory.name}.{os_getpid()}.tmp")
+        old_dir = directory.with_name(f".{directory.name}.{os_getpid()}.old")
+        try:
+            # Çökmüş bir işlemden kalan klasörler silinir.
+            shutil_rmtree(temp_dir, ignore_errors=True)
+            shutil_rmtree(old_dir, ignore_errors=True)
+            temp_dir.mkdir(parents=True)
+        except Exception as e:
+            raise RuntimeError(
+                f"Karo klasörü oluşturulurken beklenmedik bir hata oluştu: {e}"
+            )
+
+        prefix, _ = BmpImage.header_like(image, cell_width, cell_height)
+
+        def save(cells):
+            for name, cell in cells:
+                ImageResizer.save_image(
+                    temp_dir / name,
+                    data=prefix + cell,
+                    rle=rle,
+                    level=level,
+                    staged=True
+                )  # ValueError, RuntimeError
+
+        name_format = ImageResizer._slice_name_format(
+            file_path, rows=rows, cols=cols
+        )
+        writers = ImageResizer._SLICE_WRITERS
+        paths = []
+        pending = collections_deque()
+        try:
+            with futures_ThreadPoolExecutor(max_workers=writers) as pool:
+                # Karolar, iş parçacıkları arasındaki geçişleri azaltmak
+                # için 'AtomicWriter.CHUNK_BYTES' boyutunda gruplar halinde
+                # gönderilir.
+                cells = []
+                cells_bytes = 0
+                for row, col, cell in ImageResizer.slice_cells(
+                    image,
+                    cell_width=cell_width,
+                    cell_height=cell_height,
+                    rows=rows,
+                    cols=cols,
+                    skip_empty=skip_empty,
+                    skip_duplicates=skip_duplicates
+                ):
+                    name = name_format.format(row, col)
+                    cells.append((name, cell))
+                    cells_bytes += len(cell)
+                    paths.append(directory / name)
+                    if cells_bytes < AtomicWriter.CHUNK_BYTES:
+                        continue
+
+                    if len(pending) >= 2 * writers:
+                        pending.popleft().result()  # ValueError, RuntimeError
+                    pending.append(pool.submit(save, cells))
+                    cells = []
+                    cells_bytes = 0
+                if cells:
+                    pending.append(pool.submit(save, cells))
+
+                for future in pending:
+                    future.result()  # ValueError, RuntimeError
+
+            AtomicWriter._sync_dir(temp_dir)
+        except BaseException:
+            shutil_rmtree(temp_dir, ignore_errors=True)
+            raise
+
+        try:
+            # Dolu bir klasörün üzerine taşınamadığından önceki karolar
+            # önce kenara alınır; taşıma başarısız olursa geri konur.
+            if directory.exists():
+                os_replace(directory, old_dir)
+            try:
+                os_replace(temp_dir, directory)
+            except BaseException:
+                if old_dir.exists():
+                    os_replace(old_dir, directory)
+                raise
+            AtomicWriter._sync_dir(directory.parent)
+        except Exception as e:
+            shutil_rmtree(temp_dir, ignore_errors=True)
+            raise RuntimeError(
+                f"Karo klasörü taşınırken beklenmedik bir hata oluştu: {e}"
+            )
+        shutil_rmtree(old_dir, ignore_errors=True)
+
+        return paths
+
+
+
+class PythonBackend:
+    """
+    Yalnızca standart kütüphaneyi kullanan piksel işlemleri. Diğer arka
+    uçlar (backend) kullanılamadığında her zaman geçerli olan varsayılan
+    arka uçtur.
+
+    Arka uçlar aynı imzaya sahip dört metot sağlar ve aynı girdiler için
+    bayt bayt aynı çıktıyı üretir.
+
+    Methods:
+        crop_rows (None): 'ImageResizer._crop_rows' ile aynı.
+        paint_grid_rows (None): 'ImageResizer._paint_grid_rows' ile aynı.
+        scale_pixels (None): 'ImageResizer._scale_pixels' ile aynı.
+        rotate_pixels (None): 'ImageResizer._rotate_pixels' ile aynı.
+    """
+    name = "python"
+
+
+    @staticmethod
+    def crop_rows(pixel_data: memoryview, new_pixels: memoryview, **args):
+        """
+        'ImageResizer._crop_rows' ile aynı.
+        """
+        ImageResizer._crop_rows(pixel_data, new_pixels, **args)
+
+
+    @staticmethod
+    def paint_grid_rows(pixel_data: memoryview, **args) -> None:
+        """
+        'ImageResizer._paint_grid_rows' ile aynı.
+        """
+        ImageResizer._paint_grid_rows(pixel_data, **args)
+
+
+    @staticmethod
+    def scale_pixels(pixel_data: memoryview, new_pixels: memoryview, **args):
+        """
+        'ImageResizer._scale_pixels' ile aynı.
+        """
+        ImageResizer._scale_pixels(pixel_data, new_pixels, **args)
+
+
+    @staticmethod
+    def rotate_pixels(pixel_data: memoryview, new_pixels: memoryview, **args):
+        """
+        'ImageResizer._rotate_pixels' ile aynı.
+        """
+        ImageResizer._rotate_pixels(pixel_data, new_pixels, **args)
+
+
+class NumpyBackend:
+    """
+    NumPy yüklüyse kullanılabilen, vektörel piksel işlemleri.
+
+    Piksel dizisi kopyalanmadan '(satır sayısı, stride)' boyutlarında bir
+    'uint8' dizisi olarak görüntülenir; kırpma dilimleme, ızgara adımlı
+    atama, döndürme eksen değiştirme (transpose), ölçekleme ise toplayıcı
+    indeksler ve ağırlıklı toplamlarla yapılır. Ölçekleme, 'PythonBackend'
+    ile aynı sabit noktalı ağırlıkları ve aynı yuvarlamayı kullandığından
+    çıktılar bayt bayt aynıdır.
+
+    Methods:
+        available (bool): NumPy'nin yüklü olup olmadığını döndürür.
+        _rows (numpy.ndarray): Piksel dizisini satırlara bölünmüş bir
+        görünüme dönüştüren, özel metot.
+        _pad_table (tuple): Ölçekleme tablosunu eşit uzunlukta indeks ve
+        ağırlık dizilerine dönüştüren, özel metot.
+        crop_rows (None): 'ImageResizer._crop_rows' ile aynı.
+        paint_grid_rows (None): 'ImageResizer._paint_grid_rows' ile aynı.
+        scale_pixels (None): 'ImageResizer._scale_pixels' ile aynı.
+        rotate_pixels (None): 'ImageResizer._rotate_pixels' ile aynı.
+    """
+    name = "numpy"
+    # Ölçeklemede bir seferde işlenecek en fazla ara değer sayısı.
+    CHUNK_ELEMENTS = 1 << 22
+
+
+    @staticmethod
+    def available() -> bool:
+        """
+        NumPy'nin yüklü olup olmadığını döndürür.
+        """
+        return numpy is not None
+
+
+    @staticmethod
+    def _rows(buffer: memoryview, stride: int):
+        """
+        Piksel dizisini kopyalamadan '(satır sayısı, stride)' boyutlarında
+        bir görünüme dönüştüren, özel metot. Yazılabilir bir tampon
+        verilirse görünüm de yazılabilirdir.
+        """
+        array = numpy.frombuffer(buffer, dtype=numpy.uint8)
+        row_count = len(array) // stride
+
+        return array[:row_count * stride].reshape(row_count, stride)
+
+
+    @staticmethod
+    def _pad_table(table: list) -> tuple:
+        """
+        Ölçekleme tablosunu, eksik kaynaklar sıfır ağırlıkla tamamlanmış
+        eşit uzunlukta indeks ve ağırlık dizilerine dönüştüren, özel metot.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: (indeksler, ağırlıklar)
+        """
+        tap_count = max(len(indexes) for indexes, _ in table)
+        indexes = numpy.empty((len(table), tap_count), dtype=numpy.intp)
+        weights = numpy.zeros((len(table), tap_count), dtype=numpy.uint32)
+        for i, (row_indexes, row_weights) in enumerate(table):
+            indexes[i, :] = row_indexes[0]
+            indexes[i, :len(row_indexes)] = row_indexes
+            weights[i, :len(row_weights)] = row_weights
+
+        return indexes, weights
+
+
+    @staticmethod
+    def crop_rows(
+        pixel_data: memoryview,
+        new_pixels: memoryview,
+        *,
+        src_stride: int,
+        dst_stride: int,
+        first_row: int,
+        row_count: int,
+        row_offset: int,
+        row_len: int
+    ) -> None:
+        """
+        'ImageResizer._crop_rows' ile aynı; satırlar tek bir dilim
+        atamasıyla kopyalanır.
+        """
+        source = NumpyBackend._rows(pixel_data, src_stride)
+        target = NumpyBackend._rows(new_pixels, dst_stride)
+        target[:row_count, :row_len] = source[
+            first_row:first_row + row_count, row_offset:row_offset + row_len
+        ]
+
+
+    @staticmethod
+    def paint_grid_rows(
+        pixel_data: memoryview,
+        *,
+        stride: int,
+        grid_size: int,
+        line: bytes,
+        column_fills: list[bytes],
+        first_row: int,
+        last_row: int,
+        row_index_offset: int = 0,
+        column_masks: list[tuple[int, int, int, bytes]] = (),
+        word_size: int = 1
+    ) -> None:
+        """
+        'ImageResizer._paint_grid_rows' ile aynı; dikey çizgiler adımlı,
+        ızgara satırları maskeli atamayla boyanır. Paketli resimlerde dikey
+        çizgi baytları tablodan toplanarak (gather) dönüştürülür.
+        """
+        rows = NumpyBackend._rows(pixel_data, stride)[
+            first_row:last_row, :len(line)
+        ]
+        # NumPy'de '%' Python ile aynı işaret kuralını izler.
+        line_rows = (
+            numpy.arange(first_row, last_row) + row_index_offset
+        ) % grid_size == 0
+
+        if column_masks:
+            for first, last, step, table in column_masks:
+                columns = rows[:, first:last:step]
+                columns[...] = numpy.frombuffer(table, dtype=numpy.uint8)[
+                    columns
+                ]
+            rows[line_rows] = numpy.frombuffer(line, dtype=numpy.uint8)
+            return
+
+        bytes_per_pixel = word_size if word_size > 1 else len(column_fills)
+        pixels = rows.reshape(
+            len(rows), len(line) // bytes_per_pixel, bytes_per_pixel
+        )
+        color = numpy.frombuffer(line[:bytes_per_pixel], dtype=numpy.uint8)
+
+        pixels[:, ::grid_size] = color
+        pixels[line_rows] = color
+
+
+    @staticmethod
+    def scale_pixels(
+        pixel_data: memoryview,
+        new_pixels: memoryview,
+        *,
+        width: int,
+        height: int,
+        new_width: int,
+        new_height: int,
+        bytes_per_pixel: int,
+        method: Literal["nearest", "bilinear", "box"],
+        top_down: bool = False,
+        first_row: int = 0,
+        last_row: int = None
+    ) -> None:
+        """
+        'ImageResizer._scale_pixels' ile aynı; her 'tap' için kaynak
+        sütunları toplanıp ağırlıklarla çarpılır, ardından satırlar dikey
+        ağırlıklarla birleştirilir.
+        """
+        if last_row is None:
+            last_row = new_height
+
+        src_stride = ImageResizer._row_stride(width, bytes_per_pixel * 8)
+        dst_stride = ImageResizer._row_stride(new_width, bytes_per_pixel * 8)
+        source = NumpyBackend._rows(pixel_data, src_stride)[
+            :height, :width * bytes_per_pixel
+        ].reshape(height, width, bytes_per_pixel)
+        target = NumpyBackend._rows(new_pixels, dst_stride)[
+            :new_height, :new_width * bytes_per_pixel
+        ].reshape(new_height, new_width, bytes_per_pixel)
+
+        column_table = ImageResizer._scale_table(width, new_width, method)
+        row_table = ImageResizer._scale_table(height, new_height, method)
+        if top_down:
+            # Dosyadaki satır sırası, sol alt köşeye göre sıranın tersidir.
+            row_table = [
+                (tuple(height - 1 - index for index in indexes), weights)
+                for indexes, weights in reversed(row_table)
+            ]
+        column_indexes, column_weights = NumpyBackend._pad_table(column_table)
+        row_indexes, row_weights = NumpyBackend._pad_table(row_table)
+
+        if method == "nearest":
+            # Sütunlar önce kaynak satır sayısı kadar satırda toplanır,
+            # ardından satırlar çoğaltılır.
+            indexes = row_indexes[first_row:last_row, 0]
+            low = int(indexes.min())
+            high = int(indexes.max()) + 1
+            target[first_row:last_row] = source[low:high][
+                :, column_indexes[:, 0]
+            ][indexes - low]
+            return
+
+        # Ara değerler çıktı satırı gruplarıyla sınırlı tutulur.
+        span = -(-height // new_height) + row_indexes.shape[1]
+        chunk = max(
+            1,
+            NumpyBackend.CHUNK_ELEMENTS
+            // (span * new_width * bytes_per_pixel)
+        )
+        half = 1 << (2 * ImageResizer._WEIGHT_BITS - 1)
+
+        for start in range(first_row, last_row, chunk):
+            end = min(start + chunk, last_row)
+            indexes = row_indexes[start:end]
+            low = int(indexes.min())
+            high = int(indexes.max()) + 1
+
+            # Yatay geçiş: yalnızca bu grubun ihtiyaç duyduğu satırlar.
+            # Ağırlıklı toplamlar 32 biti aşmaz (bkz. '_blend_rows').
+            rows = numpy.zeros(
+                (high - low, new_width, bytes_per_pixel), dtype=numpy.uint32
+            )
+            for tap in range(column_indexes.shape[1]):
+                rows += (
+                    source[low:high, column_indexes[:, tap]]
+                    * column_weights[:, tap, None]
+                )
+
+            # Dikey geçiş, yuvarlama ve bayta indirme.
+            new_rows = numpy.full(
+                (end - start, new_width, bytes_per_pixel),
+                half,
+                dtype=numpy.uint32
+            )
+            for tap in range(indexes.shape[1]):
+                new_rows += (
+                    rows[indexes[:, tap] - low]
+                    * row_weights[start:end, tap, None, None]
+                )
+            new_rows >>= 2 * ImageResizer._WEIGHT_BITS
+            target[start:end] = new_rows
+
+
+    @staticmethod
+    def rotate_pixels(
+        pixel_data: memoryview,
+        new_pixels: memoryview,
+        *,
+        width: int,
+        height: int,
+        bit_depth: int,
+        clockwise: bool,
+        top_down: bool = False,
+        first_row: int = 0,
+        last_row: int = None
+    ) -> None:
+        """
+        'ImageResizer._rotate_pixels' ile aynı; kaynak bandının eksenleri
+        yer değiştirilip (transpose) çıktı satırlarının ilgili dilimlerine
+        tek atamayla yazılır.
+        """
+        if last_row is None:
+            last_row = height
+
+        bytes_per_pixel = bit_depth // 8
+        src_stride = ImageResizer._row_stride(width, bit_depth)
+        dst_stride = ImageResizer._row_stride(height, bit_depth)
+        source = NumpyBackend._rows(pixel_data, src_stride)[
+            :last_row - first_row, :width * bytes_per_pixel
+        ].reshape(last_row - first_row, width, bytes_per_pixel)
+        target = NumpyBackend._rows(new_pixels, dst_stride)[
+            :width, :height * bytes_per_pixel
+        ].reshape(width, height, bytes_per_pixel)
+
+        # Sıralar 'ImageResizer._rotate_pixels' ile aynı kurala uyar.
+        columns = source.transpose(1, 0, 2)
+        if clockwise != top_down:
+            columns = columns[::-1]
+        if clockwise == top_down:
+            target[:, height - last_row:height - first_row] = columns[:, ::-1]
+        else:
+            target[:, first_row:last_row] = columns
+
+
+# Arka uç, 'RESIZER_BACKEND' ortam değişkeniyle seçilir (auto, python,
+# numpy). Geçersiz bir değer, standart kütüphane arka ucuna düşer.
+try:
+    ImageResizer.set_backend(os_environ.get("RESIZER_BACKEND", "auto"))
+except ValueError:
+    ImageResizer.set_backend("python")
+
+
+class ParallelRenderer:
+    """
+    Tek bir büyük resmin piksel dizisini yatay bantlara bölerek, bantları
+    işçi süreçlerde paralel olarak işlemek için işlevler sağlar.
+
+    Piksel dizisi süreçlere kopyalanarak (pickle) gönderilmez; bir kez
+    'multiprocessing.shared_memory' bloğuna yazılır, işçiler bloğa adıyla
+    bağlanıp kendi bantlarını yerinde işler ve sonuç bloktan tek seferde
+    geri kopyalanır. Resimler 'bytearray' olarak tutulduğundan bu iki
+    kopya (bellek kopyalama hızında) gereklidir; asıl sabit maliyet olan
+    süreç havuzu ise bir kez başlatılıp sonraki çağrılarda yeniden
+    kullanılır. Küçük resimlerde süreçlere dağıtma maliyeti kazancı
+    aşacağından 'THRESHOLD_PIXELS' altında tek süreçte kalınır.
+
+    Methods:
+        should_split (bool): Resmin paralel işlenmeye değer olup olmadığını
+        belirler.
+        _pool (ProcessPoolExecutor): Çağrılar arasında paylaşılan süreç
+        havuzunu döndüren, özel metot.
+        shutdown (None): Paylaşılan süreç havuzunu kapatır.
+        _bands (list): Satırları işçi sayısı kadar yatay banda bölen, özel
+        metot.
+        _grid_band (None): Bir bandın ızgarasını paylaşılan bellekte çizen,
+        özel metot. İşçi süreçte çalışır.
+        _scale_band (None): Bir bandın çıktı satırlarını paylaşılan bellekte
+        ölçekleyen, özel metot. İşçi süreçte çalışır.
+        paint_grid (None): Izgarayı bantlar halinde paralel olarak çizer.
+        scale_pixels (None): Ölçeklemeyi bantlar halinde paralel olarak
+        yapar.
+    """
+    # Bu piksel sayısının altındaki resimler tek süreçte işlenir.
+    THRESHOLD_PIXELS = 4_000_000
+    # Çağrılar arasında paylaşılan süreç havuzu ve işçi sayısı.
+    _executor = None
+    _executor_workers = 0
+
+
+    @staticmethod
+    def should_split(pixel_count: int, workers: int) -> bool:
+        """
+        Resmin paralel işlenmeye değer olup olmadığını belirler.
+
+        Returns:
+            bool: Birden fazla işçi istenmişse ve piksel sayısı eşiğin
+            üzerindeyse 'True'.
+        """
+        return (
+            workers > 1
+            and pixel_count >= ParallelRenderer.THRESHOLD_PIXELS
+        )
+
+
+    @staticmethod
+    def _pool(workers: int) -> futures_ProcessPoolExecutor:
+        """
+        Çağrılar arasında paylaşılan süreç havuzunu döndüren, özel metot.
+        Havuz ilk çağrıda başlatılır; daha fazla işçi istenirse yeniden
+        başlatılır.
+        """
+        if (
+            ParallelRenderer._executor is None
+            or ParallelRenderer._executor_workers < workers
+        ):
+            ParallelRenderer.shutdown()
+            ParallelRenderer._executor = futures_ProcessPoolExecutor(
+                max_workers=workers
+            )
+            ParallelRenderer._executor_workers = workers
+
+        return ParallelRenderer._executor
+
+
+    @staticmethod
+    def shutdown() -> None:
+        """
+        Paylaşılan süreç havuzunu kapatır. Havuz, yorumlayıcı kapanırken
+        de kapatılır; bu metot havuzu daha önce kapatmak için kullanılır.
+        """
+        if ParallelRenderer._executor is not None:
+            ParallelRenderer._executor.shutdown()
+            ParallelRenderer._executor = None
+            ParallelRenderer._executor_workers = 0
+
+
+    @staticmethod
+    def _bands(row_count: int, band_count: int) -> list[tuple[int, int]]:
+        """
+        Satırları, satır sayıları en fazla bir farklı olan yatay bantlara
+        bölen, özel metot.
+
+        Returns:
+            list[tuple[int, int]]: Her bant için (ilk satır, son satır + 1).
+        """
+        band_count = max(1, min(band_count, row_count))
+        size, extra = divmod(row_count, band_count)
+
+        bands = []
+        first_row = 0
+        for band in range(band_count):
+            last_row = first_row + size + (1 if band < extra else 0)
+            bands.append((first_row, last_row))
+            first_row = last_row
+
+        return bands
+
+
+    @staticmethod
+    def _grid_band(
+        name: str,
+        grid_args: dict,
+        first_row: int,
+        last_row: int
+    ) -> None:
+        """
+        Bir bandın ızgarasını paylaşılan bellekte yerinde çizen, özel metot.
+        İşçi süreçte çalışır.
+        """
+        shared = shared_memory_SharedMemory(name=name)
+        try:
+            ImageResizer.backend.paint_grid_rows(
+                shared.buf,
+                first_row=first_row,
+                last_row=last_row,
+                **grid_args
+            )
+        finally:
+            shared.close()
+
+
+    @staticmethod
+    def _scale_band(
+        src_name: str,
+        dst_name: str,
+        scale_args: dict,
+        first_row: int,
+        last_row: int
+    ) -> None:
+        """
+        Bir bandın çıktı satırlarını paylaşılan bellekte ölçekleyen, özel
+        metot. İşçi süreçte çalışır.
+        """
+        source = shared_memory_SharedMemory(name=src_name)
+        target = shared_memory_SharedMemory(name=dst_name)
+        try:
+            ImageResizer.backend.scale_pixels(
+                source.buf,
+                target.buf,
+                first_row=first_row,
+                last_row=last_row,
+                **scale_args
+            )
+        finally:
+            source.close()
+            target.close()
+
+
+    @staticmethod
+    def paint_grid(
+        pixel_data: memoryview,
+        *,
+        workers: int,
+        row_count: int,
+        **grid_args
+    ) -> None:
+        """
+        Izgarayı, piksel dizisini yatay bantlara bölerek paralel olarak
+        çizer. Sonuç 'pixel_data' üzerine yerinde yazılır.
+
+        Args:
+            pixel_data (memoryview): Yerinde değiştirilecek piksel dizisi.
+            workers (int): İşçi süreç sayısı.
+            row_count (int): Piksel dizisindeki satır sayısı.
+            grid_args: 'ImageResizer._paint_grid_rows' parametreleri.
+
+        Raises:
+            RuntimeError: Paylaşılan bellek veya işçi süreçlerde beklenmeyen
+            bir hata oluşmuşsa.
+        """
+        size = len(pixel_data)
+        try:
+            shared = shared_memory_SharedMemory(create=True, size=size)
+        except Exception as e:
+            raise RuntimeError(
+                f"Paylaşılan bellek oluşturulamadı: {e}"
+            )
+
+        try:
+            shared.buf[:size] = pixel_data
+            executor = ParallelRenderer._pool(workers)
+            futures = [
+                executor.submit(
+                    ParallelRenderer._grid_band,
+                    shared.name,
+                    grid_args,
+                    first_row,
+                    last_row
+                )
+                for first_row, last_row in ParallelRenderer._bands(
+                    row_count, workers
+                )
+            ]
+            for future in futures:
+                future.result()
+            pixel_data[:] = shared.buf[:size]
+        except Exception as e:
+            # Çöken bir işçi havuzu kullanılamaz hale getirir.
+            ParallelRenderer.shutdown()
+            raise RuntimeError(
+                f"Paralel ızgara çizimi sırasında beklenmedik bir hata "
+                f"oluştu: {e}"
+            )
+        finally:
+            shared.close()
+            shared.unlink()
+
+
+    @staticmethod
+    def scale_pixels(
+        pixel_data: memoryview,
+        new_pixels: memoryview,
+        *,
+        workers: int,
+        **scale_args
+    ) -> None:
+        """
+        Ölçeklemeyi, çıktı satırlarını yatay bantlara bölerek paralel olarak
+        yapar. Sonuç 'new_pixels' üzerine yazılır.
+
+        Args:
+            pixel_data (memoryview): Kaynak piksel dizisi.
+            new_pixels (memoryview): Çıktı piksel dizisi (dolgu dahil).
+            workers (int): İşçi süreç sayısı.
+            scale_args: 'ImageResizer._scale_pixels' parametreleri.
+
+        Raises:
+            RuntimeError: Paylaşılan bellek veya işçi süreçlerde beklenmeyen
+            bir hata oluşmuşsa.
+        """
+        src_size = len(pixel_data)
+        dst_size = len(new_pixels)
+        try:
+            source = shared_memory_SharedMemory(create=True, size=src_size)
+        except Exception as e:
+            raise RuntimeError(f"Paylaşılan bellek oluşturulamadı: {e}")
+        try:
+            target = shared_memory_SharedMemory(create=True, size=dst_size)
+        except Exception as e:
+            source.close()
+            source.unlink()
+            raise RuntimeError(f"Paylaşılan bellek oluşturulamadı: {e}")
+
+        try:
+            source.buf[:src_size] = pixel_data
+            executor = ParallelRenderer._pool(workers)
+            futures = [
+                executor.submit(
+                    ParallelRenderer._scale_band,
+                    source.name,
+                    target.name,
+                    scale_args,
+                    first_row,
+                    last_row
+                )
+                for first_row, last_row in ParallelRenderer._bands(
+                    scale_args["new_height"], workers
+                )
+            ]
+            for future in futures:
+                future.result()
+            new_pixels[:] = target.buf[:dst_size]
+        except Exception as e:
+            ParallelRenderer.shutdown()
+            raise RuntimeError(
+                f"Paralel ölçekleme sırasında beklenmedik bir hata oluştu: {e}"
+            )
+        finally:
+            for shared in (source, target):
+                shared.close()
+                shared.unlink()
+
+
+
+class ColorConverter:
+    """
+    Piksel satırlarını bit derinlikleri arasında dönüştürür. Her kaynak
+    biçim (1, 4, 8, 16, 24, 32 bit) önce 24 bit BGR satırlara açılır,
+    ardından hedef biçime (24 bit, 16 bit R5G6B5 veya 8 bit paletli)
+    kodlanır. Kanallar 'translate', dilim ataması ve tablo aramasıyla
+    dönüştürülür; piksel başına Python düzeyinde hesap yalnızca bayt
+    sınırında olmayan 32 bit maskelerde (örneğin 10-10-10-2) yapılır.
+
+    8 bit dönüşümde resim önce bir kez taranır. En fazla 256 farklı renk
+    varsa palet bu renklerden oluşur ve renkler birebir korunur ('exact');
+    aksi halde renkler kanal başına 5 bite (15 bit) indirgenip median-cut
+    ile 256 renge nicemlenir ('median'). 32768 girişlik arama tablosu her
+    15 bitlik rengi paletteki sırasına eşler.
+
+    Methods:
+        validate_convert (int): Dönüşüm değerlerini doğrulayıp hedef bit
+        derinliğini döndürür.
+        _unmask_channel (int): Bir renk kanalını maskeden çıkarıp 8 bite
+        ölçekleyen, özel metot.
+        _word_table (list): 16 bitlik her piksel değerinin BGR
+        karşılığını içeren tabloyu oluşturan, özel metot.
+        bgr_rows (Callable): Satırları 24 bit BGR satırlara dönüştüren
+        fonksiyonu döndürür.
+        _pack_words (bytes): BGR satırındaki kanalları çeviri tablolarıyla
+        16 bitlik sözcüklere paketleyen, özel metot.
+        encode_565 (bytes): BGR satırını R5G6B5 biçimine kodlar.
+        _pixel_keys (array): BGR satırındaki renkleri 24 bitlik
+        tamsayılara dönüştüren, özel metot.
+        _color_keys (array): BGR satırındaki renkleri 15 bitlik arama
+        tablosu sıralarına dönüştüren, özel metot.
+        _median_box (tuple): Median-cut kutusunun bölme önceliğini ve
+        bölünecek kanalını hesaplayan, özel metot.
+        median_cut (tuple): 15 bitlik renk sayımlarından palet ve arama
+        tablosu oluşturur.
+        quantize (tuple): Resmi tarayıp 8 bitlik paleti ve satır
+        kodlayıcısını oluşturur.
+    """
+    METHODS = ("auto", "exact", "median")
+    RGB565_MASKS = (0xF800, 0x07E0, 0x001F, 0)
+    MAX_COLORS = 256
+
+    # (mavi -> düşük bayt, yeşil -> düşük bayt, yeşil -> yüksek bayt,
+    # kırmızı -> yüksek bayt) çeviri tabloları. R5G6B5'te kanallar
+    # '_mask_channel' ile aynı şekilde yuvarlanır; 15 bitlik arama tablosu
+    # sıralarında (R5 << 10 | G5 << 5 | B5) alt bitler atılır.
+    _RGB565_TABLES = (
+        bytes((v * 31 + 127) // 255 for v in range(256)),
+        bytes(((v * 63 + 127) // 255 & 7) << 5 for v in range(256)),
+        bytes((v * 63 + 127) // 255 >> 3 for v in range(256)),
+        bytes((v * 31 + 127) // 255 << 3 for v in range(256)),
+    )
+    _KEY_TABLES = (
+        bytes(v >> 3 for v in range(256)),
+        bytes((v >> 3 & 7) << 5 for v in range(256)),
+        bytes(v >> 6 for v in range(256)),
+        bytes(v >> 3 << 2 for v in range(256)),
+    )
+    # Maskelere göre oluşturulmuş 16 bit tablolar.
+    _WORD_TABLES = {}
+
+
+    @staticmethod
+    def validate_convert(
+        header: BmpHeader,
+        *,
+        bit_depth: str,
+        method: str
+    ) -> int:
+        """
+        Dönüşüm değerlerini doğrulayıp hedef bit derinliğini döndürür.
+
+        Raises:
+            TypeError: Sayısal bir metin değeri girilmemişse.
+            ValueError: Hedef bit derinliği 8, 16 veya 24 değilse.
+            ValueError: Tanımlanmamış bir nicemleme yöntemi girilmişse.
+            ValueError: Kaynağın bit derinliği desteklenmiyorsa.
+        """
+        bit_depth = ImageResizer._convert_to_int(bit_depth)  # TypeError
+        if bit_depth not in (8, 16, 24):
+            raise ValueError(
+                f"Dönüştürülebilecek bit derinlikleri 8, 16 ve 24'tür: "
+                f"{bit_depth}"
+            )
+        if method not in ColorConverter.METHODS:
+            raise ValueError(
+                f"Tanımlanmamış bir nicemleme yöntemi: {method} "
+                f"({', '.join(ColorConverter.METHODS)})"
+            )
+        ImageResizer._is_packed(header.bit_depth)  # ValueError
+
+        return bit_depth
+
+
+    @staticmethod
+    def _unmask_channel(value: int, mask: int) -> int:
+        """
+        Bir piksel değerindeki renk kanalını maskeden çıkarıp 8 bite
+        ölçekleyen ('_mask_channel'ın tersi), özel metot.
+
+        Returns:
+            int: 0-255 arası kanal değeri (maske 0 ise 0).
+        """
+        if not mask:
+            return 0
+        shift = (mask & -mask).bit_length() - 1
+        maximum = mask >> shift
+
+        return (((value & mask) >> shift) * 255 + maximum // 2) // maximum
+
+
+    @staticmethod
+    def _word_table(masks: tuple[int, int, int]) -> list[bytes]:
+        """
+        16 bitlik her piksel değerinin 3 baytlık BGR karşılığını içeren
+        tabloyu oluşturan, özel metot. Tablo maskelere göre bir kez
+        oluşturulup saklanır.
+
+        Args:
+            masks (tuple[int, int, int]): (mavi, yeşil, kırmızı) maskeleri.
+
+        Returns:
+            list[bytes]: 65536 girişlik tablo.
+        """
+        table = ColorConverter._WORD_TABLES.get(masks)
+        if table is None:
+            unmask = ColorConverter._unmask_channel
+            table = [
+                bytes(unmask(word, mask) for mask in masks)
+                for word in range(1 << 16)
+            ]
+            ColorConverter._WORD_TABLES[masks] = table
+
+        return table
+
+
+    @staticmethod
+    def bgr_rows(header: BmpHeader, read_row):
+        """
+        'read_row' ile okunan satırları 24 bit BGR satırlara dönüştüren
+        fonksiyonu döndürür.
+
+        - 24 bit -> Satırlar olduğu gibi döner.
+        - 32 bit (bayt sınırında maskeler) -> Kanallar dilim atamasıyla
+        taşınır, alfa atılır.
+        - 16 bit ve diğer 32 bit maskeler -> Piksel değerleri maskelere göre
+        çözülür (16 bitte 65536 girişlik tablo ile).
+        - 1, 4, 8 bit -> Palet sıraları palet renkleriyle değiştirilir.
+
+        Returns:
+            Callable[[int], bytes]: Sol alt köşeye göre 'y' sırasındaki
+            BGR satırı veren fonksiyon.
+        """
+        width = header.width
+        bit_depth = header.bit_depth
+        masks = (header.blue_mask, header.green_mask, header.red_mask)
+
+        if bit_depth == 24:
+            return read_row
+
+        if ImageResizer._has_byte_channels(header):
+            offsets = [
+                ((mask & -mask).bit_length() - 1) // 8 if mask else None
+                for mask in masks
+            ]
+
+            def bgr_row(y: int) -> bytearray:
+                row = bytes(read_row(y))
+                new_row = bytearray(3 * width)
+                for channel, offset in enumerate(offsets):
+                    if offset is not None:
+                        new_row[channel::3] = row[offset::4]
+                return new_row
+
+            return bgr_row
+
+        if bit_depth in (16, 32):
+            code = "H" if bit_depth == 16 else "I"
+            if bit_depth == 16:
+                decode = ColorConverter._word_table(masks).__getitem__
+            else:
+                def decode(word: int) -> bytes:
+                    return bytes(
+                        ColorConverter._unmask_channel(word, mask)
+                        for mask in masks
+                    )
+
+            def bgr_row(y: int) -> bytes:
+                words = array_array(code)
+                words.frombytes(read_row(y))
+                if sys.byteorder == "big":
+                    words.byteswap()
+                return b"".join(map(decode, words))
+
+            return bgr_row
+
+        # Palette sığmayan sıralar siyah olarak çözülür.
+        colors = [bytes(color) for color in header.palette[:1 << bit_depth]]
+        colors += [bytes(3)] * ((1 << bit_depth) - len(colors))
+
+        def bgr_row(y: int) -> bytes:
+            indexes = read_row(y)
+            if bit_depth < 8:
+                indexes = ImageResizer._unpack_row(indexes, bit_depth, width)
+            return b"".join(map(colors.__getitem__, bytes(indexes)))
+
+        return bgr_row
+
+
+    @staticmethod
+    def _pack_words(row: bytes, tables: tuple) -> bytes:
+        """
+        BGR satırındaki kanalları çeviri tablolarıyla 16 bitlik
+        (little-endian) sözcüklere paketleyen, özel metot. Düşük ve yüksek
+        baytların bitleri çakışmadığından iki kanal tamsayı olarak tek
+        işlemle birleştirilir.
+
+        Args:
+            row (bytes): BGR satırı.
+            tables (tuple): (mavi -> düşük, yeşil -> düşük, yeşil -> yüksek,
+            kırmızı -> yüksek) çeviri tabloları.
+
+        Returns:
+            bytes: Piksel başına 2 bayt.
+        """
+        low_blue, low_green, high_green, high_red = tables
+        row = bytes(row)
+        blue, green, red = row[0::3], row[1::3], row[2::3]
+        width = len(blue)
+
+        words = bytearray(2 * width)
+        words[0::2] = (
+            int.from_bytes(blue.translate(low_blue), byteorder="little")
+            | int.from_bytes(green.translate(low_green), byteorder="little")
+        ).to_bytes(width, byteorder="little")
+        words[1::2] = (
+            int.from_bytes(green.translate(high_green), byteorder="little")
+            | int.from_bytes(red.translate(high_red), byteorder="little")
+        ).to_bytes(width, byteorder="little")
+
+        return bytes(words)
+
+
+    @staticmethod
+    def encode_565(row: bytes) -> bytes:
+        """
+        BGR satırını R5G6B5 (BI_BITFIELDS) biçimine kodlar.
+
+        Returns:
+            bytes: Piksel başına 2 bayt.
+        """
+        return ColorConverter._pack_words(row, ColorConverter._RGB565_TABLES)
+
+
+    @staticmethod
+    def _pixel_keys(row: bytes) -> array_array:
+        """
+        BGR satırındaki renkleri '(R << 16) | (G << 8) | B' biçiminde
+        24 bitlik tamsayılara dönüştüren, özel metot.
+
+        Returns:
+            array.array: Piksel başına bir tamsayı.
+        """
+        row = bytes(row)
+        lanes = bytearray(len(row) // 3 * 4)
+        for channel in range(3):
+            lanes[channel::4] = row[channel::3]
+
+        keys = array_array("I")
+        keys.frombytes(lanes)
+        if sys.byteorder == "big":
+            keys.byteswap()
+
+        return keys
+
+
+    @staticmethod
+    def _color_keys(row: bytes) -> array_array:
+        """
+        BGR satırındaki renkleri, kanal başına 5 bit kullanan 15 bitlik
+        arama tablosu sıralarına dönüştüren, özel metot.
+
+        Returns:
+            array.array: Piksel başına bir sıra (0-32767).
+        """
+        keys = array_array("H")
+        keys.frombytes(
+            ColorConverter._pack_words(row, ColorConverter._KEY_TABLES)
+        )
+        if sys.byteorder == "big":
+            keys.byteswap()
+
+        return keys
+
+
+    @staticmethod
+    def _median_box(keys: list[int], counts: dict) -> tuple:
+        """
+        Median-cut kutusunun bölme önceliğini ve bölünecek kanalını
+        hesaplayan, özel metot. Öncelik, en geniş kanal aralığı ile
+        kutudaki piksel sayısının çarpımıdır; tek renkli kutular
+        bölünmez.
+
+        Returns:
+            tuple: (öncelik, kanal kaydırması, renk sıraları)
+        """
+        best_range = 0
+        best_shift = 0
+        for shift in (10, 5, 0):
+            values = [key >> shift & 31 for key in keys]
+            if max(values) - min(values) > best_range:
+                best_range = max(values) - min(values)
+                best_shift = shift
+
+        score = best_range * sum(map(counts.__getitem__, keys))
+
+        return score, best_shift, keys
+
+
+    @staticmethod
+    def median_cut(counts: dict, colors: int) -> tuple[tuple, bytes]:
+        """
+        15 bitlik renk sayımlarından median-cut ile palet ve arama tablosu
+        oluşturur. Renk uzayı, en geniş kanalı boyunca piksel sayısının
+        ortancasından ikiye bölünerek 'colors' kutuya ayrılır; her kutunun
+        rengi, içindeki renklerin piksel sayısıyla ağırlıklı ortalamasıdır.
+
+        Args:
+            counts (dict): 15 bitlik renk sırası -> piksel sayısı.
+            colors (int): En fazla renk sayısı.
+
+        Returns:
+            tuple[tuple, bytes]: (palet, 32768 baytlık arama tablosu)
+        """
+        boxes = [ColorConverter._median_box(list(counts), counts)]
+        while len(boxes) < colors:
+            index = max(range(len(boxes)), key=lambda i: boxes[i][0])
+            score, shift, keys = boxes[index]
+            if not score:
+                break
+
+            keys.sort(key=lambda key: key >> shift & 31)
+            half = sum(map(counts.__getitem__, keys)) / 2
+            total = 0
+            for split, key in enumerate(keys[:-1], start=1):
+                total += counts[key]
+                if total >= half:
+                    break
+            # Aynı kanal değerine sahip renkler iki kutuya bölünmez.
+            value = keys[split - 1] >> shift & 31
+            while split < len(keys) and keys[split] >> shift & 31 == value:
+                split += 1
+            if split == len(keys):
+                split -= 1
+                while keys[split - 1] >> shift & 31 == value:
+                    split -= 1
+
+            boxes[index] = ColorConverter._median_box(keys[:split], counts)
+            boxes.append(ColorConverter._median_box(keys[split:], counts))
+
+        palette = []
+        table = bytearray(1 << 15)
+        for index, (_, _, keys) in enumerate(boxes):
+            population = sum(map(counts.__getitem__, keys))
+            color = []
+            for shift in (0, 5, 10):
+                total = 0
+                for key in keys:
+                    value = key >> shift & 31
+                    total += (value << 3 | value >> 2) * counts[key]
+                color.append((total + population // 2) // population)
+            palette.append(tuple(color))
+            for key in keys:
+                table[key] = index
+
+        return tuple(palette), bytes(table)
+
+
+    @staticmethod
+    def quantize(
+        bgr_row,
+        *,
+        height: int,
+        method: Literal["auto", "exact", "median"] = "auto"
+    ) -> tuple[tuple, object]:
+        """
+        Resmi bir kez tarayıp 8 bitlik paleti ve BGR satırlarını palet
+        sıralarına dönüştüren kodlayıcıyı oluşturur.
+
+        - exact -> Resimdeki renkler palete birebir alınır.
+        - median -> Renkler median-cut ile 256 renge nicemlenir.
+        - auto -> En fazla 256 renk varsa 'exact', yoksa 'median'.
+
+        Args:
+            bgr_row (Callable[[int], bytes]): BGR satırları veren fonksiyon.
+            height (int): Satır sayısı.
+            method (str): Nicemleme yöntemi.
+
+        Returns:
+            tuple[tuple, Callable[[bytes], bytes]]: (palet, kodlayıcı)
+
+        Raises:
+            ValueError: 'exact' seçilmiş ve resimde 256'dan fazla renk
+            varsa.
+        """
+        exact = method != "median"
+        colors = set()
+        counts = collections_Counter()
+        for y in range(height):
+            row = bgr_row(y)
+            if exact:
+                colors.update(ColorConverter._pixel_keys(row))
+                if len(colors) > ColorConverter.MAX_COLORS:
+                    if method == "exact":
+                        raise ValueError(
+                            f"Resimde {ColorConverter.MAX_COLORS} renkten "
+                            f"fazlası var; 'median' yöntemi kullanılmalı."
+                        )
+                    exact = False
+                    colors = None
+            if method != "exact":
+                counts.update(ColorConverter._color_keys(row))
+
+        if exact:
+            keys = sorted(colors)
+            palette = tuple(
+                (key & 0xFF, key >> 8 & 0xFF, key >> 16) for key in keys
+            )
+            indexes = {key: index for index, key in enumerate(keys)}
+
+            def encode(row: bytes) -> bytes:
+                return bytes(
+                    map(indexes.__getitem__, ColorConverter._pixel_keys(row))
+                )
+
+            return palette, encode
+
+        palette, table = ColorConverter.median_cut(
+            counts, ColorConverter.MAX_COLORS
+        )
+
+        def encode(row: bytes) -> bytes:
+            return bytes(
+                map(table.__getitem__, ColorConverter._color_keys(row))
+            )
+
+        return palette, encode
+
+
+class CropStage:
+    """
+    İşlem hattında (pipeline) resmi kırpan aşama. 'resize_image' ile aynı
+    kuralları ve aynı sonucu verir.
+
+    Methods:
+        key (tuple): Aşamanın normalleştirilmiş parametreleri.
+        bind (tuple): Aşamayı girdi başlığına bağlayıp çıktı başlığını ve
+        satır üreten fonksiyonu döndürür.
+    """
+    __slots__ = ("startx", "starty", "new_width", "new_height")
+
+
+    def __init__(
+        self,
+        *,
+        startx: str,
+        starty: str,
+        new_width: str,
+        new_height: str
+    ) -> None:
+        self.startx = startx
+        self.starty = starty
+        self.new_width = new_width
+        self.new_height = new_height
+
+
+    def key(self) -> tuple:
+        """
+        Aşamanın normalleştirilmiş parametreleri.
+        """
+        return (
+            "crop",
+            int(self.startx),
+            int(self.starty),
+            int(self.new_width),
+            int(self.new_height)
+        )
+
+
+    def bind(self, header: BmpHeader, read_row) -> tuple:
+        """
+        Aşamayı girdi başlığına bağlayıp çıktı başlığını ve satır üreten
+        fonksiyonu döndürür.
+
+        Raises:
+            ValueError, TypeError: Pencere değerleri geçersizse
+            ('resize_image' ile aynı kurallar).
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+        """
+        packed = ImageResizer._is_packed(header.bit_depth)  # ValueError
+        new_width, new_height, startx, starty = ImageResizer._validate_crop(
+            header,
+            new_width=self.new_width,
+            new_height=self.new_height,
+            startx=self.startx,
+            starty=self.starty
+        )  # ValueError, TypeError
+
+        start = startx * header.bit_depth
+        bit_len = new_width * header.bit_depth
+
+        if packed:
+            def cropped_row(y: int) -> bytes | memoryview:
+                # Pencere bayt sınırında başlamıyorsa satır kaydırılır.
+                return ImageResizer._slice_bits(
+                    read_row(y + starty), start, bit_len
+                )
+
+            return header.resized(new_width, new_height), cropped_row
+
+        start //= 8
+        end = start + bit_len // 8
+
+        def cropped_row(y: int) -> memoryview:
+            # Kopyalama yapılmaz; kaynak satırın pencere dilimi döner.
+            return read_row(y + starty)[start:end]
+
+        return header.resized(new_width, new_height), cropped_row
+
+
+class ScaleStage:
+    """
+    İşlem hattında (pipeline) resmi ölçekleyen aşama. 'scale_image' ile
+    aynı kuralları ve aynı sonucu verir.
+
+    Methods:
+        key (tuple): Aşamanın normalleştirilmiş parametreleri.
+        bind (tuple): Aşamayı girdi başlığına bağlayıp çıktı başlığını ve
+        satır üreten fonksiyonu döndürür.
+    """
+    __slots__ = ("new_width", "new_height", "method")
+
+
+    def __init__(
+        self,
+        *,
+        new_width: str,
+        new_height: str,
+        method: Literal["nearest", "bilinear", "box"] = "nearest"
+    ) -> None:
+        self.new_width = new_width
+        self.new_height = new_height
+        self.method = method
+
+
+    def key(self) -> tuple:
+        """
+        Aşamanın normalleştirilmiş parametreleri.
+        """
+        return (
+            "scale", int(self.new_width), int(self.new_height), self.method
+        )
+
+
+    def bind(self, header: BmpHeader, read_row) -> tuple:
+        """
+        Aşamayı girdi başlığına bağlayıp çıktı başlığını ve satır üreten
+        fonksiyonu döndürür.
+
+        Raises:
+            ValueError, TypeError: Ölçekleme değerleri geçersizse
+            ('scale_image' ile aynı kurallar).
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+        """
+        packed = ImageResizer._is_packed(header.bit_depth)  # ValueError
+        new_width, new_height = ImageResizer._validate_scale(
+            header,
+            new_width=self.new_width,
+            new_height=self.new_height,
+            method=self.method
+        )  # ValueError, TypeError
+
+        # Satırlar sol alt köşeye göre sırayla istendiğinden yön
+        # dönüşümü gerekmez.
+        if packed:
+            scaled_row = ImageResizer._packed_scaled_rows(
+                read_row,
+                bit_depth=header.bit_depth,
+                width=header.width,
+                height=header.height,
+                new_width=new_width,
+                new_height=new_height,
+                method=self.method
+            )
+            return header.resized(new_width, new_height), scaled_row
+
+        bytes_per_pixel = ImageResizer._split_bytes(header.bit_depth)
+        scaled_row = ImageResizer._scaled_rows(
+            read_row,
+            width=header.width,
+            height=header.height,
+            new_width=new_width,
+            new_height=new_height,
+            bytes_per_pixel=bytes_per_pixel,
+            method=self.method
+        )
+
+        return header.resized(new_width, new_height), scaled_row
+
+
+class GridStage:
+    """
+    İşlem hattında (pipeline) resme ızgara ekleyen aşama. 'add_grid' ile
+    aynı kuralları ve aynı sonucu verir.
+
+    Methods:
+        key (tuple): Aşamanın normalleştirilmiş parametreleri.
+        bind (tuple): Aşamayı girdi başlığına bağlayıp çıktı başlığını ve
+        satır üreten fonksiyonu döndürür.
+    """
+    __slots__ = ("grid_size", "grid_color")
+
+
+    def __init__(self, *, grid_size: str, grid_color: str = "white") -> None:
+        self.grid_size = grid_size
+        self.grid_color = grid_color
+
+
+    def key(self) -> tuple:
+        """
+        Aşamanın normalleştirilmiş parametreleri.
+        """
+        return ("grid", int(self.grid_size), self.grid_color)
+
+
+    def bind(self, header: BmpHeader, read_row) -> tuple:
+        """
+        Aşamayı girdi başlığına bağlayıp çıktı başlığını ve satır üreten
+        fonksiyonu döndürür.
+
+        Raises:
+            ValueError, TypeError: Izgara değerleri geçersizse ('add_grid'
+            ile aynı kurallar).
+        """
+        grid_size, pixel = ImageResizer._validate_grid(
+            header, grid_size=self.grid_size, grid_color=self.grid_color
+        )  # ValueError, TypeError
+        templates = ImageResizer._grid_templates(
+            header.width,
+            grid_size=grid_size,
+            pixel=pixel,
+            bit_depth=header.bit_depth
+        )
+        line = templates["line"]
+        column_fills = templates["column_fills"]
+        column_masks = templates["column_masks"]
+        word_size = templates["word_size"]
+        step = grid_size * len(column_fills)
+        code = {2: "H", 4: "I"}.get(word_size)
+
+        def gridded_row(y: int) -> bytes | bytearray:
+            if y % grid_size == 0:
+                # Izgara satırı tamamen çizgi rengindedir; kaynak satırın
+                # okunmasına gerek yoktur.
+                return line
+            row = bytearray(read_row(y))
+            if code is not None:
+                memoryview(row).cast(code)[::grid_size] = memoryview(
+                    column_fills[0]
+                ).cast(code)
+                return row
+            for channel, fill in enumerate(column_fills):
+                row[channel::step] = fill
+            for first, last, mask_step, table in column_masks:
+                row[first:last:mask_step] = bytes(
+                    row[first:last:mask_step]
+                ).translate(table)
+            return row
+
+        return header, gridded_row
+
+
+class ConvertStage:
+    """
+    İşlem hattında (pipeline) resmin bit derinliğini dönüştüren aşama.
+    Kaynak herhangi bir desteklenen biçimde olabilir; hedef 24 bit (alfa
+    atılır), 16 bit (R5G6B5) veya 8 bit (paletli) olur.
+
+    Methods:
+        key (tuple): Aşamanın normalleştirilmiş parametreleri.
+        bind (tuple): Aşamayı girdi başlığına bağlayıp çıktı başlığını ve
+        satır üreten fonksiyonu döndürür.
+    """
+    __slots__ = ("bit_depth", "method")
+
+
+    def __init__(
+        self,
+        *,
+        bit_depth: str,
+        method: Literal["auto", "exact", "median"] = "auto"
+    ) -> None:
+        self.bit_depth = bit_depth
+        self.method = method
+
+
+    def key(self) -> tuple:
+        """
+        Aşamanın normalleştirilmiş parametreleri.
+        """
+        return ("convert", int(self.bit_depth), self.method)
+
+
+    def bind(self, header: BmpHeader, read_row) -> tuple:
+        """
+        Aşamayı girdi başlığına bağlayıp çıktı başlığını ve satır üreten
+        fonksiyonu döndürür. 8 bit dönüşümde paleti oluşturmak için girdi
+        satırları bir kez önceden taranır.
+
+        Raises:
+            ValueError, TypeError: Dönüşüm değerleri geçersizse
+            ('ColorConverter.validate_convert' ile aynı kurallar).
+            ValueError: 'exact' yönteminde resimde 256'dan fazla renk
+            varsa.
+        """
+        bit_depth = ColorConverter.validate_convert(
+            header, bit_depth=self.bit_depth, method=self.method
+        )  # ValueError, TypeError
+
+        masks = (
+            header.red_mask,
+            header.green_mask,
+            header.blue_mask,
+            header.alpha_mask
+        )
+        if bit_depth == header.bit_depth and (
+            bit_depth != 16 or masks == ColorConverter.RGB565_MASKS
+        ):
+            # Biçim zaten hedeflenen biçim; satırlar olduğu gibi geçer.
+            return header, read_row
+
+        bgr_row = ColorConverter.bgr_rows(header, read_row)
+
+        if bit_depth == 24:
+            return header.converted(24), bgr_row
+
+        if bit_depth == 16:
+            def converted_row(y: int) -> bytes:
+                return ColorConverter.encode_565(bgr_row(y))
+
+            return header.converted(
+                16, masks=ColorConverter.RGB565_MASKS
+            ), converted_row
+
+        palette, encode = ColorConverter.quantize(
+            bgr_row, height=header.height, method=self.method
+        )  # ValueError
+
+        def converted_row(y: int) -> bytes:
+            return encode(bgr_row(y))
+
+        return header.converted(8, palette=palette), converted_row
+
+
+class RotateStage:
+    """
+    İşlem hattında (pipeline) resmi döndüren veya aynalayan aşama.
+    'rotate_image' ve 'flip_image' ile aynı kuralları ve aynı sonucu
+    verir; 'angle' veya 'axis' değerlerinden yalnızca biri verilir.
+
+    Aynalama ve 180 derece döndürme satır satır yapılır: satırlar ters
+    sırayla istenir ve ters dilimlerle çevrilir. 90 ve 270 derecede
+    çıktının her satırı kaynağın bir sütunu olduğundan, ilk satır
+    istendiğinde kaynak önbelleğe sığan bantlar halinde okunup çıktı bir
+    kez oluşturulur; kaynağın tamamı bellekte tutulmaz. 'bind' için
+    'max_bytes' verilirse çıktı, bu sınıra sığan şeritler halinde
+    oluşturulur: her şerit kaynağın bir sütun aralığıdır ve kaynak her
+    şerit için baştan okunur.
+
+    Methods:
+        key (tuple): Aşamanın normalleştirilmiş parametreleri.
+        bind (tuple): Aşamayı girdi başlığına bağlayıp çıktı başlığını ve
+        satır üreten fonksiyonu döndürür.
+    """
+    __slots__ = ("angle", "axis")
+
+
+    def __init__(self, *, angle: str = None, axis: str = None) -> None:
+        self.angle = angle
+        self.axis = axis
+
+
+    def key(self) -> tuple:
+        """
+        Aşamanın normalleştirilmiş parametreleri.
+        """
+        if self.axis is not None:
+            return ("flip", str(self.axis).strip().lower()[:1])
+        return ("rotate", int(self.angle) % 360)
+
+
+    def bind(
+        self,
+        header: BmpHeader,
+        read_row,
+        *,
+        max_bytes: int = None
+    ) -> tuple:
+        """
+        Aşamayı girdi başlığına bağlayıp çıktı başlığını ve satır üreten
+        fonksiyonu döndürür. 'max_bytes' verilirse 90 ve 270 derecede
+        bellekte tutulan çıktı şeridi bu sınırı aşmaz (en az bir satır).
+
+        Raises:
+            ValueError, TypeError: Açı veya eksen geçersizse
+            ('rotate_image' ve 'flip_image' ile aynı kurallar).
+            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+        """
+        packed = ImageResizer._is_packed(header.bit_depth)  # ValueError
+        width = header.width
+        height = header.height
+        bit_depth = header.bit_depth
+
+        if self.axis is not None:
+            axis = ImageResizer._validate_flip(self.axis)  # ValueError
+            if axis == "vertical":
+                def flipped_row(y: int) -> memoryview:
+                    return read_row(height - 1 - y)
+            else:
+                def flipped_row(y: int) -> bytes | bytearray:
+                    return ImageResizer._flip_row(
+                        read_row(y), bit_depth=bit_depth, width=width
+                    )
+
+            return header, flipped_row
+
+        angle = ImageResizer._validate_rotation(
+            self.angle
+        )  # TypeError, ValueError
+
+        if angle == 180:
+            def rotated_row(y: int) -> bytes | bytearray:
+                return ImageResizer._flip_row(
+                    read_row(height - 1 - y), bit_depth=bit_depth, width=width
+                )
+
+            return header, rotated_row
+
+        # Paketli satırlar piksel başına bir palet sırasına açılıp 8 bit
+        # olarak döndürülür; çıktı satırları istendikçe paketlenir.
+        pixel_depth = 8 if packed else bit_depth
+        bytes_per_pixel = pixel_depth // 8
+        new_stride = ImageResizer._row_stride(height, pixel_depth)
+        row_len = height * bytes_per_pixel
+        strip_rows = width
+        if max_bytes is not None:
+            strip_rows = min(width, max(1, max_bytes // new_stride))
+        # [ilk çıktı satırı, son çıktı satırından sonraki sıra, şerit]
+        strip = [0, 0, None]
+
+        def rotate(first: int, last: int) -> memoryview:
+            # Saat yönünde döndürmede çıktının y satırı kaynağın
+            # 'width - 1 - y' sütunudur, tersinde y sütunudur; şeridin
+            # sütunları ayrı bir resim gibi döndürülür.
+            if angle == 90:
+                column = width - last
+            else:
+                column = first
+            begin = column * bytes_per_pixel
+            end = (column + last - first) * bytes_per_pixel
+            stride = ImageResizer._row_stride(last - first, pixel_depth)
+            new_pixels = bytearray(new_stride * (last - first))
+            for start in range(0, height, ImageResizer._TRANSPOSE_ROWS):
+                stop = min(start + ImageResizer._TRANSPOSE_ROWS, height)
+                band = bytearray((stop - start) * stride)
+                for y in range(start, stop):
+                    row = read_row(y)
+                    if packed:
+                        row = ImageResizer._unpack_row(row, bit_depth, width)
+                    offset = (y - start) * stride
+                    band[offset:offset + end - begin] = row[begin:end]
+                ImageResizer.backend.rotate_pixels(
+                    memoryview(band),
+                    memoryview(new_pixels),
+                    width=last - first,
+                    height=height,
+                    bit_depth=pixel_depth,
+                    clockwise=angle == 90,
+                    first_row=start,
+                    last_row=stop
+                )
+            return memoryview(new_pixels)
+
+        def rotated_row(y: int) -> bytes | memoryview:
+            if not strip[0] <= y < strip[1]:
+                first = y - y % strip_rows
+                last = min(first + strip_rows, width)
+                # Önceki şerit, yenisi oluşturulmadan bırakılır.
+                strip[:] = [first, last, None]
+                strip[2] = rotate(first, last)
+            offset = (y - strip[0]) * new_stride
+            row = strip[2][offset:offset + row_len]
+            if packed:
+                return ImageResizer._pack_row(row, bit_depth)
+            if strip_rows < width:
+                # Yazma kuyruğunda bekleyen satırlar önceki şeridi bellekte
+                # tutmasın diye kopyalanır.
+                return bytes(row)
+            return row
+
+        return header.resized(height, width), rotated_row
+
+
+class Pipeline:
+    """
+    Kırpma, ölçekleme, ızgara, döndürme, aynalama ve bit derinliği
+    dönüşümü işlemlerini tembel (lazy) olarak birleştiren bir işlem hattı
+    (pipeline) sağlar.
+
+    Aşamalar ara sonuç dosyası veya tam boyutlu ara bellek oluşturmaz:
+    her aşama, bir sonraki aşamaya istendiğinde tek bir satır üretir.
+    Çıktının her satırı kaynak satırlar üzerinden tek geçişte hesaplanıp
+    çıktı dizisine bir kez yazılır. Kırpma ilk aşamaysa yalnızca pencere
+    içindeki kaynak satırlar okunur. 8 bit dönüşüm, paleti oluşturmak
+    için girdi satırlarını bir kez önceden tarar; 90 ve 270 derece
+    döndürme, çıktıyı ilk satır istendiğinde bir kez oluşturur.
+
+    Örnek:
+        Pipeline.parse("crop:0,0,640,360|scale:320x180|grid:8,red")
+        Pipeline().crop(startx="0", starty="0", new_width="640",
+        new_height="360").scale(new_width="320", new_height="180")
+
+    Tanım (spec) söz dizimi, '|' ile ayrılmış aşamalardır:
+        crop:x,y,genişlik,yükseklik
+        scale:GENİŞLİKxYÜKSEKLİK[,filtre]
+        grid:boyut[,renk]
+        convert:BİT[,yöntem]  (BİT = 24, 16, 8; yöntem = auto, exact, median)
+        rotate:AÇI  (AÇI = 90, 180, 270; saat yönünde)
+        flip:EKSEN  (EKSEN = h, v veya horizontal, vertical)
+
+    Methods:
+        parse (Pipeline): Metin olarak verilen tanımdan işlem hattı
+        oluşturur.
+        crop, scale, grid, convert, rotate, flip (Pipeline): İşlem hattına
+        aşama ekler.
+        key (tuple): İşlem hattının normalleştirilmiş parametreleri.
+        run (bytearray | BmpImage): İşlem hattını bir resme uygular.
+        run_file (BmpHeader): Bir dosyayı işleyip sonucu satır satır
+        kaydeder.
+        _run_image (BmpHeader): Açılmış bir kaynağı işleyip sonucu
+        kaydeden, özel metot.
+    """
+    __slots__ = ("stages",)
+
+
+    def __init__(self, stages: list = None) -> None:
+        self.stages = list(stages or [])
+
+
+    @staticmethod
+    def parse(spec: str) -> "Pipeline":
+        """
+        Metin olarak verilen tanımdan (örneğin
+        'crop:0,0,640,360|scale:320x180|grid:8,red') işlem hattı oluşturur.
+        Değerler, işlem hattı bir resme uygulanırken doğrulanır.
+
+        Raises:
+            ValueError: Tanım boşsa, tanımlanmamış bir işlem veya eksik
+            parametre girilmişse.
+        """
+        pipeline = Pipeline()
+        for part in spec.split("|"):
+            name, _, args = part.strip().partition(":")
+            name = name.strip().lower()
+            args = [arg.strip() for arg in args.split(",")] if args else []
+
+            if name == "crop" and len(args) == 4:
+                pipeline.crop(
+                    startx=args[0],
+                    starty=args[1],
+                    new_width=args[2],
+                    new_height=args[3]
+                )
+            elif name == "scale" and len(args) in (1, 2):
+                size = args[0].lower().split("x")
+                if len(size) != 2:
+                    raise ValueError(
+                        f"Ölçekleme boyutu 'GENİŞLİKxYÜKSEKLİK' biçiminde "
+                        f"olmalıdır: {args[0]}"
+                    )
+                pipeline.scale(
+                    new_width=size[0],
+                    new_height=size[1],
+                    method=args[1].lower() if len(args) == 2 else "nearest"
+                )
+            elif name == "grid" and len(args) in (1, 2):
+                pipeline.grid(
+                    grid_size=args[0],
+                    grid_color=args[1].lower() if len(args) == 2 else "white"
+                )
+            elif name == "convert" and len(args) in (1, 2):
+                pipeline.convert(
+                    bit_depth=args[0],
+                    method=args[1].lower() if len(args) == 2 else "auto"
+                )
+            elif name == "rotate" and len(args) == 1:
+                pipeline.rotate(angle=args[0])
+            elif name == "flip" and len(args) == 1:
+                pipeline.flip(axis=args[0])
+            elif name in (
+                "crop", "scale", "grid", "convert", "rotate", "flip"
+            ):
+                raise ValueError(f"'{part.strip()}' için eksik parametre.")
+            else:
+                raise ValueError(f"Desteklenmeyen bir işlem: {part.strip()}")
+
+        return pipeline
+
+
+    def crop(
+        self,
+        *,
+        startx: str,
+        starty: str,
+        new_width: str,
+        new_height: str
+    ) -> "Pipeline":
+        """
+        İşlem hattına kırpma aşaması ekler.
+        """
+        self.stages.append(
+            CropStage(
+                startx=startx,
+                starty=starty,
+                new_width=new_width,
+                new_height=new_height
+            )
+        )
+        return self
+
+
+    def scale(
+        self,
+        *,
+        new_width: str,
+        new_height: str,
+        method: Literal["nearest", "bilinear", "box"] = "nearest"
+    ) -> "Pipeline":
+        """
+        İşlem hattına ölçekleme aşaması ekler.
+        """
+        self.stages.append(
+            ScaleStage(
+                new_width=new_width, new_height=new_height, method=method
+            )
+        )
+        return self
+
+
+    def grid(self, *, grid_size: str, grid_color: str = "white") -> "Pipeline":
+        """
+        İşlem hattına ızgara aşaması ekler.
+        """
+        self.stages.append(
+            GridStage(grid_size=grid_size, grid_color=grid_color)
+        )
+        return self
+
+
+    def convert(
+        self,
+        *,
+        bit_depth: str,
+        method: Literal["auto", "exact", "median"] = "auto"
+    ) -> "Pipeline":
+        """
+        İşlem hattına bit derinliği dönüşümü aşaması ekler.
+        """
+        self.stages.append(ConvertStage(bit_depth=bit_depth, method=method))
+        return self
+
+
+    def rotate(self, *, angle: str) -> "Pipeline":
+        """
+        İşlem hattına döndürme aşaması ekler.
+        """
+        self.stages.append(RotateStage(angle=angle))
+        return self
+
+
+    def flip(self, *, axis: Literal["horizontal", "vertical"]) -> "Pipeline":
+        """
+        İşlem hattına aynalama aşaması ekler.
+        """
+        self.stages.append(RotateStage(axis=axis))
+        return self
+
+
+    def key(self) -> tuple:
+        """
+        İşlem hattının normalleştirilmiş parametreleri.
+
+        Raises:
+            TypeError: Sayısal bir metin değeri girilmemişse.
+        """
+        try:
+            return tuple(stage.key() for stage in self.stages)
+        except ValueError as e:
+            raise TypeError(f"Aşama parametreleri tamsayı değil: {e}")
+
+
+    @Metrics.measure(
+        "pipeline", lambda result: ImageResizer._count_pixels(result)
+    )
+    def run(self, data: bytearray | BmpImage) -> bytearray | BmpImage:
+        """
+        İşlem hattını bir resme uygular. Tüm aşamalar önce doğrulanır,
+        ardından çıktı satırları tek geçişte hesaplanır.
+
+        Args:
+            data (bytearray | BmpImage): İşlenecek içerik. 'BmpImage'
+            verilirse sonuç da 'BmpImage' olarak döndürülür. Kaynak
+            değiştirilmez.
+
+        Raises:
+            ValueError: İçerik geçerli bir BMP dosyası değilse.
+            ValueError, TypeError: Aşama değerleri geçersizse.
+        """
+        image = ImageResizer._as_image(data)  # ValueError
+
+        header = image.header
+        read_row = image.row
+        for stage in self.stages:
+            header, read_row = stage.bind(
+                header, read_row
+            )  # ValueError, TypeError
+
+        prefix, header = BmpImage.header_for(image, header)
+        new_data = bytearray(header.file_size)
+        new_data[:header.pixel_offset] = prefix
+        new_image = BmpImage(new_data, header)
+        for y in range(header.height):
+            new_image.row(y)[:] = read_row(y)
+
+        return new_image if isinstance(data, BmpImage) else new_image.data
+
+
+    @Metrics.measure(
+        "pipeline",
+        lambda header: {"pixels": header.width * header.height}
+    )
+    def run_file(
+        self,
+        source: pathlib_path,
+        output: pathlib_path,
+        *,
+        rle: bool = False,
+        level: int = PngWriter.DEFAULT_LEVEL,
+        threads: int = 1,
+        image: BmpImage | BandedImage = None,
+        max_memory: int = None
+    ) -> BmpHeader:
+        """
+        Bir dosyayı işleyip sonucu kaydeder. Kaynak dosya belleğe eşlenir;
+        böylece yalnızca işlem hattının ihtiyaç duyduğu satırlar okunur.
+        Kaynak önceden açılmışsa (örneğin içerik özeti için eşlenmişse)
+        'image' ile verilebilir; dosya tekrar açılmaz. 'max_memory'
+        verilirse kaynak eşlenmez; bu sınıra göre boyutlandırılmış bantlar
+        halinde okunur ('BandedImage'); 90 ve 270 derece döndürmenin çıktısı
+        da sınırın 'BandedImage.BAND_SHARE' payına sığan şeritler halinde
+        oluşturulur ('RotateStage.bind').
+        Çıktı satırları hesaplandıkça dosyaya yazılır; çıktının tamamı
+        bellekte tutulmaz. 'rle' verilirse 4 ve 8 bit çıktılar RLE ile
+        sıkıştırılır; '.png' uzantılı çıktılar 'level' düzeyinde ve
+        'threads' iş parçacığıyla PNG olarak kaydedilir
+        ('ImageResizer.save_rows').
+
+        Returns:
+            BmpHeader: Kaydedilen resmin (sıkıştırılmamış) başlığı.
+
+        Raises:
+            'ImageResizer.open_image', 'BandedImage.open', 'run' ve
+            'ImageResizer.save_rows' ile aynı istisnalar.
+        """
+        options = {
+            "rle": rle,
+            "level": level,
+            "threads": threads,
+            "max_memory": max_memory
+        }
+        if image is not None:
+            return self._run_image(image, output, **options)
+        if max_memory is not None:
+            with BandedImage.open(source, max_memory=max_memory) as image:
+                return self._run_image(image, output, **options)
+
+        image = ImageResizer.open_image(source, use_mmap=True)
+        return self._run_image(image, output, **options)
+
+
+    def _run_image(
+        self,
+        image: BmpImage | BandedImage,
+        output: pathlib_path,
+        *,
+        rle: bool,
+        level: int,
+        threads: int,
+        max_memory: int
+    ) -> BmpHeader:
+        """
+        Açılmış bir kaynağı işleyip sonucu kaydeden, özel metot
+        ('run_file').
+
+        Raises:
+            'run' ve 'ImageResizer.save_rows' ile aynı istisnalar.
+        """
+        header = image.header
+        read_row = image.row
+        for stage in self.stages:
+            if max_memory is not None and isinstance(stage, RotateStage):
+                header, read_row = stage.bind(
+                    header,
+                    read_row,
+                    max_bytes=max_memory // BandedImage.BAND_SHARE
+                )  # ValueError, TypeError
+                continue
+            header, read_row = stage.bind(
+                header, read_row
+            )  # ValueError, TypeError
+
+        prefix, header = BmpImage.header_for(image, header)
+        ImageResizer.save_rows(
+            output,
+            prefix=prefix,
+            header=header,
+            read_row=read_row,
+            rle=rle,
+            level=level,
+            threads=threads
+        )  # ValueError, RuntimeError
+
+        return header
+
+
+
+class ResultCache:
+    """
+    İşlenmiş resimleri, kaynak dosyanın içeriğine ve normalleştirilmiş
+    işlem parametrelerine göre adreslenen (content-addressed) bir önbellek
+    klasöründe saklar. Aynı kaynağa aynı işlemler tekrar uygulandığında
+    sonuç yeniden hesaplanmaz, önbellekten okunur.
+
+    Kaynak dosyanın özeti (SHA-256), dosyanın (yol, boyut, değişiklik
+    zamanı) bilgisiyle birlikte bir dizin dosyasında tutulur; dosya
+    değişmemişse tamamı tekrar okunup özetlenmez. Dizin, her yeni özet için
+    tek bir satırın eklendiği bir JSONL dosyasıdır; dosyanın tamamı yalnızca
+    sıkıştırılırken yeniden yazılır. Önbellek boyutu 'max_bytes' değerini
+    aşarsa en uzun süredir kullanılmayan (LRU) sonuçlar silinir ve dizin,
+    artık sonucu kalmayan kaynakların kayıtları çıkarılarak sıkıştırılır.
+    Toplam boyut, her sonuç için bir satır eklenen küçük bir kayıtta
+    ('SIZE_NAME') tutulur; klasör yalnızca sınır aşıldığında taranır.
+    Kullanım zamanı, sonuç dosyasının değişiklik zamanı olarak saklanır.
+    Sonuç dosyalarının adları kaynak özetinin ilk karakterleriyle başlar;
+    böylece hangi kaynakların sonucu kaldığı dosya adlarından anlaşılır.
+
+    Önbellek hataları işlemi durdurmaz; okunamayan bir sonuç, önbellekte
+    yokmuş gibi yeniden hesaplanır.
+
+    Attributes:
+        directory (pathlib.Path): Önbellek klasörü.
+        max_bytes (int): Önbellekteki sonuçların toplam boyut sınırı.
+
+    Methods:
+        default_directory (pathlib.Path): Varsayılan önbellek klasörünü
+        döndürür.
+        source_hash (str): Kaynak dosyanın içerik özetini döndürür.
+        hash_file (str): Dosyanın içerik özetini hesaplar.
+        key (str): Kaynak özeti ve işlem parametrelerinden sonuç anahtarını
+        oluşturur.
+        _load_index (dict): Kaynak özetlerinin dizinini okuyan, özel metot.
+        _write_atomic (None): İçeriği geçici bir dosyaya yazıp hedefin
+        üzerine taşıyan, özel metot.
+        _compact_index (None): Dizini, sonucu kalan kaynakların son
+        kayıtlarıyla yeniden yazan, özel metot.
+        get (bytearray | None): Anahtara ait sonucu okur.
+        put (None): Sonucu önbelleğe yazar.
+        _add_size (int | None): Toplam boyut kaydına bir artış ekleyip
+        güncel toplamı döndüren, özel metot.
+        _evict (None): Boyut sınırı aşılmışsa en eski sonuçları silen, özel
+        metot.
+    """
+    # Çıktıyı etkileyen bir algoritma değişikliğinde artırılır; eski
+    # sonuçlar bu sayede kullanılmaz.
+    VERSION = 2
+    DEFAULT_MAX_BYTES = 256 * 2**20
+    INDEX_NAME = "index.jsonl"
+    SIZE_NAME = "size.log"
+    # Sonuç dosyasının adında tutulan kaynak özeti uzunluğu.
+    SOURCE_PREFIX = 16
+    # Dizindeki eski kayıt sayısı bu değeri aşarsa dizin sıkıştırılır.
+    MAX_STALE_LINES = 1024
+
+    __slots__ = ("directory", "max_bytes", "_index", "_index_lines")
+
+
+    def __init__(
+        self,
+        directory: pathlib_path = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = pathlib_path(
+            directory or ResultCache.default_directory()
+        )
+        self.max_bytes = max_bytes
+        self._index = None
+        self._index_lines = 0
+
+
+    @staticmethod
+    def default_directory() -> pathlib_path:
+        """
+        Varsayılan önbellek klasörünü ('data/cache') döndürür.
+        """
+        return FilePathManager.get_py_or_exe_dir() / "data" / "cache"
+
+
+    def _load_index(self) -> dict:
+        """
+        Kaynak özetlerinin dizinini okuyan, özel metot. Aynı yolun sonraki
+        kayıtları öncekilerin yerine geçer. Dizin yoksa boş bir dizinle
+        devam edilir; bozuk satırlar (örneğin yarım kalmış bir ekleme)
+        atlanır.
+        """
+        if self._index is None:
+            self._index = {}
+            self._index_lines = 0
+            try:
+                lines = (self.directory / ResultCache.INDEX_NAME).read_text(
+                    encoding="utf-8"
+                ).splitlines()
+            except OSError:
+                lines = []
+            for line in lines:
+                try:
+                    path_key, size, mtime, source_hash = json_loads(line)
+                except (ValueError, TypeError):
+                    continue
+                self._index[path_key] = [size, mtime, source_hash]
+                self._index_lines += 1
+
+        return self._index
+
+
+    def _write_atomic(self, file_path: pathlib_path, data: bytes) -> None:
+        """
+        İçeriği geçici bir dosyaya yazıp hedefin üzerine taşıyan, özel
+        metot. Aynı anda çalışan süreçler yarım yazılmış bir dosya görmez.
+        """
+        with AtomicWriter(file_path) as writer:
+            writer.write(data)
+
+
+    def source_hash(self, file_path: pathlib_path) -> str:
+        """
+        Kaynak dosyanın içerik özetini döndürür. Dosyanın yolu, boyutu ve
+        değişiklik zamanı dizindeki kayıtla aynıysa dosya okunmaz.
+
+        Raises:
+            OSError: Kaynak dosya okunamıyorsa.
+        """
+        stat = os_stat(file_path)
+        index = self._load_index()
+        path_key = str(pathlib_path(file_path).resolve())
+
+        entry = index.get(path_key)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+
+        source_hash = ResultCache.hash_file(file_path)
+
+        index[path_key] = [stat.st_size, stat.st_mtime_ns, source_hash]
+        # Kayıt tek bir yazma çağrısıyla dosyanın sonuna eklenir; aynı anda
+        # ekleyen süreçlerin satırları birbirine karışmaz.
+        line = json_dumps(
+            [path_key, stat.st_size, stat.st_mtime_ns, source_hash]
+        ) + "\n"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(
+                self.directory / ResultCache.INDEX_NAME, "ab", buffering=0
+            ) as file:
+                file.write(line.encode("utf-8"))
+            self._index_lines += 1
+        except OSError:
+            pass
+
+        return source_hash
+
+
+    @staticmethod
+    def hash_file(file_path: pathlib_path) -> str:
+        """
+        Dosyanın içerik özetini (SHA-256) sabit boyutlu bir tampon ile
+        parça parça okuyarak hesaplar.
+
+        Returns:
+            str: Onaltılık (hex) özet.
+
+        Raises:
+            OSError: Dosya okunamıyorsa.
+        """
+        digest = hashlib_sha256()
+        buffer = bytearray(1 << 20)
+        view = memoryview(buffer)
+        with open(file_path, "rb", buffering=0) as file:
+            while count := file.readinto(buffer):
+                digest.update(view[:count])
+
+        return digest.hexdigest()
+
+
+    @staticmethod
+    def key(source_hash: str, params: tuple) -> str:
+        """
+        Kaynak özeti ve normalleştirilmiş işlem parametrelerinden (örneğin
+        'Pipeline.key') sonuç anahtarını oluşturur. Anahtar, kaynak
+        özetinin ilk 'SOURCE_PREFIX' karakteriyle başlar.
+
+        Returns:
+            str: '<kaynak özeti öneki>-<onaltılık (hex) özet>' anahtarı.
+        """
+        digest = hashlib_sha256(
+            repr((ResultCache.VERSION, source_hash, params)).encode("utf-8")
+        ).hexdigest()
+
+        return f"{source_hash[:ResultCache.SOURCE_PREFIX]}-{digest}"
+
+
+    def get(self, key: str) -> bytearray | None:
+        """
+        Anahtara ait sonucu okur ve kullanım zamanını günceller.
+
+        Returns:
+            bytearray | None: Sonuç veya önbellekte yoksa None.
+        """
+        file_path = self.directory / f"{key}.bmp"
+        try:
+            data = bytearray(file_path.read_bytes())
+            os_utime(file_path)
+        except OSError:
+            return None
+
+        return data
+
+
+    def put(self, key: str, data: bytearray) -> None:
+        """
+        Sonucu önbelleğe yazar ve toplam boyut sınırı aşılmışsa en eski
+        sonuçları siler. Klasör yalnızca sınır aşıldığında, boyut kaydı
+        yoksa veya dizinde çok sayıda eski kayıt birikmişse taranır.
+        Sonuç tek başına boyut sınırını aşıyorsa saklanmaz.
+        """
+        if len(data) > self.max_bytes:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(self.directory / f"{key}.bmp", data)
+            total = self._add_size(len(data))
+            stale = self._index_lines - len(self._load_index())
+            if (
+                total is None
+                or total > self.max_bytes
+                or stale > ResultCache.MAX_STALE_LINES
+            ):
+                self._evict()
+        except OSError:
+            pass
+
+
+    def _add_size(self, size: int) -> int | None:
+        """
+        Sonuçların toplam boyutunu tutan kayda ('SIZE_NAME') bir artış
+        ekleyip güncel toplamı döndüren, özel metot. Artış tek bir yazma
+        çağrısıyla dosyanın sonuna eklenir; aynı anda ekleyen süreçlerin
+        satırları birbirine karışmaz. Satır sayısı 'MAX_STALE_LINES'
+        değerini aşarsa kayıt tek satıra indirilir.
+
+        Aynı sonucu yazan süreçler boyutu iki kez ekleyebilir; kayıt tek
+        satıra indirilirken başka bir sürecin eklediği satır ise
+        kaybolabilir ('_compact_index' gibi). Toplamdaki sapma, sınır
+        aşılınca yapılan taramada ('_evict') düzeltilir.
+
+        Returns:
+            int | None: Toplam boyut; kayıt yoksa veya okunamıyorsa None.
+
+        Raises:
+            OSError: Kayda yazılamıyorsa.
+        """
+        file_path = self.directory / ResultCache.SIZE_NAME
+        if not file_path.exists():
+            return None
+        with open(file_path, "ab", buffering=0) as file:
+            file.write(f"{size}\n".encode("ascii"))
+
+        lines = file_path.read_bytes().split()
+        try:
+            total = sum(int(line) for line in lines)
+        except ValueError:
+            return None
+        if len(lines) > ResultCache.MAX_STALE_LINES:
+            self._write_atomic(file_path, f"{total}\n".encode("ascii"))
+
+        return total
+
+
+    def _evict(self) -> None:
+        """
+        Önbellekteki sonuçların toplam boyutu sınırı aşmışsa, en uzun
+        süredir kullanılmayan sonuçları silen, özel metot. Sonuç silindiyse
+        veya dizinde çok sayıda eski kayıt birikmişse dizin sıkıştırılır.
+        Taranan gerçek toplam, boyut kaydına ('SIZE_NAME') yazılır.
+        """
+        entries = []
+        total = 0
+        for file_path in self.directory.glob("*.bmp"):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, file_path))
+            total += stat.st_size
+
+        stale = self._index_lines - len(self._load_index())
+        if total <= self.max_bytes:
+            if stale > ResultCache.MAX_STALE_LINES:
+                self._compact_index(entry[2] for entry in entries)
+        else:
+            entries.sort()
+            for count, (_, size, file_path) in enumerate(entries, start=1):
+                file_path.unlink(missing_ok=True)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+            self._compact_index(entry[2] for entry in entries[count:])
+
+        self._write_atomic(
+            self.directory / ResultCache.SIZE_NAME,
+            f"{total}\n".encode("ascii")
+        )
+
+
+    def _compact_index(self, results) -> None:
+        """
+        Dizini, yalnızca sonucu kalan kaynakların son kayıtlarıyla yeniden
+        yazan, özel metot. Sıkıştırma sırasında başka bir sürecin eklediği
+        bir kayıt kaybolabilir; bu durumda kaynak bir sonraki kullanımda
+        yeniden özetlenir.
+
+        Args:
+            results (Iterable[pathlib.Path]): Önbellekte kalan sonuç
+            dosyaları.
+        """
+        prefixes = {
+            file_path.name.split("-", 1)[0] for file_path in results
+        }
+        index = {
+            path_key: entry
+            for path_key, entry in self._load_index().items()
+            if entry[2][:ResultCache.SOURCE_PREFIX] in prefixes
+        }
+        self._write_atomic(
+            self.directory / ResultCache.INDEX_NAME,
+            "".join(
+                json_dumps([path_key] + entry) + "\n"
+                for path_key, entry in index.items()
+            ).encode("utf-8")
+        )
+        self._index = index
+        self._index_lines = len(index)
+
+
+
+class JobQueue:
+    """
+    Toplu işlemin işlerini (kaynak, çıktı, işlem tanımı, durum, sonuç ve
+    süre) 'data/' klasöründeki bir SQLite veritabanında saklayan kalıcı bir
+    iş kuyruğu. Yarıda kalan bir toplu işlem aynı kuyrukla yeniden
+    başlatıldığında tamamlanmış işler atlanır; yalnızca kalan işler
+    işlenir.
+
+    İşçi süreçler işleri kuyruktan kendileri alır ('claim'). Bir işin
+    alınması tek bir yazma işleminde (BEGIN IMMEDIATE) yapıldığından iki
+    süreç aynı işi alamaz. Bir iş, kaynak ve çıktı yollarıyla, çıktıyı
+    etkileyen işlem parametrelerinden ('spec') tanınır; aynı iş tekrar
+    eklenirse yeni bir iş oluşturulmaz, yalnızca başarısız olmuşsa yeniden
+    kuyruğa alınır.
+
+    Bir kuyruk aynı anda tek bir toplu işlem tarafından (onun işçi
+    süreçleriyle) işlenir; işlem başlarken önceki bir çalışmanın yarıda
+    bıraktığı işler yeniden kuyruğa alınır ('recover').
+
+    Attributes:
+        path (pathlib.Path): Veritabanı dosyası.
+
+    Methods:
+        default_path (pathlib.Path): Varsayılan kuyruk dosyasını döndürür.
+        _connect (sqlite3.Connection): Veritabanı bağlantısını açan ve
+        tabloyu oluşturan, özel metot.
+        close (None): Veritabanı bağlantısını kapatır.
+        add (int): İşleri kuyruğa ekler.
+        recover (int): Yarıda kalmış işleri yeniden kuyruğa alır.
+        claim (tuple | None): Sıradaki işi alıp işlenmekte olarak
+        işaretler.
+        finish (None): İşin sonucunu kaydeder.
+        counts (dict): Durumlarına göre iş sayılarını döndürür.
+    """
+    DEFAULT_NAME = "jobs.sqlite3"
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    # Çıktıyı etkilemeyen, yalnızca işin nasıl yürütüleceğini belirleyen
+    # parametreler; işin tanımına ('spec') katılmaz.
+    RUNTIME_OPTIONS = ("workers", "max_memory", "cache", "cache_max_bytes")
+    # Başka bir süreç kuyruğa yazarken beklenecek en uzun süre, sn.
+    TIMEOUT = 60.0
+
+    __slots__ = ("path", "_connection")
+
+
+    def __init__(self, path: pathlib_path = None) -> None:
+        self.path = pathlib_path(path or JobQueue.default_path())
+        self._connection = None
+
+
+    def __enter__(self) -> "JobQueue":
+        return self
+
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+
+    @staticmethod
+    def default_path() -> pathlib_path:
+        """
+        Varsayılan kuyruk dosyasını ('data/jobs.sqlite3') döndürür.
+        """
+        return (
+            FilePathManager.get_py_or_exe_dir() / "data" / JobQueue.DEFAULT_NAME
+        )
+
+
+    def _connect(self) -> sqlite3_Connection:
+        """
+        Veritabanı bağlantısını açan ve tabloyu oluşturan, özel metot.
+        Okuyucuların yazıcıları beklememesi için WAL günlüğü kullanılır.
+
+        Raises:
+            sqlite3.Error: Veritabanı açılamıyorsa.
+            OSError: 'data/' klasörü oluşturulamıyorsa.
+        """
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3_connect(
+                self.path, timeout=JobQueue.TIMEOUT, isolation_level=None
+            )
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS jobs ("
+                    "id INTEGER PRIMARY KEY, "
+                    "source TEXT NOT NULL, "
+                    "output TEXT NOT NULL, "
+                    "command TEXT NOT NULL, "
+                    "spec TEXT NOT NULL, "
+                    "options TEXT NOT NULL, "
+                    "status TEXT NOT NULL, "
+                    "attempts INTEGER NOT NULL DEFAULT 0, "
+                    "worker INTEGER, "
+                    "message TEXT, "
+                    "pixels INTEGER, "
+                    "seconds REAL, "
+                    "started REAL, "
+                    "finished REAL, "
+                    "UNIQUE (source, output, spec))"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS jobs_status "
+                    "ON jobs (status, id)"
+                )
+            except BaseException:
+                connection.close()
+                raise
+            self._connection = connection
+
+        return self._connection
+
+
+    def close(self) -> None:
+        """
+        Veritabanı bağlantısını kapatır.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+    def add(
+        self,
+        command: str,
+        options: dict,
+        sources: list[pathlib_path],
+        outputs: list[pathlib_path]
+    ) -> int:
+        """
+        İşleri tek bir işlemde kuyruğa ekler. Kuyrukta zaten bulunan işler
+        eklenmez; başarısız olmuş olanlar yeniden kuyruğa alınır.
+
+        Args:
+            command (str): İşlem adı (grid, crop, scale, rotate, flip,
+            pyramid, slice, pipeline).
+            options (dict): İşlemin parametreleri ('process_file').
+            sources (list[pathlib.Path]): Kaynak dosyaların yolları.
+            outputs (list[pathlib.Path]): Kaynaklarla aynı sırada çıktı
+            yolları.
+
+        Returns:
+            int: Eklenen veya yeniden kuyruğa alınan iş sayısı.
+
+        Raises:
+            sqlite3.Error: Kuyruğa yazılamıyorsa.
+        """
+        connection = self._connect()
+        spec = json_dumps(
+            [
+                command,
+                {
+                    key: value
+                    for key, value in options.items()
+                    if key not in JobQueue.RUNTIME_OPTIONS
+                }
+            ],
+            sort_keys=True
+        )
+        options = json_dumps(options, sort_keys=True)
+
+        changes = connection.total_changes
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                "INSERT INTO jobs (source, output, command, spec, options, "
+                "status) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (source, output, spec) DO UPDATE SET "
+                "status = excluded.status, options = excluded.options, "
+                "message = NULL "
+                "WHERE status = ?",
+                (
+                    (
+                        str(source),
+                        str(output),
+                        command,
+                        spec,
+                        options,
+                        JobQueue.PENDING,
+                        JobQueue.FAILED
+                    )
+                    for source, output in zip(sources, outputs)
+                )
+            )
+
+        return connection.total_changes - changes
+
+
+    def recover(self) -> int:
+        """
+        Önceki bir çalışmanın yarıda bıraktığı (işlenmekte olarak kalmış)
+        işleri yeniden kuyruğa alır.
+
+        Returns:
+            int: Yeniden kuyruğa alınan iş sayısı.
+
+        Raises:
+            sqlite3.Error: Kuyruğa yazılamıyorsa.
+        """
+        connection = self._connect()
+        with connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = ?, worker = NULL WHERE status = ?",
+                (JobQueue.PENDING, JobQueue.RUNNING)
+            )
+
+        return cursor.rowcount
+
+
+    def claim(self, worker: int) -> tuple[int, str, dict, str, str] | None:
+        """
+        Sıradaki işi alıp işlenmekte olarak işaretler. Seçme ve işaretleme
+        aynı yazma işleminde yapılır; başka bir süreç aynı işi alamaz.
+
+        Args:
+            worker (int): İşi alan sürecin kimliği.
+
+        Returns:
+            tuple[int, str, dict, str, str] | None: (iş numarası, işlem adı,
+            parametreler, kaynak, çıktı) veya kuyrukta iş kalmamışsa None.
+
+        Raises:
+            sqlite3.Error: Kuyruk okunamıyor veya yazılamıyorsa.
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT id, command, options, source, output FROM jobs "
+                "WHERE status = ? ORDER BY id LIMIT 1",
+                (JobQueue.PENDING,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE jobs SET status = ?, worker = ?, started = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                (JobQueue.RUNNING, worker, time_time(), row[0])
+            )
+
+        job_id, command, options, source, output = row
+        return job_id, command, json_loads(options), source, output
+
+
+    def finish(
+        self,
+        job_id: int,
+        *,
+        ok: bool,
+        message: str,
+        pixels: int,
+        seconds: float
+    ) -> None:
+        """
+        İşin sonucunu (durum, çıktı veya hata mesajı, piksel sayısı ve
+        süre) kaydeder.
+
+        Raises:
+            sqlite3.Error: Kuyruğa yazılamıyorsa.
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, message = ?, pixels = ?, "
+                "seconds = ?, finished = ? WHERE id = ?",
+                (
+                    JobQueue.DONE if ok else JobQueue.FAILED,
+                    message,
+                    pixels,
+                    seconds,
+                    time_time(),
+                    job_id
+                )
+            )
+
+
+    def counts(self) -> dict[str, int]:
+        """
+        Durumlarına göre iş sayılarını döndürür.
+
+        Raises:
+            sqlite3.Error: Kuyruk okunamıyorsa.
+        """
+        return dict(
+            self._connect().execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        )
+
+
+
+class BatchProcessor:
+    """
+    Menü kullanılmadan, komut satırından birden fazla dosyayı toplu olarak
+    işlemek için işlevler sağlar. Dosyalar, çekirdek sayısı kadar işçi
+    süreçten (ProcessPoolExecutor) oluşan bir havuza dağıtılır.
+
+    Örnek:
+        resizer.py grid --size 16 --color red images/*.bmp -o edited_images/
+        resizer.py crop --width 640 --height 360 --x 0 --y 0 images/
+        resizer.py scale --width 320 --height 180 --method box images/*.bmp
+        resizer.py pipeline --spec "crop:0,0,640,360|scale:320x180|grid:8,red"
+            images/*.bmp
+        resizer.py pyramid --levels 3 images/
+        resizer.py rotate --angle 90 sprites/
+        resizer.py flip --axis horizontal sprites/*.bmp
+        resizer.py slice --size 16x16 --skip-empty sprites/sheet.bmp
+        resizer.py grid --size 16 --color red sprites/ --cache
+        resizer.py scale --width 320 --height 180 images/ --queue
+        resizer.py grid --size 16 images/ --metrics data/metrics.jsonl
+        resizer.py metrics data/metrics.jsonl
+        resizer.py watch images/ --spec "grid:16,red" --interval 1
+        resizer.py serve --socket /tmp/resizer.sock -w 4
+
+    Methods:
+        build_parser (argparse.ArgumentParser): Toplu işlem komutlarının
+        argüman ayrıştırıcısını oluşturur.
+        expand_inputs (list): Dosya, klasör ve joker karakterli (glob)
+        girdileri işlenecek dosyaların listesine dönüştürür.
+        output_paths (list): Kaynak dosyaların çıktı klasöründeki
+        yollarını, adları çakışmayacak şekilde belirler.
+        process_file (tuple): Tek bir dosyayı işleyip sonucu kaydeder.
+        İşçi süreçlerde çalışır, hata fırlatmaz; sonucu döndürür.
+        _pipeline (Pipeline): Toplu işlem komutunu eşdeğer bir işlem
+        hattına dönüştüren, özel metot.
+        _cache_lookup (tuple): Önbellek açıksa, dosyanın sonucunu
+        önbellekte arayan, özel metot.
+        _compute (bytearray): Bir dosyaya toplu işlem komutunu uygulayan,
+        özel metot.
+        _save_pyramid (list): Piramidin seviyelerini önbellekten veya
+        kaynaktan kaydeden, özel metot.
+        run (int): Ayrıştırılmış argümanlara göre toplu işlemi yürütür.
+        _sync_outputs (None): Tek tek diske işlenmeden yazılan çıktıları
+        toplu işlemin sonunda diske işleyen, özel metot.
+        process_queue (tuple): Kuyrukta iş kalmayana kadar işleri alıp
+        işler. İşçi süreçlerde çalışır.
+        _run_queue (int): Toplu işlemi kalıcı bir iş kuyruğu üzerinden
+        yürüten, özel metot.
+        main (int): Komut satırı argümanlarını ayrıştırıp toplu işlemi
+        başlatır.
+    """
+    @staticmethod
+    def build_parser() -> argparse_ArgumentParser:
+        """
+        Toplu işlem komutlarının argüman ayrıştırıcısını oluşturur.
+
+        Returns:
+            argparse.ArgumentParser: Argüman ayrıştırıcısı.
+        """
+        parser = argparse_ArgumentParser(
+            prog="resizer",
+            description="BMP dosyalarını menü kullanmadan toplu olarak işler."
+        )
+        commands = parser.add_subparsers(dest="command", required=True)
+
+        runtime = argparse_ArgumentParser(add_help=False)
+        runtime.add_argument(
+            "-o", "--output",
+            default=None,
+            help="Çıktı klasörü (varsayılan=edited_images)."
+        )
+        runtime.add_argument(
+            "-w", "--workers",
+            type=int,
+            default=None,
+            help="İşçi süreç sayısı (varsayılan=çekirdek sayısı)."
+        )
+        runtime.add_argument(
+            "--backend",
+            default=None,
+            choices=("auto", "python", "numpy"),
+            help="Piksel işlemlerini yapacak arka uç (varsayılan=auto)."
+        )
+        runtime.add_argument(
+            "--cache",
+            nargs="?",
+            const="",
+            default=None,
+            metavar="KLASÖR",
+            help="Sonuçları önbellekten okur/önbelleğe yazar "
+            "(varsayılan klasör=data/cache)."
+        )
+        runtime.add_argument(
+            "--cache-max-mb",
+            type=int,
+            default=ResultCache.DEFAULT_MAX_BYTES // 2**20,
+            help="Önbellek boyut sınırı, MB (varsayılan=256)."
+        )
+        runtime.add_argument(
+            "--rle",
+            action="store_true",
+            help="4 ve 8 bit çıktıları RLE ile sıkıştırarak kaydeder."
+        )
+        runtime.add_argument(
+            "--format",
+            default="bmp",
+            choices=("bmp", "png"),
+            help="Çıktı dosyalarının biçimi (varsayılan=bmp)."
+        )
+        runtime.add_argument(
+            "--png-level",
+            type=int,
+            default=PngWriter.DEFAULT_LEVEL,
+            choices=range(10),
+            metavar="0-9",
+            help="PNG sıkıştırma düzeyi (varsayılan=6)."
+        )
+        runtime.add_argument(
+            "--metrics",
+            default=None,
+            metavar="HEDEF",
+            help="Aşama ölçümlerini 'stderr'e veya bir JSONL dosyasına yazar."
+        )
+        runtime.add_argument(
+            "--metrics-memory",
+            action="store_true",
+            help="Ölçümlere aşama başına en yüksek bellek ayırmayı ekler."
+        )
+
+        common = argparse_ArgumentParser(add_help=False, parents=[runtime])
+        common.add_argument(
+            "inputs",
+            nargs="+",
+            help="İşlenecek dosyalar, klasörler veya joker karakterli yollar."
+        )
+        common.add_argument(
+            "--max-memory",
+            type=BandedImage.parse_size,
+            default=None,
+            metavar="BOYUT",
+            help="Kaynakları bu bellek sınırına göre bantlar halinde okur "
+            "(örnek: 512M, 4G; birimsiz değerler MB; işçiler arasında "
+            "paylaştırılır)."
+        )
+        common.add_argument(
+            "--queue",
+            nargs="?",
+            const="",
+            default=None,
+            metavar="DOSYA",
+            help="İşleri kalıcı bir kuyruğa yazar; yarıda kalan bir işlem "
+            "aynı komutla sürdürülür (varsayılan=data/jobs.sqlite3)."
+        )
+
+        grid = commands.add_parser(
+            "grid", parents=[common], help="Resimlere ızgara ekler."
+        )
+        grid.add_argument("--size", required=True, help="Grid boyutu.")
+        grid.add_argument("--color", default="white", help="Grid rengi.")
+
+        crop = commands.add_parser(
+            "crop", parents=[common], help="Resimleri kırpar."
+        )
+        crop.add_argument("--width", required=True, help="Yeni genişlik.")
+        crop.add_argument("--height", required=True, help="Yeni yükseklik.")
+        crop.add_argument("--x", default="0", help="Başlangıç x.")
+        crop.add_argument("--y", default="0", help="Başlangıç y.")
+
+        scale = commands.add_parser(
+            "scale", parents=[common], help="Resimleri ölçekler."
+        )
+        scale.add_argument("--width", required=True, help="Yeni genişlik.")
+        scale.add_argument("--height", required=True, help="Yeni yükseklik.")
+        scale.add_argument(
+            "--method",
+            default="nearest",
+            choices=("nearest", "bilinear", "box"),
+            help="Ölçekleme filtresi."
+        )
+
+        rotate = commands.add_parser(
+            "rotate", parents=[common], help="Resimleri döndürür."
+        )
+        rotate.add_argument(
+            "--angle",
+            required=True,
+            choices=("90", "180", "270"),
+            help="Saat yönünde açı."
+        )
+
+        flip = commands.add_parser(
+            "flip", parents=[common], help="Resimleri aynalar."
+        )
+        flip.add_argument(
+            "--axis",
+            required=True,
+            choices=("horizontal", "vertical", "h", "v"),
+            help="Aynalama ekseni (horizontal = sağ-sol, vertical = alt-üst)."
+        )
+
+        pyramid = commands.add_parser(
+            "pyramid",
+            parents=[common],
+            help="Resimlerin 1/2, 1/4, 1/8... boyutlarındaki kopyalarını "
+            "oluşturur."
+        )
+        pyramid.add_argument(
+            "--levels",
+            default=None,
+            help="En fazla seviye sayısı (varsayılan=tümü)."
+        )
+
+        slice_ = commands.add_parser(
+            "slice",
+            parents=[common],
+            help="Resimleri karolara bölüp her karoyu ayrı bir dosyaya "
+            "yazar."
+        )
+        cells = slice_.add_mutually_exclusive_group(required=True)
+        cells.add_argument(
+            "--size",
+            default=None,
+            help="Karo boyutu (örnek: 16x16 veya 16)."
+        )
+        cells.add_argument(
+            "--grid",
+            default=None,
+            help="Satır ve sütun sayısı (örnek: 8x12)."
+        )
+        slice_.add_argument(
+            "--skip-empty",
+            action="store_true",
+            help="Tek renkli (boş) karoları yazmaz."
+        )
+        slice_.add_argument(
+            "--skip-duplicates",
+            action="store_true",
+            help="Daha önce yazılmış bir karonun aynısı olan karoları yazmaz."
+        )
+
+        pipeline = commands.add_parser(
+            "pipeline",
+            parents=[common],
+            help="Kırpma, ölçekleme, ızgara, döndürme, aynalama ve bit "
+            "derinliği dönüşümünü tek geçişte uygular."
+        )
+        pipeline.add_argument(
+            "--spec",
+            required=True,
+            help="İşlem hattı tanımı "
+            "(örnek: crop:0,0,640,360|scale:320x180|grid:8,red|convert:8)."
+        )
+
+        watch = commands.add_parser(
+            "watch",
+            parents=[runtime],
+            help="Bir klasörü izleyip yalnızca yeni veya değişmiş dosyaları "
+            "işler."
+        )
+        watch.add_argument(
+            "folder",
+            nargs="?",
+            default=None,
+            help="İzlenecek klasör (varsayılan=images)."
+        )
+        watch.add_argument(
+            "--spec", required=True, help="İşlem hattı tanımı."
+        )
+        watch.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Taramalar arası süre, sn (varsayılan=2)."
+        )
+        watch.add_argument(
+            "--once", action="store_true", help="Tek tarama yapıp çıkar."
+        )
+        watch.add_argument(
+            "--manifest",
+            default=None,
+            help="Manifest dosyası (varsayılan=data/watch_manifest.json)."
+        )
+
+        serve = commands.add_parser(
+            "serve",
+            parents=[runtime],
+            help="İstekleri bir Unix soketinden veya yerel bir porttan "
+            "kabul eden sunucuyu başlatır."
+        )
+        address = serve.add_mutually_exclusive_group(required=True)
+        address.add_argument("--socket", default=None, help="Unix soketi.")
+        address.add_argument("--port", type=int, default=None, help="Port.")
+        serve.add_argument(
+            "--host", default="127.0.0.1", help="Adres (varsayılan=127.0.0.1)."
+        )
+
+        metrics = commands.add_parser(
+            "metrics", help="Bir ölçüm (JSONL) dosyasını özetler."
+        )
+        metrics.add_argument("file", help="Ölçüm dosyası.")
+
+        return parser
+
+
+    @staticmethod
+    def expand_inputs(inputs: list[str]) -> list[pathlib_path]:
+        """
+        Dosya, klasör ve joker karakterli (glob) girdileri işlenecek
+        dosyaların listesine dönüştürür. Klasörlerdeki '.bmp' dosyaları
+        alınır. Joker karakterler, kabuğun genişletmediği ortamlar (örneğin
+        Windows) için burada genişletilir.
+
+        Returns:
+            list[pathlib.Path]: Tekrarsız ve sıralı dosya yolları.
+        """
+        files = {}
+        for item in inputs:
+            matches = glob_glob(item) or [item]
+            for match in matches:
+                match = pathlib_path(match)
+                if match.is_dir():
+                    for child in sorted(match.iterdir()):
+                        if child.suffix.lower() == ".bmp" and child.is_file():
+                            files[child] = None
+                else:
+                    files[match] = None
+
+        return list(files)
+
+
+    @staticmethod
+    def output_paths(
+        sources: list[pathlib_path],
+        output_dir: pathlib_path,
+        *,
+        suffix: str = None
+    ) -> list[pathlib_path]:
+        """
+        Kaynak dosyaların çıktı klasöründeki yollarını belirler. Dosya
+        adları tekrarsızsa çıktılar doğrudan çıktı klasörüne yazılır. Farklı
+        klasörlerde aynı adlı dosyalar varsa (örneğin özyinelemeli bir joker
+        karakterden), birbirlerinin üzerine yazmamaları için kaynakların
+        ortak üst klasöre göre yolları çıktı klasörü altında korunur.
+
+        Args:
+            sources (list[pathlib.Path]): Kaynak dosyaların yolları.
+            output_dir (pathlib.Path): Çıktı klasörü.
+            suffix (str): Verilirse çıktıların uzantısı (örnek: '.png').
+
+        Returns:
+            list[pathlib.Path]: Kaynaklarla aynı sırada çıktı yolları.
+        """
+        names = [
+            pathlib_path(source.name) for source in sources
+        ]
+        if len({name.as_posix().lower() for name in names}) < len(names):
+            parents = [source.resolve().parent for source in sources]
+            root = os_path.commonpath(parents)
+            names = [
+                pathlib_path(os_path.relpath(parent, root)) / source.name
+                for parent, source in zip(parents, sources)
+            ]
+
+        if suffix:
+            names = [name.with_suffix(suffix) for name in names]
+
+        return [output_dir / name for name in names]
+
+
+    @staticmethod
+    def process_file(
+        command: str,
+        options: dict,
+        source: str,
+        output: str,
+        *,
+        image: BmpImage = None,
+        source_hash: str = None
+    ) -> tuple[str, bool, str, int, float]:
+        """
+        Tek bir dosyayı işleyip sonucu kaydeder. İşçi süreçlerde çalışır;
+        hata fırlatmaz, hatayı sonuç olarak döndürür. Kaynak çağıran
+        tarafından zaten açılmış ve özeti hesaplanmışsa 'image' ve
+        'source_hash' ile verilir; dosya bir daha okunmaz.
+
+        Args:
+            command (str): İşlem adı (grid, crop, scale, rotate, flip,
+            pyramid, slice, pipeline).
+            options (dict): İşlemin parametreleri.
+            source (str): Kaynak dosyanın yolu.
+            output (str): Çıktı dosyasının yolu.
+            image (BmpImage): Önceden açılmış kaynak ('pipeline' için).
+            source_hash (str): Kaynağın içerik özeti ('ResultCache').
+
+        Returns:
+            tuple[str, bool, str, int, float]: (kaynak, başarılı mı, mesaj,
+            işlenen piksel sayısı, süre)
+        """
+        start = time_perf_counter()
+        source_path = pathlib_path(source)
+        output_path = pathlib_path(output)
+
+        with Metrics.stage(f"batch_{command}") as stage:
+            stage.add(file=source)
+            try:
+                if source_path.resolve() == output_path.resolve():
+                    raise ValueError(
+                        "Çıktı dosyası kaynak dosyanın üzerine yazamaz."
+                    )
+
+                if command in ("pyramid", "slice"):
+                    # Her seviye veya karo ayrı bir dosyaya yazılır:
+                    # <ad>_mip1.bmp (1/2), <ad>_mip2.bmp (1/4), ... veya
+                    # <ad>/<ad>_r0_c0.bmp, <ad>/<ad>_r0_c1.bmp, ...
+                    # Seviyeler ve karolar, kaynağın tek geçişinde
+                    # üretildikçe dosyalara yazılır. Karolar önbelleğe
+                    # alınmaz; kaynaktan kopyalanmaları önbellekten
+                    # okunmalarından ucuzdur.
+                    if image is not None:
+                        banded = contextlib_nullcontext(image)
+                    elif options.get("max_memory"):
+                        banded = BandedImage.open(
+                            source_path, max_memory=options["max_memory"]
+                        )
+                    else:
+                        banded = contextlib_nullcontext(
+                            ImageResizer.open_image(source_path, use_mmap=True)
+                        )
+                    with banded as image:
+                        header = image.header
+                        if command == "pyramid":
+                            outputs = ", ".join(
+                                level_path.name
+                                for level_path in BatchProcessor._save_pyramid(
+                                    options,
+                                    source_path,
+                                    output_path,
+                                    image=image,
+                                    source_hash=source_hash,
+                                    stage=stage
+                                )
+                            )
+                        else:
+                            cell_paths = ImageResizer.save_slices(
+                                image,
+                                output_path,
+                                cell_size=options["size"],
+                                grid=options["grid"],
+                                skip_empty=options["skip_empty"],
+                                skip_duplicates=options["skip_duplicates"],
+                                rle=options.get("rle", False),
+                                level=options.get(
+                                    "level", PngWriter.DEFAULT_LEVEL
+                                )
+                            )
+                            outputs = (
+                                f"{output_path.stem}/, {len(cell_paths)} karo"
+                            )
+                    stage.add(pixels=header.width * header.height)
+                    return (
+                        source,
+                        True,
+                        f"{output_path.parent} ({outputs})",
+                        header.width * header.height,
+                        time_perf_counter() - start
+                    )
+
+                cache, key, result = BatchProcessor._cache_lookup(
+                    command, options, source_path, source_hash=source_hash
+                )  # TypeError
+                stage.add(cache_hit=result is not None)
+                if result is None and cache is None and (
+                    command == "pipeline" or options.get("max_memory")
+                ):
+                    # Önbellek kapalıysa çıktı satırları hesaplandıkça
+                    # dosyaya yazılır; bellek sınırı verilmişse kaynak da
+                    # bant bant okunur.
+                    header = BatchProcessor._pipeline(
+                        command, options
+                    ).run_file(
+                        source_path,
+                        output_path,
+                        rle=options.get("rle", False),
+                        level=options.get("level", PngWriter.DEFAULT_LEVEL),
+                        threads=options.get("workers", 1),
+                        image=image,
+                        max_memory=options.get("max_memory")
+                    )
+                else:
+                    if result is None:
+                        result = BatchProcessor._compute(
+                            command, options, source_path, image=image
+                        )
+                        if cache is not None:
+                            cache.put(key, result)
+                    header = BmpHeader.from_bytes(result)
+
+                    ImageResizer.save_image(
+                        output_path,
+                        data=result,
+                        rle=options.get("rle", False),
+                        level=options.get("level", PngWriter.DEFAULT_LEVEL),
+                        threads=options.get("workers", 1)
+                    )
+            except (
+                ValueError,
+                TypeError,
+                FileNotFoundError,
+                PermissionError,
+                RuntimeError
+            ) as e:
+                stage.add(ok=False, error=str(e))
+                return source, False, str(e), 0, time_perf_counter() - start
+
+            stage.add(pixels=header.width * header.height)
+
+        return (
+            source,
+            True,
+            str(output_path),
+            header.width * header.height,
+            time_perf_counter() - start
+        )
+
+
+    @staticmethod
+    def _pipeline(command: str, options: dict) -> Pipeline:
+        """
+        Toplu işlem komutunu eşdeğer bir işlem hattına dönüştüren, özel
+        metot. Önbellek anahtarı, komuttan bağımsız olarak bu işlem hattının
+        normalleştirilmiş parametrelerinden oluşturulur.
+
+        Raises:
+            ValueError: İşlem hattı tanımı geçersizse.
+        """
+        if command == "pipeline":
+            return Pipeline.parse(options["spec"])  # ValueError
+        if command == "grid":
+            return Pipeline().grid(
+                grid_size=options["size"], grid_color=options["color"]
+            )
+        if command == "rotate":
+            return Pipeline().rotate(angle=options["angle"])
+        if command == "flip":
+            return Pipeline().flip(axis=options["axis"])
+        if command == "crop":
+            return Pipeline().crop(
+                startx=options["x"],
+                starty=options["y"],
+                new_width=options["width"],
+                new_height=options["height"]
+            )
+        return Pipeline().scale(
+            new_width=options["width"],
+            new_height=options["height"],
+            method=options["method"]
+        )
+
+
+    @staticmethod
+    def _cache_lookup(
+        command: str,
+        options: dict,
+        source_path: pathlib_path,
+        *,
+        source_hash: str = None
+    ) -> tuple[ResultCache | None, str | None, bytearray | None]:
+        """
+        Önbellek açıksa, dosyanın sonucunu önbellekte arayan, özel metot.
+        Kaynağın özeti 'source_hash' ile verilmişse dosya okunmaz.
+
+        Returns:
+            tuple[ResultCache | None, str | None, bytearray | None]:
+            (önbellek, sonuç anahtarı, önbellekteki sonuç veya None)
+
+        Raises:
+            ValueError: İşlem hattı tanımı geçersizse.
+            TypeError: Sayısal bir metin değeri girilmemişse.
+        """
+        if options.get("cache") is None:
+            return None, None, None
+
+        cache = ResultCache(
+            options["cache"] or None, max_bytes=options["cache_max_bytes"]
+        )
+        params = BatchProcessor._pipeline(
+            command, options
+        ).key()  # ValueError, TypeError
+        try:
+            if source_hash is None:
+                source_hash = cache.source_hash(source_path)
+        except OSError:
+            # Dosya okunamıyorsa hata, işlem sırasında bildirilir.
+            return None, None, None
+
+        key = ResultCache.key(source_hash, params)
+
+        return cache, key, cache.get(key)
+
+
+    @staticmethod
+    def _compute(
+        command: str,
+        options: dict,
+        source_path: pathlib_path,
+        *,
+        image: BmpImage = None
+    ) -> bytearray:
+        """
+        Bir dosyaya toplu işlem komutunu uygulayan, özel metot. 'pipeline'
+        için önceden açılmış kaynak 'image' ile verilebilir.
+
+        Returns:
+            bytearray: Sonuç dosyasının içeriği.
+
+        Raises:
+            'ImageResizer' işlemleriyle aynı istisnalar.
+        """
+        if command == "pipeline":
+            # Kaynak belleğe eşlenir; yalnızca gereken satırlar okunur.
+            if image is None:
+                image = ImageResizer.open_image(source_path, use_mmap=True)
+            return Pipeline.parse(options["spec"]).run(image).data
+        if command == "crop":
+            # Yalnızca kırpma penceresindeki satırlar okunur.
+            return ImageResizer.read_crop(
+                source_path,
+                new_width=options["width"],
+                new_height=options["height"],
+                startx=options["x"],
+                starty=options["y"]
+            )
+
+        image = ImageResizer.open_image(source_path)
+        if command == "grid":
+            return ImageResizer.add_grid(
+                image,
+                grid_size=options["size"],
+                grid_color=options["color"],
+                workers=options.get("workers", 1)
+            ).data
+        if command == "rotate":
+            return ImageResizer.rotate_image(
+                image, angle=options["angle"]
+            ).data
+        if command == "flip":
+            return ImageResizer.flip_image(image, axis=options["axis"]).data
+        return ImageResizer.scale_image(
+            image,
+            new_width=options["width"],
+            new_height=options["height"],
+            method=options["method"],
+            workers=options.get("workers", 1)
+        ).data
+
+
+    @staticmethod
+    def _save_pyramid(
+        options: dict,
+        source_path: pathlib_path,
+        output_path: pathlib_path,
+        *,
+        image: BmpImage,
+        source_hash: str = None,
+        stage: MetricsStage | _NullStage = Metrics._NULL_STAGE
+    ) -> list[pathlib_path]:
+        """
+        Piramidin seviyelerini kaydeden, özel metot. Önbellek kapalıysa
+        seviyeler satır satır yazılır ('ImageResizer.save_pyramid').
+        Önbellek açıksa her seviye, kaynak özeti ve seviye sırasıyla
+        ayrı ayrı saklanır; bir seviye eksikse piramit bellekte oluşturulup
+        önbelleğe yazılır.
+
+        Returns:
+            list[pathlib.Path]: Büyükten küçüğe kaydedilen dosyalar.
+
+        Raises:
+            'ImageResizer.save_pyramid' ve 'ImageResizer.save_image' ile
+            aynı istisnalar.
+        """
+        save_options = {
+            "rle": options.get("rle", False),
+            "level": options.get("level", PngWriter.DEFAULT_LEVEL),
+            "threads": options.get("workers", 1),
+        }
+
+        cache = None
+        if options.get("cache") is not None:
+            cache = ResultCache(
+                options["cache"] or None,
+                max_bytes=options["cache_max_bytes"]
+            )
+            try:
+                if source_hash is None:
+                    source_hash = cache.source_hash(source_path)
+            except OSError:
+                cache = None
+        if cache is None:
+            return ImageResizer.save_pyramid(
+                image, output_path, levels=options["levels"], **save_options
+            )  # ValueError, TypeError, RuntimeError
+
+        # Bir seviyenin içeriği, istenen seviye sayısından bağımsızdır.
+        sizes = ImageResizer.pyramid_sizes(
+            image.header, levels=options["levels"]
+        )  # ValueError, TypeError
+        keys = [
+            ResultCache.key(source_hash, (("pyramid", index),))
+            for index in range(1, len(sizes) + 1)
+        ]
+        results = []
+        for key in keys:
+            result = cache.get(key)
+            if result is None:
+                break
+            results.append(result)
+        stage.add(cache_hit=len(results) == len(keys))
+
+        if len(results) < len(keys):
+            results = [
+                level.data
+                for level in ImageResizer.build_pyramid(
+                    image, levels=options["levels"]
+                )
+            ]
+            for key, result in zip(keys, results):
+                cache.put(key, result)
+
+        paths = ImageResizer.pyramid_paths(output_path, len(results))
+        for path, result in zip(paths, results):
+            ImageResizer.save_image(
+                path, data=result, **save_options
+            )  # ValueError, RuntimeError
+
+        return paths
+
+
+    @staticmethod
+    def run(args: argparse_Namespace) -> int:
+        """
+        Ayrıştırılmış argümanlara göre toplu işlemi yürütür, her dosya için
+        sonucu ve sonunda toplam verimi (throughput) yazdırır.
+
+        Returns:
+            int: Çıkış kodu (0 = tüm dosyalar başarılı).
+        """
+        if args.command == "grid":
+            options = {"size": args.size, "color": args.color.lower()}
+        elif args.command == "pyramid":
+            options = {"levels": args.levels}
+        elif args.command == "slice":
+            options = {
+                "size": args.size,
+                "grid": args.grid,
+                "skip_empty": args.skip_empty,
+                "skip_duplicates": args.skip_duplicates
+            }
+        elif args.command == "rotate":
+            options = {"angle": args.angle}
+        elif args.command == "flip":
+            options = {"axis": args.axis}
+        elif args.command == "pipeline":
+            try:
+                Pipeline.parse(args.spec)
+            except ValueError as e:
+                print(f"(!) İşlem hattı tanımı geçersiz: {e}")
+                return 2
+            options = {"spec": args.spec}
+        elif args.command == "crop":
+            options = {
+                "width": args.width,
+                "height": args.height,
+                "x": args.x,
+                "y": args.y
+            }
+        else:
+            options = {
+                "width": args.width,
+                "height": args.height,
+                "method": args.method
+            }
+
+        options["cache"] = args.cache
+        options["cache_max_bytes"] = args.cache_max_mb * 2**20
+        options["rle"] = args.rle
+        options["level"] = args.png_level
+
+        if args.output:
+            output_dir = pathlib_path(args.output)
+        else:
+            output_dir = FilePathManager.get_py_or_exe_dir() / "edited_images"
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"(!) Çıktı klasörü oluşturulamadı: {e}")
+            return 2
+
+        sources = BatchProcessor.expand_inputs(args.inputs)
+        if not sources:
+            print("(!) İşlenecek dosya bulunamadı.")
+            return 2
+
+        outputs = BatchProcessor.output_paths(
+            sources,
+            output_dir,
+            suffix=".png" if args.format == "png" else None
+        )
+        try:
+            for parent in {output.parent for output in outputs}:
+                parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"(!) Çıktı klasörü oluşturulamadı: {e}")
+            return 2
+
+        workers = args.workers or os_cpu_count() or 1
+        if len(sources) == 1:
+            # Tek bir dosya, kendi içinde bantlara bölünerek paralel işlenir.
+            options["workers"] = workers
+        workers = max(1, min(workers, len(sources)))
+        if args.max_memory is not None:
+            if args.cache is not None:
+                # Önbelleğe yazılacak sonuç bellekte oluşturulur.
+                print("(!) --max-memory ve --cache birlikte kullanılamaz.")
+                return 2
+            options["max_memory"] = args.max_memory // workers
+        if args.queue is not None:
+            return BatchProcessor._run_queue(
+                args.command,
+                options,
+                sources,
+                outputs,
+                queue_path=args.queue or None,
+                workers=workers
+            )
+
+        jobs = (
+            [args.command] * len(sources),
+            [options] * len(sources),
+            [str(source) for source in sources],
+            [str(output) for output in outputs]
+        )
+
+        start = time_perf_counter()
+        if workers == 1:
+            results = map(BatchProcessor.process_file, *jobs)
+            executor = None
+        else:
+            executor = futures_ProcessPoolExecutor(max_workers=workers)
+            # Küçük dosyalarda süreçler arası iletişim maliyetini azaltmak
+            # için işler gruplar halinde gönderilir.
+            chunksize = max(1, len(sources) // (workers * 8))
+            results = executor.map(
+                BatchProcessor.process_file, *jobs, chunksize=chunksize
+            )
+
+        succeeded = 0
+        failed = 0
+        pixels = 0
+        try:
+            for source, ok, message, pixel_count, _ in results:
+                if ok:
+                    succeeded += 1
+                    pixels += pixel_count
+                    print(f"(+) {source} -> {message}")
+                else:
+                    failed += 1
+                    print(f"(!) {source}: {message}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        BatchProcessor._sync_outputs(args.command)
+        elapsed = max(time_perf_counter() - start, 1e-9)
+
+        print(
+            f"\n{succeeded} dosya başarılı, {failed} dosya başarısız. "
+            f"Süre: {elapsed:.2f} sn, "
+            f"{(succeeded + failed) / elapsed:.1f} dosya/sn, "
+            f"{pixels / elapsed / 1e6:.2f} MP/sn ({workers} işçi)."
+        )
+
+        return 0 if failed == 0 else 1
+
+
+    @staticmethod
+    def _sync_outputs(command: str) -> None:
+        """
+        Tek tek diske işlenmeden yazılan çıktıları ('slice' karoları,
+        'ImageResizer.save_slices') toplu işlemin sonunda tek bir 'os.sync'
+        çağrısıyla diske işleyen, özel metot. 'os.sync' olmayan sistemlerde
+        (Windows) atlanır.
+        """
+        if command == "slice" and os_sync is not None:
+            os_sync()
+
+
+    @staticmethod
+    def process_queue(queue_path: str) -> tuple[int, int, int]:
+        """
+        Kuyrukta iş kalmayana kadar sıradaki işi alıp işler ve sonucunu
+        kuyruğa kaydeder. İşçi süreçlerde çalışır; her işin sonucunu
+        işlendikçe yazdırır.
+
+        Args:
+            queue_path (str): Kuyruk dosyasının yolu.
+
+        Returns:
+            tuple[int, int, int]: (başarılı iş sayısı, başarısız iş sayısı,
+            işlenen piksel sayısı)
+
+        Raises:
+            sqlite3.Error: Kuyruk okunamıyor veya yazılamıyorsa.
+        """
+        succeeded = 0
+        failed = 0
+        pixels = 0
+        with JobQueue(queue_path) as queue:
+            while True:
+                job = queue.claim(os_getpid())  # sqlite3.Error
+                if job is None:
+                    break
+                job_id, command, options, source, output = job
+
+                _, ok, message, pixel_count, seconds = (
+                    BatchProcessor.process_file(
+                        command, options, source, output
+                    )
+                )
+                queue.finish(
+                    job_id,
+                    ok=ok,
+                    message=message,
+                    pixels=pixel_count,
+                    seconds=seconds
+                )  # sqlite3.Error
+
+                if ok:
+                    succeeded += 1
+                    pixels += pixel_count
+                    print(f"(+) {source} -> {message}", flush=True)
+                else:
+                    failed += 1
+                    print(f"(!) {source}: {message}", flush=True)
+
+        return succeeded, failed, pixels
+
+
+    @staticmethod
+    def _run_queue(
+        command: str,
+        options: dict,
+        sources: list[pathlib_path],
+        outputs: list[pathlib_path],
+        *,
+        queue_path: pathlib_path = None,
+        workers: int
+    ) -> int:
+        """
+        Toplu işlemi kalıcı bir iş kuyruğu üzerinden yürüten, özel metot.
+        İşler kuyruğa eklenir; tamamlanmış işler atlanır, önceki bir
+        çalışmanın yarıda bıraktığı işler yeniden kuyruğa alınır. İşçi
+        süreçler işleri kuyruktan kendileri alır ('process_queue').
+
+        Returns:
+            int: Çıkış kodu (0 = kuyruktaki tüm işler başarılı).
+        """
+        queue = JobQueue(queue_path)
+        try:
+            with queue:
+                recovered = queue.recover()
+                added = queue.add(command, options, sources, outputs)
+                counts = queue.counts()
+        except (sqlite3_Error, OSError) as e:
+            print(f"(!) İş kuyruğu açılamadı ({queue.path}): {e}")
+            return 2
+
+        pending = counts.get(JobQueue.PENDING, 0)
+        print(
+            f"(i) Kuyruk: {queue.path} - {added} iş eklendi veya yeniden "
+            "denenecek, "
+            f"{recovered} yarıda kalmış iş yeniden kuyruğa alındı, "
+            f"{counts.get(JobQueue.DONE, 0)} tamamlanmış iş atlandı, "
+            f"{pending} iş işlenecek."
+        )
+
+        workers = max(1, min(workers, pending))
+        start = time_perf_counter()
+        try:
+            if workers == 1:
+                results = [BatchProcessor.process_queue(str(queue.path))]
+            else:
+                with futures_ProcessPoolExecutor(
+                    max_workers=workers
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            BatchProcessor.process_queue, str(queue.path)
+                        )
+                        for _ in range(workers)
+                    ]
+                    results = [future.result() for future in futures]
+        except sqlite3_Error as e:
+            print(f"(!) İş kuyruğuna yazılamadı ({queue.path}): {e}")
+            return 2
+        BatchProcessor._sync_outputs(command)
+        elapsed = max(time_perf_counter() - start, 1e-9)
+
+        succeeded, failed, pixels = (sum(values) for values in zip(*results))
+        print(
+            f"\n{succeeded} dosya başarılı, {failed} dosya başarısız. "
+            f"Süre: {elapsed:.2f} sn, "
+            f"{(succeeded + failed) / elapsed:.1f} dosya/sn, "
+            f"{pixels / elapsed / 1e6:.2f} MP/sn ({workers} işçi)."
+        )
+
+        return 0 if failed == 0 else 1
+
+
+    @staticmethod
+    def main(argv: list[str]) -> int:
+        """
+        Komut satırı argümanlarını ayrıştırıp toplu işlemi başlatır.
+
+        Returns:
+            int: Çıkış kodu.
+        """
+        args = BatchProcessor.build_parser().parse_args(argv)
+
+        if args.command == "metrics":
+            try:
+                summary = Metrics.summarize(pathlib_path(args.file))
+            except (FileNotFoundError, RuntimeError) as e:
+                print(f"(!) Ölçüm dosyası okunamadı: {e}")
+                return 2
+            for name, stage in sorted(
+                summary.items(), key=lambda item: -item[1]["seconds"]
+            ):
+                line = (
+                    f"{name:<16} {stage['count']:>6}x "
+                    f"toplam {stage['seconds']:.3f} sn, "
+                    f"ort. {stage['mean_seconds'] * 1e3:.2f} ms, "
+                    f"en uzun {stage['max_seconds'] * 1e3:.2f} ms"
+                )
+                if "pixels" in stage and stage["seconds"]:
+                    line += (
+                        f", {stage['pixels'] / stage['seconds'] / 1e6:.2f} "
+                        "MP/sn"
+                    )
+                if "peak_alloc" in stage:
+                    line += f", tepe {stage['peak_alloc'] / 2**20:.1f} MiB"
+                print(line)
+            return 0
+
+        if args.backend:
+            try:
+                ImageResizer.set_backend(args.backend)
+            except ValueError as e:
+                print(f"(!) {e}")
+                return 2
+            # İşçi süreçler arka ucu ortam değişkeninden alır.
+            os_environ["RESIZER_BACKEND"] = args.backend
+
+        if args.metrics:
+            # İşçi süreçler ölçüm ayarlarını ortam değişkenlerinden alır.
+            os_environ["RESIZER_METRICS"] = args.metrics
+            if args.metrics_memory:
+                os_environ["RESIZER_METRICS_MEMORY"] = "1"
+            Metrics.configure(
+                args.metrics, track_memory=args.metrics_memory
+            )
+
+        if args.command == "watch":
+            try:
+                watcher = FolderWatcher(
+                    args.folder
+                    or FilePathManager.get_py_or_exe_dir() / "images",
+                    spec=args.spec,
+                    output_dir=args.output,
+                    manifest_path=args.manifest,
+                    workers=args.workers,
+                    cache=args.cache,
+                    cache_max_bytes=args.cache_max_mb * 2**20,
+                    rle=args.rle,
+                    output_format=args.format,
+                    level=args.png_level
+                )
+            except (ValueError, TypeError) as e:
+                print(f"(!) İşlem hattı tanımı geçersiz: {e}")
+                return 2
+            return watcher.watch(interval=args.interval, once=args.once)
+
+        if args.command == "serve":
+            return ResizeDaemon(
+                workers=args.workers,
+                output_dir=args.output,
+                cache=args.cache,
+                cache_max_bytes=args.cache_max_mb * 2**20,
+                rle=args.rle,
+                output_format=args.format,
+                level=args.png_level
+            ).run(socket_path=args.socket, host=args.host, port=args.port)
+
+        return BatchProcessor.run(args)
+
+
+class FolderWatcher:
+    """
+    Bir klasörü izleyerek yalnızca yeni veya değişmiş dosyaları işler.
+
+    Her kaynak dosya için (boyut, değişiklik zamanı, içerik özeti, işlem
+    hattı, çıktı) bilgisi kalıcı bir manifest dosyasında tutulur. Bir
+    taramada boyutu ve değişiklik zamanı aynı kalan dosyalar okunmaz;
+    yalnızca değişiklik zamanı değişen dosyaların içeriği özetlenir ve
+    içerik de aynıysa dosya yeniden işlenmez. Silinen kaynakların çıktıları
+    silinir. İşlem hattı değişirse tüm dosyalar yeniden işlenir.
+
+    Attributes:
+        source_dir (pathlib.Path): İzlenen klasör (alt klasörler dahil).
+        output_dir (pathlib.Path): Çıktı klasörü. Kaynak klasörün yapısı
+        korunur.
+        spec (str): Uygulanacak işlem hattı tanımı ('Pipeline.parse').
+        manifest_path (pathlib.Path): Manifest dosyasının yolu.
+        workers (int): Değişen dosyaları işleyecek işçi süreç sayısı.
+        output_format (str): Çıktı dosyalarının biçimi ('bmp' veya 'png').
+        options (dict): İşçi süreçlere gönderilen işlem parametreleri
+        (işlem hattı, önbellek ve sıkıştırma ayarları).
+
+    Methods:
+        _load_manifest (dict): Manifest dosyasını okuyan, özel metot.
+        _save_manifest (None): Manifest dosyasını güvenli şekilde yazan,
+        özel metot.
+        _list_files (dict): İzlenen klasördeki '.bmp' dosyalarını
+        listeleyen, özel metot.
+        _process (tuple): Bir dosyayı belleğe eşleyip içerik özetini
+        hesaplayan ve içerik değişmişse aynı eşlemeyi işleyen, özel metot.
+        İşçi süreçlerde çalışır.
+        scan (dict): Klasörü bir kez tarayıp değişiklikleri işler.
+        watch (int): Klasörü belirli aralıklarla tarar.
+    """
+    MANIFEST_NAME = "watch_manifest.json"
+
+    __slots__ = (
+        "source_dir", "output_dir", "spec", "manifest_path", "workers",
+        "output_format", "options", "_params", "_manifest", "_executor"
+    )
+
+
+    def __init__(
+        self,
+        source_dir: pathlib_path,
+        *,
+        spec: str,
+        output_dir: pathlib_path = None,
+        manifest_path: pathlib_path = None,
+        workers: int = None,
+        cache: str = None,
+        cache_max_bytes: int = ResultCache.DEFAULT_MAX_BYTES,
+        rle: bool = False,
+        output_format: str = "bmp",
+        level: int = PngWriter.DEFAULT_LEVEL
+    ) -> None:
+        """
+        Raises:
+            ValueError: İşlem hattı tanımı geçersizse.
+            TypeError: Tanımda sayısal bir metin değeri girilmemişse.
+        """
+        base_dir = FilePathManager.get_py_or_exe_dir()
+        self.source_dir = pathlib_path(source_dir).resolve()
+        self.output_dir = pathlib_path(
+            output_dir or base_dir / "edited_images"
+        ).resolve()
+        self.manifest_path = pathlib_path(
+            manifest_path or base_dir / "data" / FolderWatcher.MANIFEST_NAME
+        )
+        self.spec = spec
+        self.workers = workers or os_cpu_count() or 1
+        self.output_format = output_format
+        self.options = {
+            "spec": spec,
+            "cache": cache,
+            "cache_max_bytes": cache_max_bytes,
+            "rle": rle,
+            "level": level
+        }
+        # İşlem hattı, JSON'da saklanabilen ve karşılaştırılabilen bir
+        # metne dönüştürülür. Sıkıştırma veya çıktı biçimi değiştiğinde de
+        # çıktılar yeniden yazılır.
+        params = Pipeline.parse(spec).key()  # ValueError, TypeError
+        if rle:
+            params += (("rle",),)
+        if output_format == "png":
+            params += (("png", level),)
+        self._params = json_dumps(params)
+        self._manifest = None
+        self._executor = None
+
+
+    def _load_manifest(self) -> dict:
+        """
+        Manifest dosyasını okuyan, özel metot. Dosya yoksa veya bozuksa
+        boş bir manifest ile başlanır (tüm dosyalar yeniden işlenir).
+        """
+        if self._manifest is None:
+            try:
+                self._manifest = json_loads(
+                    self.manifest_path.read_text(encoding="utf-8")
+                )["files"]
+            except (OSError, ValueError, KeyError, TypeError):
+                self._manifest = {}
+
+        return self._manifest
+
+
+    def _save_manifest(self) -> None:
+        """
+        Manifest dosyasını geçici bir dosyaya yazıp hedefin üzerine taşıyan,
+        özel metot. Yazma yarıda kesilirse eski manifest korunur.
+        """
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with AtomicWriter(self.manifest_path) as writer:
+            writer.write(
+                json_dumps(
+                    {"version": 1, "files": self._manifest},
+                    ensure_ascii=False
+                ).encode("utf-8")
+            )
+
+
+    def _list_files(self) -> dict[str, tuple[str, int, int]]:
+        """
+        İzlenen klasördeki (alt klasörler dahil) '.bmp' dosyalarını
+        listeleyen, özel metot. Dosya bilgileri 'os.scandir' ile klasör
+        okunurken alınır; çıktı klasörü izlenen klasörün içindeyse atlanır.
+
+        Returns:
+            dict[str, tuple[str, int, int]]: Göreli yola göre (tam yol,
+            boyut, değişiklik zamanı (ns)).
+        """
+        files = {}
+        root = str(self.source_dir)
+        output_dir = str(self.output_dir)
+        folders = [root]
+        while folders:
+            folder = folders.pop()
+            try:
+                entries = os_scandir(folder)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.path != output_dir:
+                                folders.append(entry.path)
+                            continue
+                        if not entry.name.lower().endswith(".bmp"):
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    relative = os_path.relpath(entry.path, root)
+                    files[relative.replace(os_path.sep, "/")] = (
+                        entry.path, stat.st_size, stat.st_mtime_ns
+                    )
+
+        return files
+
+
+    @staticmethod
+    def _process(
+        options: dict,
+        source: str,
+        output: str,
+        previous_hash: str = None
+    ) -> tuple[str | None, bool | None, str]:
+        """
+        Bir dosyayı belleğe eşleyip içerik özetini hesaplayan ve içerik
+        'previous_hash' ile aynı değilse aynı eşlemeyi işleyen, özel metot.
+        Böylece dosya diskten bir kez okunur. İşçi süreçlerde çalışır; hata
+        fırlatmaz.
+
+        Returns:
+            tuple[str | None, bool | None, str]: (içerik özeti, başarılı mı,
+            mesaj). İçerik değişmemişse 'başarılı mı' None'dır.
+        """
+        try:
+            data = ImageResizer.map_image(pathlib_path(source))
+            source_hash = hashlib_sha256(data).hexdigest()
+        except (
+            ValueError,
+            FileNotFoundError,
+            PermissionError,
+            RuntimeError
+        ) as e:
+            return None, False, str(e)
+        if source_hash == previous_hash:
+            return source_hash, None, ""
 
-    @staticmethod
-    def save_image(file_path: pathlib_path, *, data: bytearray) -> None:
+        try:
+            image = BmpImage.from_bytes(data)  # ValueError
+            pathlib_path(output).parent.mkdir(parents=True, exist_ok=True)
+        except (ValueError, OSError) as e:
+            return source_hash, False, str(e)
+
+        _, ok, message, _, _ = BatchProcessor.process_file(
+            "pipeline",
+            options,
+            source,
+            output,
+            image=image,
+            source_hash=source_hash
+        )
+
+        return source_hash, ok, message
+
+
+    def scan(self) -> dict[str, int]:
         """
-        Görüntü dosyasının güncellenmiş binary içeriğini belirtilen konuma
-        kaydeder.
+        Klasörü bir kez tarayıp yeni ve değişmiş dosyaları işler, silinen
+        kaynakların çıktılarını siler ve manifesti günceller.
 
-        Args:
-            data (bytearray): Kaydedilecek içerik.
-            file_path (pathlib.Path): Görüntü dosyasının kaydedileceği dizin.
+        Returns:
+            dict[str, int]: İşlenen, başarısız, atlanan ve silinen dosya
+            sayıları.
+        """
+        manifest = self._load_manifest()
+        files = self._list_files()
+        counts = {"processed": 0, "failed": 0, "skipped": 0, "removed": 0}
+        dirty = False
+
+        # Yalnızca değişiklik zamanı değişmişse (örneğin dosya
+        # kopyalanmışsa) içerik, dosyayı işleyecek olan işçide
+        # karşılaştırılır; içerik aynıysa dosya işlenmez.
+        pending = []
+        previous_hashes = {}
+        for relative, (source, size, mtime) in files.items():
+            entry = manifest.get(relative)
+            if entry is None or entry["params"] != self._params:
+                pending.append(relative)
+            elif entry["size"] != size:
+                pending.append(relative)
+            elif entry["mtime_ns"] != mtime:
+                pending.append(relative)
+                previous_hashes[relative] = entry["hash"]
+            else:
+                counts["skipped"] += 1
+
+        # Silinen kaynakların çıktılarını sil.
+        for relative in [name for name in manifest if name not in files]:
+            output = manifest.pop(relative).get("output")
+            if output:
+                pathlib_path(output).unlink(missing_ok=True)
+            counts["removed"] += 1
+            dirty = True
+            print(f"(-) {relative}")
+
+        jobs = [
+            (
+                self.options,
+                files[relative][0],
+                str(
+                    (self.output_dir / relative).with_suffix(".png")
+                    if self.output_format == "png"
+                    else self.output_dir / relative
+                ),
+                previous_hashes.get(relative)
+            )
+            for relative in pending
+        ]
+        if len(jobs) > 1 and self.workers > 1:
+            if self._executor is None:
+                self._executor = futures_ProcessPoolExecutor(
+                    max_workers=self.workers
+                )
+            results = self._executor.map(
+                FolderWatcher._process, *zip(*jobs)
+            )
+        else:
+            results = (FolderWatcher._process(*job) for job in jobs)
+
+        for relative, (source_hash, ok, message) in zip(pending, results):
+            _, size, mtime = files[relative]
+            if ok is None:
+                manifest[relative]["mtime_ns"] = mtime
+                dirty = True
+                counts["skipped"] += 1
+                continue
+            old_output = manifest.get(relative, {}).get("output")
+            output = message if ok else None
+            if old_output and old_output != output:
+                pathlib_path(old_output).unlink(missing_ok=True)
+            # Başarısız dosyalar da kaydedilir; dosya değişene kadar
+            # tekrar denenmez.
+            manifest[relative] = {
+                "size": size,
+                "mtime_ns": mtime,
+                "hash": source_hash,
+                "params": self._params,
+                "output": output,
+            }
+            dirty = True
+            if ok:
+                counts["processed"] += 1
+                print(f"(+) {relative} -> {message}")
+            else:
+                counts["failed"] += 1
+                print(f"(!) {relative}: {message}")
 
-        Raises:
-            ValueError: Boş bir yol veya geçersiz bir değer girilmişse.
-            RuntimeError: Beklenmeyen hatalar oluşmuşsa.
+        if dirty:
+            try:
+                self._save_manifest()
+            except OSError as e:
+                print(f"(!) Manifest kaydedilemedi: {e}")
+
+        return counts
 
+
+    def watch(self, *, interval: float = 2.0, once: bool = False) -> int:
         """
-        FileValidator.validate_path(file_path)  # ValueError
+        Klasörü 'interval' saniyede bir tarar; Ctrl+C ile durdurulur.
 
+        Returns:
+            int: Çıkış kodu ('once' ile tek taramada başarısız dosya varsa
+            1).
+        """
         try:
-            with open(file_path, "wb") as file:
-                file.write(data)
-        except Exception as e:
-            raise RuntimeError(
-                f"Dosya yazma sırasında beklenmedik bir hata oluştu: {e}"
-            )
-        
-    
-    @staticmethod
-    def add_grid(
-        data: bytearray,
+            while True:
+                start = time_perf_counter()
+                counts = self.scan()
+                if once or any(
+                    counts[name] for name in ("processed", "failed", "removed")
+                ):
+                    print(
+                        f"{counts['processed']} işlendi, "
+                        f"{counts['failed']} başarısız, "
+                        f"{counts['removed']} silindi, "
+                        f"{counts['skipped']} değişmedi "
+                        f"({time_perf_counter() - start:.3f} sn)."
+                    )
+                if once:
+                    return 1 if counts["failed"] else 0
+                time_sleep(interval)
+        except KeyboardInterrupt:
+            print("\n(+) İzleme durduruldu.")
+            return 0
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+
+class ResizeDaemon:
+    """
+    Uzun süre çalışan yerel bir işlem sunucusu (daemon) sağlar. Her
+    çağrıda yorumlayıcıyı başlatma ve (paketlenmiş sürümde) arşivi açma
+    maliyeti bir kez ödenir; derleme araçları binlerce küçük isteği
+    milisaniyeler içinde gönderebilir.
+
+    Sunucu 'asyncio' ile bir Unix soketinde veya yerel bir TCP portunda
+    dinler. Her satır bir JSON isteğidir; cevaplar da tek satırlık JSON
+    olarak, tamamlanma sırasıyla döner ('id' alanı eşleştirme için geri
+    gönderilir). Aynı port, tek bir isteği gövdesinde taşıyan HTTP 'POST'
+    isteklerini de kabul eder. İstekler, önceden başlatılmış işçi
+    süreçlerinden oluşan bir havuzda 'BatchProcessor.process_file' ile
+    işlenir.
+
+    İstek örnekleri:
+        {"id": 1, "command": "pipeline", "source": "images/a.bmp",
+         "spec": "crop:0,0,64,64|grid:8,red"}
+        {"command": "grid", "source": "images/a.bmp", "size": 16,
+         "output": "out/a.bmp"}
+        {"command": "ping"}
+        {"command": "shutdown"}
+
+    Cevap örneği:
+        {"id": 1, "ok": true, "output": "edited_images/a.bmp",
+         "pixels": 4096, "seconds": 0.0031, "queue_seconds": 0.0002}
+
+    Methods:
+        _parse_request (tuple): Bir isteği doğrulayıp işleme
+        parametrelerine dönüştüren, özel metot.
+        _handle_request (dict): Tek bir isteği işleyip cevabı döndüren,
+        özel metot.
+        _handle_http (None): HTTP isteğini işleyen, özel metot.
+        _handle_client (None): Bir bağlantıdaki istekleri işleyen, özel
+        metot.
+        serve (None): Sunucuyu başlatıp kapatılana kadar çalıştırır.
+        run (int): Sunucuyu çalıştırır; Ctrl+C ile kapatılır.
+        send (dict): Çalışan bir sunucuya tek bir istek gönderir.
+    """
+    # Her işlemin zorunlu ve isteğe bağlı (varsayılan değerli) alanları.
+    COMMANDS = {
+        "grid": (("size",), {"color": "white"}),
+        "crop": (("width", "height"), {"x": "0", "y": "0"}),
+        "scale": (("width", "height"), {"method": "nearest"}),
+        "rotate": (("angle",), {}),
+        "flip": (("axis",), {}),
+        "pyramid": ((), {"levels": None}),
+        "slice": (
+            (),
+            {
+                "size": None,
+                "grid": None,
+                "skip_empty": False,
+                "skip_duplicates": False
+            }
+        ),
+        "pipeline": (("spec",), {}),
+    }
+
+    __slots__ = (
+        "workers", "output_dir", "cache", "cache_max_bytes", "rle",
+        "output_format", "level", "_executor", "_stopped"
+    )
+
+
+    def __init__(
+        self,
         *,
-        grid_size: str,
-        grid_color: str = "white"
-    ) -> bytearray:
+        workers: int = None,
+        output_dir: pathlib_path = None,
+        cache: str = None,
+        cache_max_bytes: int = ResultCache.DEFAULT_MAX_BYTES,
+        rle: bool = False,
+        output_format: str = "bmp",
+        level: int = PngWriter.DEFAULT_LEVEL
+    ) -> None:
+        self.workers = workers or os_cpu_count() or 1
+        # İstemciler farklı dizinlerde çalışabileceğinden cevaplardaki
+        # yollar mutlaktır.
+        self.output_dir = pathlib_path(
+            output_dir
+            or FilePathManager.get_py_or_exe_dir() / "edited_images"
+        ).resolve()
+        self.cache = cache
+        self.cache_max_bytes = cache_max_bytes
+        self.rle = rle
+        self.output_format = output_format
+        self.level = level
+        self._executor = None
+        self._stopped = None
+
+
+    def _parse_request(self, request: dict) -> tuple[str, dict, str, str]:
         """
-        Resme ızgara ekler.
+        Bir isteği doğrulayıp 'BatchProcessor.process_file' parametrelerine
+        dönüştüren, özel metot.
 
-        Args:
-            data (bytearray): Grid eklenecek içerik.
-            width (int): Resmin genişliği (piksel cinsinden).
-            height (int): Resmin yüksekliği (piksel cinsinden).
-            grid_size (int): Grid karelerinin boyutu (piksel cinsinden).
-            grid_color (str): Grid piksellerinin rengi.
+        Returns:
+            tuple[str, dict, str, str]: (işlem, parametreler, kaynak, çıktı)
 
         Raises:
-            ValueError: Tanımlanmamış bir renk girilmişse.
-            TypeError: Sayısal bir metin değeri girilmemişse.
-            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
+            ValueError: İstek bir JSON nesnesi değilse, işlem tanımlı
+            değilse veya zorunlu bir alan eksikse.
         """
-        # (!) Eğer veriyi doğru şekilde okuyamıyorsanız, 3.0'dan sonraki
-        # BMP sürümlerinde başlık yapıları farklılık gösterebilir.
-        # byteorder = little-endian
-        start_px_data = int.from_bytes(data[10:14], byteorder="little")
-        pixel_data = data[start_px_data:]
+        if not isinstance(request, dict):
+            raise ValueError("İstek bir JSON nesnesi olmalıdır.")
 
-        width = int.from_bytes(data[18:22], byteorder="little") 
-        height = int.from_bytes(data[22:26], byteorder="little")
+        command = request.get("command", "pipeline")
+        if command not in ResizeDaemon.COMMANDS:
+            raise ValueError(f"Desteklenmeyen bir işlem: {command}")
+        required, defaults = ResizeDaemon.COMMANDS[command]
 
-        bit_depth = int.from_bytes(data[28:30], byteorder="little")
-        bytes_per_pixel = ImageResizer._split_bytes(bit_depth)  # ValueError
+        missing = [
+            name for name in ("source",) + required if name not in request
+        ]
+        if missing:
+            raise ValueError(f"Eksik alan: {', '.join(missing)}")
+
+        options = {name: request[name] for name in required}
+        for name, default in defaults.items():
+            options[name] = request.get(name, default)
+        if command == "grid":
+            options["color"] = str(options["color"]).lower()
+        options["cache"] = self.cache
+        options["cache_max_bytes"] = self.cache_max_bytes
+        options["rle"] = bool(request.get("rle", self.rle))
+        options["level"] = request.get("level", self.level)
+
+        output_format = request.get("format", self.output_format)
+        if output_format not in ("bmp", "png"):
+            raise ValueError(
+                f"Desteklenmeyen bir çıktı biçimi: {output_format}"
+            )
 
-        grid_size = ImageResizer._convert_to_int(grid_size)  # TypeError
-        pixel_color = ImageResizer._convert_color_to_byte(
-            grid_color  # ValueError
+        source = str(request["source"])
+        output = request.get("output")
+        if not output:
+            output = self.output_dir / pathlib_path(source).name
+            if output_format == "png":
+                output = output.with_suffix(".png")
+
+        return command, options, source, str(output)
+
+
+    async def _handle_request(self, request: dict) -> dict:
+        """
+        Tek bir isteği işçi havuzunda işleyip cevabı döndüren, özel metot.
+        Hatalar cevap olarak döndürülür; bağlantı açık kalır.
+
+        Returns:
+            dict: JSON olarak gönderilecek cevap.
+        """
+        start = time_perf_counter()
+        reply = {}
+        if isinstance(request, dict) and "id" in request:
+            reply["id"] = request["id"]
+
+        command = request.get("command") if isinstance(request, dict) else None
+        if command == "ping":
+            reply.update(ok=True, backend=ImageResizer.backend.name)
+            return reply
+        if command == "shutdown":
+            self._stopped.set()
+            reply["ok"] = True
+            return reply
+
+        try:
+            command, options, source, output = self._parse_request(request)
+            pathlib_path(output).parent.mkdir(parents=True, exist_ok=True)
+            _, ok, message, pixels, seconds = (
+                await asyncio_get_running_loop().run_in_executor(
+                    self._executor,
+                    BatchProcessor.process_file,
+                    command,
+                    options,
+                    source,
+                    output
+                )
+            )
+        except Exception as e:
+            reply.update(ok=False, error=str(e))
+            return reply
+
+        reply["ok"] = ok
+        if ok:
+            reply.update(output=message, pixels=pixels)
+        else:
+            reply["error"] = message
+        reply["seconds"] = round(seconds, 6)
+        reply["queue_seconds"] = round(
+            max(0.0, time_perf_counter() - start - seconds), 6
         )
 
-        for y in range(height):  # Satır sırası
-            for x in range(width):  # Sütun sırası
-                start_px_bytes = (y * width + x) * bytes_per_pixel
+        return reply
 
-                # Eğer piksel grid çizgisi üzerindeyse, renk değiştir.
-                if x % grid_size == 0 or y % grid_size == 0:
-                    pixel_data[
-                        start_px_bytes:start_px_bytes + 3  # İlk 3 bayt (BGR)
-                    ] = pixel_color
 
-        # Pixel verisini güncelle.
-        data[start_px_data:] = pixel_data
+    async def _handle_http(self, first_line: bytes, reader, writer) -> None:
+        """
+        Gövdesinde tek bir JSON isteği taşıyan HTTP 'POST' isteğini (veya
+        'GET /ping') işleyen, özel metot. Bağlantı cevaptan sonra kapatılır.
+        """
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value.strip() or 0)
 
-        return data
+        if first_line.startswith(b"GET"):
+            request = {"command": "ping"}
+        else:
+            try:
+                request = json_loads(await reader.readexactly(length))
+            except ValueError as e:
+                request = None
+                reply = {"ok": False, "error": f"Geçersiz JSON: {e}"}
+        if request is not None:
+            reply = await self._handle_request(request)
+
+        body = json_dumps(reply, ensure_ascii=False).encode("utf-8")
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Content-Length: " + str(len(body)).encode("ascii") + b"\r\n"
+            b"Connection: close\r\n\r\n" + body
+        )
+        await writer.drain()
 
-   
-    @staticmethod
-    def resize_image(
-        data: bytearray,
+
+    async def _handle_client(self, reader, writer) -> None:
+        """
+        Bir bağlantıdaki satır satır JSON isteklerini eşzamanlı olarak
+        işleyen, özel metot. Cevaplar tamamlanma sırasıyla yazılır.
+        """
+        pending = set()
+
+        async def answer(line: bytes) -> None:
+            try:
+                reply = await self._handle_request(json_loads(line))
+            except ValueError as e:
+                reply = {"ok": False, "error": f"Geçersiz JSON: {e}"}
+            writer.write(
+                json_dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n"
+            )
+            await writer.drain()
+
+        try:
+            first_line = await reader.readline()
+            if first_line.startswith((b"POST ", b"GET ")):
+                await self._handle_http(first_line, reader, writer)
+                return
+
+            line = first_line
+            while line:
+                if line.strip():
+                    task = asyncio_create_task(answer(line))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                line = await reader.readline()
+            if pending:
+                await asyncio_gather(*pending)
+        except (ConnectionError, asyncio_IncompleteReadError, ValueError):
+            # Kopan bağlantı veya bozuk HTTP başlığı; sunucu çalışmaya
+            # devam eder.
+            pass
+        finally:
+            writer.close()
+
+
+    async def serve(
+        self,
         *,
-        new_width: str,
-        new_height: str,
-        startx: str,
-        starty: str,
-    ) -> bytearray:
+        socket_path: str = None,
+        host: str = "127.0.0.1",
+        port: int = None
+    ) -> None:
         """
-        Resmi yeniden boyutlandırır.
+        Sunucuyu başlatıp 'shutdown' isteği gelene kadar çalıştırır.
 
         Args:
-            data (bytearray): Yeniden boyutlandırılacak içerik.
-            new_width (str): İstenilen genişlik.
-            new_height (str): İstenilen yükseklik.
-            startx (str): Yatay eksende sol alt köşeye olan uzaklık.
-            starty (str): Dikey eksende sol alt köşeye olan uzaklık.
+            socket_path (str): Unix soketinin yolu. Verilirse 'host' ve
+            'port' kullanılmaz.
+            host (str): Dinlenecek adres (varsayılan=127.0.0.1).
+            port (int): Dinlenecek port.
 
         Raises:
-            ValueError: Desteklenmeyen bir bit derinliği girilmişse.
-            TypeError: 'new_with' için sayısal bir metin değeri girilmemişse.
-            ValueError: '4 <= new_width <= width' değilse.
-            TypeError: 'new_heigth' için sayısal bir metin değeri
-            girilmemişse.
-            ValueError: '4 <= new_height <= height' değilse.
-            TypeError: 'startx' için sayısal bir metin değeri girilmemişse.
-            ValueError: 'startx' negatif bir değerse.
-            ValueError: 'Başlangıç x + Genişlik' orjinal sınırlar dışındaysa.
-            TypeError: 'starty' için sayısal bir metin değeri girilmemişse.
-            ValueError: 'starty' negatif bir değerse.
-            ValueError: 'Başlangıç y + Yükseklik' orjinal sınırlar dışındaysa.
-            ValueError: Mevcut bayt sayısı ve beklenen sayıya eşit değilse.
+            ValueError: Soket yolu veya port verilmemişse.
+            ValueError: Unix soketi bu sistemde desteklenmiyorsa.
+            OSError: Soket veya port açılamıyorsa.
         """
-        # (!) Eğer veriyi doğru şekilde okuyamıyorsanız, 3.0'dan sonraki
-        # BMP sürümlerinde başlık yapıları farklılık gösterebilir.
-        # byteorder = little-endian
-        start_px_data = int.from_bytes(data[10:14], byteorder="little")
-        pixel_data = data[start_px_data:]
+        if socket_path is None and port is None:
+            raise ValueError("Bir Unix soketi yolu veya port verilmelidir.")
+        if socket_path is not None and asyncio_start_unix_server is None:
+            raise ValueError("Bu sistemde Unix soketi desteklenmiyor.")
+
+        self._stopped = asyncio_Event()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._executor = futures_ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            # İşçi süreçler ilk istekten önce başlatılır.
+            loop = asyncio_get_running_loop()
+            await asyncio_gather(*(
+                loop.run_in_executor(self._executor, os_getpid)
+                for _ in range(self.workers)
+            ))
+
+            if socket_path is not None:
+                pathlib_path(socket_path).unlink(missing_ok=True)
+                server = await asyncio_start_unix_server(
+                    self._handle_client, path=socket_path
+                )
+                address = socket_path
+            else:
+                server = await asyncio_start_server(
+                    self._handle_client, host=host, port=port
+                )
+                address = f"{host}:{port}"
 
-        width = int.from_bytes(data[18:22], byteorder="little")
-        height = int.from_bytes(data[22:26], byteorder="little")
+            print(
+                f"(+) Sunucu {address} adresinde dinliyor "
+                f"({self.workers} işçi).",
+                flush=True
+            )
+            async with server:
+                await self._stopped.wait()
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            if socket_path is not None:
+                pathlib_path(socket_path).unlink(missing_ok=True)
 
-        bit_depth = int.from_bytes(data[28:30], byteorder="little")
-        bytes_per_pixel = ImageResizer._split_bytes(bit_depth)  # ValueError
 
-        new_width = ImageResizer._convert_to_int(new_width)  # TypeError
-        if new_width < 4 or new_width > width:
-            raise ValueError(
-                f"'{new_width}' değeri '4 <= Yeni Genişlik <= {width}' "
-                "eşitliğini sağlamalıdır."
-            )
-        new_height = ImageResizer._convert_to_int(new_height)  # TypeError
-        if new_height < 4 or new_height > height:
-            raise ValueError(
-                f"'{new_height}' değeri '4 <= Yeni Yükseklik <= {height}' "
-                "eşitliğini sağlamalıdır."
-            )
+    def run(self, **address) -> int:
+        """
+        Sunucuyu çalıştırır; 'shutdown' isteği veya Ctrl+C ile kapatılır.
 
-        startx = ImageResizer._convert_to_int(startx)  # TypeError
-        if startx < 0:
-            raise ValueError("Başlangıç x pozitif bir tamsayı olmalı.")
-        elif startx + new_width > width:
-            # Kontrol sırarası ihtimali yüksek -> ihtimali düşük.
-            raise ValueError(
-                f"'Başlangıç x + Genişlik ({startx + new_width})' "
-                "orjinal sınırlar dışında kalıyor."
-            )
-        starty = ImageResizer._convert_to_int(starty)  # TypeError
-        if starty < 0:
-            raise ValueError("Başlangıç y pozitif bir tamsayı olmalı.")
-        elif starty + new_height > height:
-            raise ValueError(
-                f"'Başlangıç y + Yükseklik ({starty + new_height })' "
-                "orjinal sınırlar dışında kalıyor."
-            )
+        Returns:
+            int: Çıkış kodu.
+        """
+        try:
+            asyncio_run(self.serve(**address))
+        except KeyboardInterrupt:
+            pass
+        except (ValueError, OSError) as e:
+            print(f"(!) Sunucu başlatılamadı: {e}")
+            return 2
 
-        new_data = bytearray()
+        print("\n(+) Sunucu kapatıldı.")
+        return 0
 
-        # sıra (1, 2, ...) = n, index (0, 1, ...) = n-1 (width, height)
-        for y in range(height):  # Satır sırası
-            if y < starty:
-                continue
-            elif y >= starty + new_height:
-                continue
 
-            for x in range(width):  # Sütun sırası
-                if x < startx:
-                    continue
-                elif x >= startx + new_width:
-                    continue
-                    
-                #row_size = ((width * bytes_per_pixel + 3) // 4) * 4
-                start_px_bytes = (y * width + x) * bytes_per_pixel
+    @staticmethod
+    def send(
+        request: dict,
+        *,
+        socket_path: str = None,
+        host: str = "127.0.0.1",
+        port: int = None
+    ) -> dict:
+        """
+        Çalışan bir sunucuya tek bir istek gönderip cevabı bekler.
 
-                new_data.extend(
-                    pixel_data[
-                        start_px_bytes:start_px_bytes + bytes_per_pixel
-                    ]
-                )
+        Returns:
+            dict: Sunucunun cevabı.
 
-        # Bayt sayılarını kontrol et.
-        ImageResizer._validate_byte_len(
-            byte_len=len(new_data),
-            excepted_len=new_width * new_height * bytes_per_pixel
-        )  # ValueError
-        
-        # Genişlik ve yükseklik bilgisini güncelle.
-        # new_width (int).to_bytes()
-        data[18:22] = new_width.to_bytes(length=4, byteorder="little")
-        data[22:26] = new_height.to_bytes(length=4, byteorder="little")
-        
-        # Pixel verisini güncelle.
-        data[start_px_data:] = new_data
+        Raises:
+            OSError: Sunucuya bağlanılamıyorsa.
+        """
+        if socket_path is not None:
+            connection = socket_socket(socket_AF_UNIX, socket_SOCK_STREAM)
+            connection.connect(socket_path)
+        else:
+            connection = socket_create_connection((host, port))
 
-        return data
+        with connection, connection.makefile("rwb") as stream:
+            stream.write(json_dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            return json_loads(stream.readline())
 
 
 
@@ -854,6 +10031,85 @@ if __name__ == "__main__":
         print("\n(+) Yeniden boyutlandırma işlemi başarıyla tamamlandı.")
 
 
+    def image_scaling() -> None:
+        """
+        Seçilen görselin çözünürlüğünü değiştirmek ve yeni bir dosya olarak
+        kaydetmek için gereken süreci işler.
+        """
+        # Kayıt dosyasının yolunu al.
+        log_f_path = getting_log_f_path()
+
+        # 'imagepath.txt' dosyasından görselin bulunduğu yol bilgisini oku.
+        try:
+            file_path = FilePathManager.read_f_path(log_f_path)
+        except (
+            ValueError, FileNotFoundError, PermissionError, RuntimeError
+        ) as e:
+            print(f"\n(!) Kayıtlı yol bilgisini okuma işlemi başarısız: {e}")
+            return 
+        # Okunan yol bilgisini (string), pathlib.Path'e çevir 
+        # read_image(): validate_path() metotlarının hata vermemesi için.
+        file_path = pathlib_path(file_path)
+
+       # Görsel dosyasını oku.
+        try:
+            image_data = ImageResizer.read_image(file_path)
+        except (
+            ValueError, FileNotFoundError, PermissionError, RuntimeError
+        ) as e:
+            print(f"\n(!) Görsel dosyası okuma işlemi başarısız: {e}")
+            return
+        
+        # Yeni görselin kaydedileceği ismi al.
+        output_f_name = get_input("İşlenmiş dosyanın kaydedileceği isim")
+        # Alınan ismi bir yola dönüştür.
+        try:
+            output_file = FilePathManager.convert_f_name_to_path(
+                output_f_name, target_folder="edited_images"
+            )
+        except ValueError as e:
+            print(f"(!) Yeni görselin kaydedileceği yol oluşturulamadı: {e}")
+            return
+        
+        new_width = get_input("İstenilen genişlik (piksel)")
+        new_height = get_input("İstenilen yükseklik (piksel)")
+
+        # Ölçekleme filtresini al.
+        print("(nearest, bilinear, box)")
+        method = get_input(
+            "Ölçekleme filtresi seçin (varsayılan=nearest)"
+        ).strip().lower()
+        # Alınan filtre boş string veya boşluksa varsayılan olarak
+        # 'nearest' al.
+        if not method:
+            method = "nearest"
+
+        # İşleme devam edilsin mi?
+        continue_processing()
+
+        # Yeniden örnekle.
+        try:
+            scaled_image = ImageResizer.scale_image(
+                data=image_data,
+                new_width=new_width,
+                new_height=new_height,
+                method=method
+            )
+        except (ValueError, TypeError) as e:
+            print(f"\n(!) Ölçekleme işlemi başarısız: {e}")
+            return
+        
+        # Yeni resmi kaydet.
+        try:
+            ImageResizer.save_image(output_file, data=scaled_image)
+        except (ValueError, RuntimeError) as e:
+            print(f"\n(!) İşlenmiş dosyayı yazma işlemi başarısız: {e}")
+            return
+
+        # İşlemin başarılı olduğunu  bildir.
+        print("\n(+) Ölçekleme işlemi başarıyla tamamlandı.")
+
+
     ## MENU FUNCTIONS
     
     def continue_processing() -> None:
@@ -885,6 +10141,7 @@ if __name__ == "__main__":
             "(1): Select File",
             "(2): Image Gridding",
             "(3): Image Resizing",
+            "(4): Image Scaling",
             "(exit): Exit",
             "\n(!) Lütfen işlemek için bir dosya şeçmediyseniz veya son "
             "seçilen dosyadan devam etmek istemiyorsanız (0) anahtarını "
@@ -932,6 +10189,13 @@ if __name__ == "__main__":
 
                 image_resizing()
 
+                time_sleep(0.3)
+                continue
+            elif key == "4":
+                print(f"{"-"*100}\n>>> IMAGE SCALING >>>\n")
+
+                image_scaling()
+
                 time_sleep(0.3)
                 continue
             else:
@@ -944,6 +10208,13 @@ if __name__ == "__main__":
                 continue
 
 
+    # PyInstaller ile paketlenmiş (frozen) uygulamada işçi süreçler için.
+    multiprocessing_freeze_support()
+
+    # Argüman verilmişse menü yerine toplu işlem (batch) modunu başlat.
+    if len(sys.argv) > 1:
+        sys.exit(BatchProcessor.main(sys.argv[1:]))
+
     main_menu()  # Program akışını başlat.
 
 